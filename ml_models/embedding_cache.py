@@ -0,0 +1,133 @@
+"""Persistent content-hash cache for job embeddings.
+
+Vectors are stored in a small SQLite file keyed on the model name and a
+SHA-256 of the encoded text, so a posting that has been embedded once is never
+sent through the model again.
+"""
+
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+DEFAULT_CACHE_PATH = "data/embedding_cache.sqlite"
+
+
+def content_hash(text: str) -> str:
+    """Return the cache key for ``text``."""
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """SQLite-backed ``hash -> float32 vector`` store for a single model."""
+
+    def __init__(self, model_name: str, path: str = DEFAULT_CACHE_PATH):
+        self.model_name = model_name
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            " model TEXT NOT NULL,"
+            " hash TEXT NOT NULL,"
+            " dim INTEGER NOT NULL,"
+            " vector BLOB NOT NULL,"
+            " PRIMARY KEY (model, hash))"
+        )
+        self._conn.commit()
+
+    def get_many(self, hashes: Iterable[str]) -> Dict[str, np.ndarray]:
+        """Return cached vectors for whichever of ``hashes`` are present."""
+        hashes = list(dict.fromkeys(hashes))
+        found: Dict[str, np.ndarray] = {}
+        with self._lock:
+            # Stay well below SQLite's bound-parameter limit.
+            for start in range(0, len(hashes), 500):
+                chunk = hashes[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT hash, vector FROM embeddings "
+                    f"WHERE model = ? AND hash IN ({placeholders})",
+                    [self.model_name, *chunk],
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32)
+        return found
+
+    def put_many(self, items: Dict[str, np.ndarray]) -> None:
+        """Store ``hash -> vector`` pairs in one transaction."""
+        if not items:
+            return
+        rows = [
+            (self.model_name, key, int(vec.shape[-1]),
+             np.asarray(vec, dtype=np.float32).tobytes())
+            for key, vec in items.items()
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, hash, dim, vector) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute(
+                "SELECT COUNT(*) FROM embeddings WHERE model = ?", (self.model_name,)
+            ).fetchone()
+        return count
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalise each row so cosine similarity becomes a dot product."""
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def encode_cached(
+    encode_fn,
+    texts: List[str],
+    cache: Optional[EmbeddingCache] = None,
+    batch_size: int = 64,
+) -> np.ndarray:
+    """Encode ``texts`` into one normalised ``(len(texts), dim)`` matrix.
+
+    ``encode_fn`` receives a list of strings and must return a 2-D array.
+    Duplicate texts and texts already in ``cache`` are encoded only once;
+    newly computed vectors are written back to the cache.
+    """
+    if not texts:
+        return np.zeros((0, 0), dtype=np.float32)
+
+    keys = [content_hash(text) for text in texts]
+    vectors: Dict[str, np.ndarray] = cache.get_many(keys) if cache else {}
+
+    pending: Dict[str, str] = {}
+    for key, text in zip(keys, texts):
+        if key not in vectors and key not in pending:
+            pending[key] = text
+
+    fresh: Dict[str, np.ndarray] = {}
+    pending_keys = list(pending)
+    for start in range(0, len(pending_keys), batch_size):
+        batch_keys = pending_keys[start:start + batch_size]
+        encoded = normalize_rows(encode_fn([pending[k] for k in batch_keys]))
+        fresh.update(zip(batch_keys, encoded))
+
+    if cache is not None:
+        cache.put_many(fresh)
+    vectors.update(fresh)
+
+    return normalize_rows(np.stack([vectors[key] for key in keys]))
@@ -0,0 +1,309 @@
+"""Persistent approximate nearest-neighbour index over job embeddings.
+
+The index is an IVF-flat structure built on NumPy: vectors are clustered with
+spherical k-means and a query only scans the ``n_probe`` closest clusters, so
+resume-to-top-K retrieval no longer touches the whole corpus.  Small indexes
+(below ``min_train_size``) are searched exactly.  Jobs can be added, updated
+and removed incrementally as scrapers produce postings.
+
+When NumPy is unavailable the index falls back to an exact pure-Python scan
+with the same API.
+"""
+
+import json
+import math
+import heapq
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+DEFAULT_INDEX_PATH = "data/job_index"
+
+
+class JobVectorIndex:
+    """IVF-flat cosine-similarity index keyed by job id."""
+
+    def __init__(self, n_lists: Optional[int] = None, n_probe: int = 8,
+                 min_train_size: int = 2048, retrain_growth: float = 2.0):
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.min_train_size = min_train_size
+        self.retrain_growth = retrain_growth
+
+        self.dim: Optional[int] = None
+        self._ids: List[Optional[str]] = []      # row -> job id (None = deleted)
+        self._rows: Dict[str, int] = {}          # job id -> row
+        self._vectors = None                     # (capacity, dim) float32
+        self._centroids = None                   # (n_lists, dim) float32
+        self._assign = None                      # row -> list number
+        self._lists: Dict[int, set] = {}
+        self._trained_size = 0
+
+    # ------------------------------------------------------------------ basics
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self._rows
+
+    @property
+    def is_trained(self) -> bool:
+        return self._centroids is not None
+
+    # --------------------------------------------------------------- mutation
+    def add(self, ids: Sequence[str], vectors) -> None:
+        """Insert or replace the vectors for ``ids``."""
+        if not len(ids):
+            return
+        if np is None:
+            self._add_python(ids, vectors)
+            return
+
+        vectors = _normalize(np.asarray(vectors, dtype=np.float32))
+        if self.dim is None:
+            self.dim = vectors.shape[1]
+            self._vectors = np.zeros((0, self.dim), dtype=np.float32)
+            self._assign = np.zeros(0, dtype=np.int32)
+
+        for job_id, vec in zip(ids, vectors):
+            row = self._rows.get(job_id)
+            if row is None:
+                row = len(self._ids)
+                self._ids.append(job_id)
+                self._rows[job_id] = row
+                self._ensure_capacity(row + 1)
+            elif self.is_trained:
+                self._lists[int(self._assign[row])].discard(row)
+            self._vectors[row] = vec
+            if self.is_trained:
+                self._assign_rows([row])
+
+        if self._needs_training():
+            self.train()
+
+    def remove(self, ids: Iterable[str]) -> int:
+        """Remove ``ids`` from the index; returns how many were present."""
+        removed = 0
+        for job_id in ids:
+            row = self._rows.pop(job_id, None)
+            if row is None:
+                continue
+            if np is None:
+                self._vectors.pop(job_id, None)
+                removed += 1
+                continue
+            self._ids[row] = None
+            if self.is_trained:
+                self._lists[int(self._assign[row])].discard(row)
+            removed += 1
+        # Reclaim space once a quarter of the rows are tombstones
+        if np is not None and len(self._ids) > 64 and len(self._rows) < 0.75 * len(self._ids):
+            self._compact()
+        return removed
+
+    def train(self, iterations: int = 10, seed: int = 0) -> None:
+        """(Re)cluster the live vectors with spherical k-means."""
+        if np is None or not self._rows:
+            return
+        rows = np.fromiter(self._rows.values(), dtype=np.int64)
+        data = self._vectors[rows]
+        n_lists = self.n_lists or max(1, int(math.sqrt(len(rows))))
+        n_lists = min(n_lists, len(rows))
+
+        rng = np.random.default_rng(seed)
+        sample = data[rng.choice(len(data), size=min(len(data), n_lists * 64), replace=False)]
+        centroids = sample[rng.choice(len(sample), size=n_lists, replace=False)].copy()
+        for _ in range(iterations):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            for c in range(n_lists):
+                members = sample[labels == c]
+                if len(members):
+                    centroids[c] = members.sum(axis=0)
+            centroids = _normalize(centroids)
+
+        self._centroids = centroids
+        self._lists = {c: set() for c in range(n_lists)}
+        self._assign_rows(rows)
+        self._trained_size = len(rows)
+
+    # ----------------------------------------------------------------- search
+    def search(self, query, k: int = 10, n_probe: Optional[int] = None,
+               allowed: Optional[set] = None) -> List[Tuple[str, float]]:
+        """Return up to ``k`` ``(job_id, cosine)`` pairs, best first.
+
+        ``allowed`` restricts results to a subset of job ids (e.g. the jobs
+        passed to a single matching call).  When the probed clusters hold
+        fewer than ``k`` eligible jobs, the probe is widened (up to an exact
+        scan), so the result is only short if fewer than ``k`` jobs qualify.
+        """
+        if not self._rows or k <= 0:
+            return []
+        if np is None:
+            return self._search_python(query, k, allowed)
+
+        query = _normalize(np.asarray(query, dtype=np.float32).reshape(1, -1))[0]
+        if self.is_trained:
+            n_lists = len(self._centroids)
+            probe = min(n_probe or self.n_probe, n_lists)
+            order = np.argsort(-(self._centroids @ query))
+            while True:
+                rows = np.asarray([r for c in order[:probe] for r in self._lists[int(c)]], dtype=np.int64)
+                rows = self._filter_rows(rows, allowed)
+                if len(rows) >= k or probe >= n_lists:
+                    break
+                probe = min(probe * 2, n_lists)
+        else:
+            rows = self._filter_rows(np.fromiter(self._rows.values(), dtype=np.int64), allowed)
+
+        if not len(rows):
+            return []
+
+        scores = self._vectors[rows] @ query
+        top = min(k, len(rows))
+        best = np.argpartition(-scores, top - 1)[:top]
+        best = best[np.argsort(-scores[best])]
+        return [(self._ids[rows[i]], float(scores[i])) for i in best]
+
+    # ------------------------------------------------------------ persistence
+    def save(self, path: str = DEFAULT_INDEX_PATH) -> None:
+        """Write the index to ``<path>.npz`` plus a JSON sidecar of settings."""
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        meta = {
+            "n_lists": self.n_lists,
+            "n_probe": self.n_probe,
+            "min_train_size": self.min_train_size,
+            "retrain_growth": self.retrain_growth,
+        }
+        if np is None:
+            meta["python_vectors"] = {job_id: vec for job_id, vec in self._python_items()}
+            target.with_suffix(".json").write_text(json.dumps(meta), encoding="utf-8")
+            return
+
+        self._compact()
+        live = len(self._ids)
+        arrays = {
+            "ids": np.asarray(self._ids, dtype=str),
+            "vectors": self._vectors[:live] if self._vectors is not None else np.zeros((0, 0), np.float32),
+        }
+        if self.is_trained:
+            arrays["centroids"] = self._centroids
+            arrays["assign"] = self._assign[:live]
+        np.savez(target.with_suffix(".npz"), **arrays)
+        target.with_suffix(".json").write_text(json.dumps(meta), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_INDEX_PATH) -> "JobVectorIndex":
+        """Load an index written by :meth:`save`; returns an empty one if missing."""
+        target = Path(path)
+        meta_path = target.with_suffix(".json")
+        if not meta_path.exists():
+            return cls()
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        python_vectors = meta.pop("python_vectors", None)
+        index = cls(**meta)
+
+        if np is None:
+            if python_vectors:
+                index._add_python(list(python_vectors), list(python_vectors.values()))
+            return index
+
+        data_path = target.with_suffix(".npz")
+        if not data_path.exists():
+            return index
+        with np.load(data_path) as data:
+            ids = [str(i) for i in data["ids"]]
+            if not ids:
+                return index
+            index.dim = data["vectors"].shape[1]
+            index._vectors = data["vectors"].astype(np.float32)
+            index._ids = ids
+            index._rows = {job_id: row for row, job_id in enumerate(ids)}
+            if "centroids" in data:
+                index._centroids = data["centroids"].astype(np.float32)
+                index._assign = data["assign"].astype(np.int32)
+                index._lists = {c: set() for c in range(len(index._centroids))}
+                for row, c in enumerate(index._assign):
+                    index._lists[int(c)].add(row)
+                index._trained_size = len(ids)
+            else:
+                index._assign = np.zeros(len(ids), dtype=np.int32)
+        return index
+
+    # --------------------------------------------------------------- internals
+    def _filter_rows(self, rows, allowed: Optional[set]):
+        if allowed is None or not len(rows):
+            return rows
+        return rows[[self._ids[r] in allowed for r in rows]]
+
+    def _needs_training(self) -> bool:
+        size = len(self._rows)
+        if size < self.min_train_size:
+            return False
+        return not self.is_trained or size >= self._trained_size * self.retrain_growth
+
+    def _ensure_capacity(self, size: int) -> None:
+        capacity = len(self._vectors)
+        if size <= capacity:
+            return
+        new_capacity = max(size, capacity * 2, 256)
+        vectors = np.zeros((new_capacity, self.dim), dtype=np.float32)
+        vectors[:capacity] = self._vectors
+        assign = np.zeros(new_capacity, dtype=np.int32)
+        assign[:capacity] = self._assign
+        self._vectors, self._assign = vectors, assign
+
+    def _assign_rows(self, rows) -> None:
+        rows = np.asarray(rows, dtype=np.int64)
+        labels = np.argmax(self._vectors[rows] @ self._centroids.T, axis=1)
+        self._assign[rows] = labels
+        for row, label in zip(rows, labels):
+            self._lists[int(label)].add(int(row))
+
+    def _compact(self) -> None:
+        if self._vectors is None or len(self._rows) == len(self._ids):
+            return
+        live = [row for row, job_id in enumerate(self._ids) if job_id is not None]
+        self._vectors = self._vectors[live].copy()
+        self._assign = self._assign[live].copy()
+        self._ids = [self._ids[row] for row in live]
+        self._rows = {job_id: row for row, job_id in enumerate(self._ids)}
+        if self.is_trained:
+            self._lists = {c: set() for c in range(len(self._centroids))}
+            for row, c in enumerate(self._assign):
+                self._lists[int(c)].add(row)
+
+    # Pure-Python fallback: exact scan over normalised lists
+    def _add_python(self, ids, vectors) -> None:
+        if self._vectors is None:
+            self._vectors = {}
+        for job_id, vec in zip(ids, vectors):
+            vec = [float(x) for x in vec]
+            norm = math.sqrt(sum(x * x for x in vec)) or 1.0
+            self._vectors[job_id] = [x / norm for x in vec]
+            self._rows[job_id] = 0
+            self.dim = len(vec)
+
+    def _python_items(self):
+        return [(job_id, self._vectors[job_id]) for job_id in self._rows]
+
+    def _search_python(self, query, k, allowed):
+        query = [float(x) for x in query]
+        norm = math.sqrt(sum(x * x for x in query)) or 1.0
+        query = [x / norm for x in query]
+        scored = (
+            (sum(a * b for a, b in zip(vec, query)), job_id)
+            for job_id, vec in self._python_items()
+            if allowed is None or job_id in allowed
+        )
+        return [(job_id, score) for score, job_id in heapq.nlargest(k, scored)]
+
+
+def _normalize(matrix):
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
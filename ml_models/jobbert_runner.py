@@ -1,12 +1,29 @@
-from sentence_transformers import SentenceTransformer, util
-import torch
+import numpy as np
 import yaml
 import re
 from pathlib import Path
 
-# Load the JobBERT-v3 model locally (after downloading from Hugging Face)
+from ml_models.embedding_cache import EmbeddingCache, content_hash, encode_cached
+from ml_models.job_index import JobVectorIndex
+from ml_models.model_registry import get_model, register_model, sentence_transformer_loader
+
+# JobBERT-v3 is loaded locally (after downloading from Hugging Face) on first
+# use rather than at import time.
 MODEL_PATH = "ml_models/jobbert_v3"
-model = SentenceTransformer(MODEL_PATH)
+MODEL_NAME = "jobbert-v3"
+register_model(MODEL_NAME, sentence_transformer_loader(MODEL_PATH))
+
+# Job descriptions are encoded in batches of this size; vectors are cached on
+# disk by content hash so a posting is only ever encoded once.
+BATCH_SIZE = 64
+EMBEDDING_CACHE_PATH = "data/embedding_cache.sqlite"
+_embedding_cache = None
+
+# Persistent ANN index over job embeddings; with ``candidate_k`` set, only the
+# nearest candidates are fully re-ranked instead of the whole corpus.
+JOB_INDEX_PATH = "data/job_index"
+CANDIDATE_K = 300
+_job_index = None
 
 def load_user_preferences():
     """Load user preferences from config/user_profile.yaml"""
@@ -16,8 +33,95 @@ def load_user_preferences():
             return yaml.safe_load(file)
     return {}
 
+def __getattr__(name):
+    # Backwards compatibility for ``from ml_models.jobbert_runner import model``
+    if name == "model":
+        return get_model(MODEL_NAME)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def get_embedding_cache():
+    """Return the process-wide embedding cache, opening it on first use."""
+    global _embedding_cache
+    if _embedding_cache is None:
+        _embedding_cache = EmbeddingCache(MODEL_PATH, EMBEDDING_CACHE_PATH)
+    return _embedding_cache
+
+def _encode_batch(texts):
+    return get_model(MODEL_NAME).encode(texts, batch_size=len(texts), convert_to_numpy=True,
+                                        normalize_embeddings=True, show_progress_bar=False)
+
 def embed(text):
-    return model.encode(text, convert_to_tensor=True)
+    return _encode_batch([text])[0]
+
+def embed_many(texts, batch_size=BATCH_SIZE, use_cache=True):
+    """Encode ``texts`` into a normalized ``(n, dim)`` float32 matrix."""
+    cache = get_embedding_cache() if use_cache else None
+    return encode_cached(_encode_batch, list(texts), cache=cache, batch_size=batch_size)
+
+def job_key(job):
+    """Stable id for a job posting: its explicit id, else a hash of link and content.
+
+    The link alone is not an identity: aggregators list distinct postings
+    under one URL.
+    """
+    if job.get("id"):
+        return str(job["id"])
+    return content_hash("|".join(str(job.get(field, "")) for field in
+                                 ("link", "title", "company", "location", "description")))
+
+def get_job_index():
+    """Return the process-wide job index, loading it from disk on first use."""
+    global _job_index
+    if _job_index is None:
+        _job_index = JobVectorIndex.load(JOB_INDEX_PATH)
+    return _job_index
+
+def index_jobs(jobs, batch_size=BATCH_SIZE, save=True, use_cache=True):
+    """Add (or refresh) job postings in the persistent index.
+
+    Call this where postings are ingested (after a scrape); matching only
+    reads the index.
+    """
+    jobs = list(jobs)
+    if not jobs:
+        return get_job_index()
+    index = get_job_index()
+    vectors = embed_many([job.get("description", "") for job in jobs], batch_size=batch_size,
+                         use_cache=use_cache)
+    index.add([job_key(job) for job in jobs], vectors)
+    if save:
+        index.save(JOB_INDEX_PATH)
+    return index
+
+def remove_jobs(job_ids, save=True):
+    """Drop postings that are no longer live from the persistent index."""
+    index = get_job_index()
+    removed = index.remove(job_ids)
+    if removed and save:
+        index.save(JOB_INDEX_PATH)
+    return removed
+
+def nearest_candidates(jobs, resume_vec, k=CANDIDATE_K):
+    """The ``k`` indexed ``jobs`` nearest to ``resume_vec``, plus every job not yet indexed.
+
+    Read-only: jobs missing from the index cannot be pruned, so they are all
+    kept as candidates until :func:`index_jobs` has seen them.
+    """
+    index = get_job_index()
+    indexed = {}
+    unindexed = []
+    for job in jobs:
+        key = job_key(job)
+        if key in index:
+            indexed.setdefault(key, []).append(job)
+        else:
+            unindexed.append(job)
+    nearest = index.search(resume_vec, k, allowed=set(indexed)) if indexed else []
+    return [job for key, _ in nearest for job in indexed[key]] + unindexed
+
+def search_jobs(resume_text, k=CANDIDATE_K):
+    """Return ``(job_id, cosine)`` pairs for the ``k`` nearest indexed jobs."""
+    return get_job_index().search(embed(resume_text), k)
 
 def calculate_cybersecurity_bonus(job, config):
     """Calculate bonus score for cybersecurity-specific roles and keywords"""
@@ -86,12 +190,12 @@ def calculate_location_bonus(job, config):
     
     return bonus
 
-def match_resume_to_jobs(resume_text, jobs):
-    """Enhanced job matching with cybersecurity focus and regional preferences"""
-    config = load_user_preferences()
-    resume_vec = embed(resume_text)
-    matches = []
-    
+def embed_resume(resume_text):
+    """Embed the enhanced resume profile used by :func:`match_resume_to_jobs`.
+
+    Compute it once and pass it as ``resume_vec`` when scoring a corpus in
+    several calls (e.g. through ``iter_matches``).
+    """
     # Enhanced resume text with Ankit's specific skills
     enhanced_resume = f"""
     {resume_text}
@@ -104,14 +208,35 @@ def match_resume_to_jobs(resume_text, jobs):
     Recognition: Hall of Fame from Google, Facebook, Yahoo, U.S. Department of Defense
     Skills: Vulnerability Assessment, DevSecOps, SIEM, Threat Modeling, ISO 27001, NIST
     """
+    return embed(enhanced_resume)
+
+def match_resume_to_jobs(resume_text, jobs, batch_size=BATCH_SIZE, use_cache=True, candidate_k=None,
+                         resume_vec=None, config=None):
+    """Enhanced job matching with cybersecurity focus and regional preferences
+
+    With ``candidate_k`` set, only the ``candidate_k`` postings nearest in the
+    persistent ANN index (plus any not indexed yet) are scored and returned;
+    the index itself is updated by :func:`index_jobs`, not here.
+    ``resume_vec`` (from :func:`embed_resume`) and ``config`` (from
+    :func:`load_user_preferences`) skip re-embedding the resume and
+    re-reading preferences on every call.
+    """
+    config = load_user_preferences() if config is None else config
+    jobs = list(jobs)
+    matches = []
     
-    enhanced_resume_vec = embed(enhanced_resume)
+    enhanced_resume_vec = embed_resume(resume_text) if resume_vec is None else resume_vec
     
-    for job in jobs:
-        # Standard semantic similarity
-        job_description = job.get("description", "")
-        job_vec = embed(job_description)
-        base_score = float(util.cos_sim(enhanced_resume_vec, job_vec).item()) * 100
+    if candidate_k and len(jobs) > candidate_k:
+        jobs = nearest_candidates(jobs, enhanced_resume_vec, candidate_k)
+    
+    # Standard semantic similarity: all jobs scored with one matrix product
+    job_matrix = embed_many([job.get("description", "") for job in jobs],
+                            batch_size=batch_size, use_cache=use_cache)
+    base_scores = job_matrix @ enhanced_resume_vec * 100 if jobs else np.zeros(0)
+    
+    for job, base_score in zip(jobs, base_scores):
+        base_score = float(base_score)
         
         # Add cybersecurity-specific bonuses
         cyber_bonus = calculate_cybersecurity_bonus(job, config)
@@ -136,15 +261,16 @@ def filter_high_match_jobs(matches, threshold=3.0):
 
 # Example usage (with preloaded resume_text and job list)
 if __name__ == "__main__":
-    import json
+    import heapq
     from extensions.parser import parse_resume
+    from smart_scraper.job_stream import iter_jobs, iter_matches
 
     resume_text = parse_resume("resumes/Ankit_Thakur_Resume.pdf")
 
-    with open("smart_scraper/scraped_jobs.jsonl") as f:
-        jobs = [json.loads(line) for line in f]
-
-    top_matches = match_resume_to_jobs(resume_text, jobs)
+    # Stream the corpus in chunks and keep only a running top 5
+    matches = iter_matches(match_resume_to_jobs, resume_text, iter_jobs("smart_scraper/scraped_jobs.jsonl"),
+                           resume_vec=embed_resume(resume_text), config=load_user_preferences())
+    top_matches = heapq.nlargest(5, matches, key=lambda job: job["score"])
     print("\nTop AI-matched jobs:")
     for job in top_matches[:5]:
         print(f"{job['title']} @ {job['company']} — Score: {job['score']}%")
\ No newline at end of file
@@ -0,0 +1,143 @@
+"""Process-wide lazy model registry.
+
+Models are registered with a zero-argument loader and only built the first
+time :func:`get_model` asks for them, so importing a module that *might* match
+jobs no longer pays for loading SentenceTransformers, ONNX sessions or HF
+pipelines.  Loading is thread-safe (one loader call per model, even under
+concurrent first use) and every load is timed.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ModelLoadStats:
+    name: str
+    seconds: float
+    loaded_at: float
+    error: Optional[str] = None
+
+
+class ModelRegistry:
+    """Registry of named, lazily constructed models."""
+
+    def __init__(self):
+        self._loaders: Dict[str, Callable[[], Any]] = {}
+        self._models: Dict[str, Any] = {}
+        self._errors: Dict[str, Exception] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._stats: Dict[str, ModelLoadStats] = {}
+        self._registry_lock = threading.Lock()
+
+    def register(self, name: str, loader: Callable[[], Any], replace: bool = False) -> None:
+        """Register ``loader`` under ``name`` without calling it."""
+        with self._registry_lock:
+            if name in self._loaders and not replace:
+                return
+            self._loaders[name] = loader
+            self._locks.setdefault(name, threading.Lock())
+            self._models.pop(name, None)
+            self._errors.pop(name, None)
+
+    def get(self, name: str) -> Any:
+        """Return the model for ``name``, loading it on first use.
+
+        A failed load is remembered and re-raised on later calls instead of
+        retrying an expensive download; call :meth:`unload` to retry.
+        """
+        if name in self._models:
+            return self._models[name]
+        if name in self._errors:
+            raise self._errors[name]
+        if name not in self._loaders:
+            raise KeyError(f"No model registered under {name!r}")
+
+        with self._locks[name]:
+            if name in self._models:
+                return self._models[name]
+            if name in self._errors:
+                raise self._errors[name]
+
+            start = time.perf_counter()
+            try:
+                model = self._loaders[name]()
+            except Exception as exc:
+                elapsed = time.perf_counter() - start
+                self._errors[name] = exc
+                self._stats[name] = ModelLoadStats(name, elapsed, time.time(), error=str(exc))
+                logger.warning("Failed to load model %s after %.2fs: %s", name, elapsed, exc)
+                raise
+
+            elapsed = time.perf_counter() - start
+            self._models[name] = model
+            self._stats[name] = ModelLoadStats(name, elapsed, time.time())
+            logger.info("Loaded model %s in %.2fs", name, elapsed)
+            return model
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._models
+
+    def unload(self, name: str) -> None:
+        """Drop a loaded model (or a remembered failure) so it can be reloaded."""
+        with self._locks.get(name, self._registry_lock):
+            self._models.pop(name, None)
+            self._errors.pop(name, None)
+
+    def load_timings(self) -> Dict[str, ModelLoadStats]:
+        """Return load statistics for every model loaded (or attempted) so far."""
+        return dict(self._stats)
+
+
+registry = ModelRegistry()
+
+
+def register_model(name: str, loader: Callable[[], Any], replace: bool = False) -> None:
+    registry.register(name, loader, replace=replace)
+
+
+def get_model(name: str) -> Any:
+    return registry.get(name)
+
+
+def load_timings() -> Dict[str, ModelLoadStats]:
+    return registry.load_timings()
+
+
+# Loaders for the models used across the tree.  Heavy libraries are imported
+# inside the loader so that importing this module stays cheap.
+
+def sentence_transformer_loader(model_name_or_path: str) -> Callable[[], Any]:
+    def load():
+        from sentence_transformers import SentenceTransformer
+        return SentenceTransformer(model_name_or_path)
+    return load
+
+
+def hf_tokenizer_loader(model_name_or_path: str) -> Callable[[], Any]:
+    def load():
+        from transformers import AutoTokenizer
+        return AutoTokenizer.from_pretrained(model_name_or_path)
+    return load
+
+
+def hf_pipeline_loader(task: str, model_name_or_path: str) -> Callable[[], Any]:
+    def load():
+        import torch
+        from transformers import pipeline
+        return pipeline(task, model=model_name_or_path,
+                        device=0 if torch.cuda.is_available() else -1)
+    return load
+
+
+def onnx_session_loader(model_path: str, options_factory: Optional[Callable[[], Any]] = None) -> Callable[[], Any]:
+    def load():
+        import onnxruntime as ort
+        options = options_factory() if options_factory else None
+        return ort.InferenceSession(model_path, sess_options=options)
+    return load
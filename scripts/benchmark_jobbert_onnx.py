@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark the JobBERT ONNX runner: per-item ``embed`` vs batched ``embed_batch``.
+
+Usage:
+    python scripts/benchmark_jobbert_onnx.py [--jobs smart_scraper/scraped_jobs.jsonl]
+                                             [--limit 500] [--batch-size 32]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from smart_scraper import jobbert_onnx_runner as runner
+
+
+def load_descriptions(path, limit):
+    """Load job descriptions from a JSONL file, padding with synthetic ones."""
+    descriptions = []
+    if Path(path).exists():
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    descriptions.append(json.loads(line).get("description", ""))
+    words = "python security cloud engineer api testing kubernetes compliance".split()
+    rng = np.random.default_rng(0)
+    while len(descriptions) < limit:
+        # Mix of short and long postings, like real scraped data
+        length = int(rng.integers(8, 220))
+        descriptions.append(" ".join(rng.choice(words, size=length)))
+    return descriptions[:limit]
+
+
+def time_it(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jobs", default="smart_scraper/scraped_jobs.jsonl")
+    parser.add_argument("--limit", type=int, default=500)
+    parser.add_argument("--batch-size", type=int, default=runner.BATCH_SIZE)
+    args = parser.parse_args()
+
+    texts = load_descriptions(args.jobs, args.limit)
+    print(f"Benchmarking {len(texts)} descriptions "
+          f"(intra_op={runner.INTRA_OP_THREADS}, inter_op={runner.INTER_OP_THREADS})")
+
+    # Warm up the session so graph optimisation is not billed to either path
+    runner.embed_batch(texts[:2])
+
+    single, single_time = time_it(lambda: np.stack([runner.embed(t) for t in texts]))
+    batched, batch_time = time_it(lambda: runner.embed_batch(texts, batch_size=args.batch_size))
+
+    print(f"per-item : {len(texts) / single_time:8.1f} jobs/sec ({single_time:.2f}s)")
+    print(f"batched  : {len(texts) / batch_time:8.1f} jobs/sec ({batch_time:.2f}s)")
+    print(f"speedup  : {single_time / batch_time:8.2f}x")
+
+    if single.ndim == batched.ndim:
+        cos = np.sum(single * batched, axis=1) / (
+            np.linalg.norm(single, axis=1) * np.linalg.norm(batched, axis=1))
+        print(f"min cosine agreement between paths: {cos.min():.4f}")
+
+
+if __name__ == "__main__":
+    main()
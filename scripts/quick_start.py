@@ -48,6 +48,7 @@ async def demonstrate_core_features():
         return
     
     # Feature 2: AI Job Analysis
+    ai_service = None
     print(f"\n2️⃣ AI-POWERED JOB ANALYSIS")
     print("-" * 40)
     
@@ -160,6 +161,10 @@ async def demonstrate_core_features():
     except Exception as e:
         print(f"❌ Error: {e}")
     
+    # Done with the AI providers: close their pooled connections on this loop
+    if ai_service is not None:
+        await ai_service.aclose()
+    
     # Feature 5: LinkedIn Automation Status
     print(f"\n5️⃣ LINKEDIN AUTOMATION STATUS")
     print("-" * 40)
@@ -1,13 +1,14 @@
 from extensions.parser import parse_resume
-from ml_models.jobbert_onnx_runner import match_resume_to_jobs
-import json
+from ml_models.jobbert_onnx_runner import embed_batch, match_resume_to_jobs
+from smart_scraper.job_stream import iter_jobs, iter_matches
+import heapq
 
 resume_text = parse_resume("resumes/Ankit_Thakur_Resume.pdf")
 
-with open("smart_scraper/scraped_jobs.jsonl") as f:
-    jobs = [json.loads(line) for line in f]
-
-top_matches = match_resume_to_jobs(resume_text, jobs)
+# Stream the corpus in chunks and keep only a running top 5
+matches = iter_matches(match_resume_to_jobs, resume_text, iter_jobs("smart_scraper/scraped_jobs.jsonl"),
+                       resume_vec=embed_batch([resume_text])[0])
+top_matches = heapq.nlargest(5, matches, key=lambda job: job["score"])
 
 print("\nTop AI-matched jobs:")
 for job in top_matches[:5]:
@@ -4,9 +4,10 @@ Each scraper returns a list of job dictionaries with a ``platform`` field.
 The live scrapers would use Playwright or official APIs; here we keep things
 simple and deterministic for tests."""
 
-import json
-from pathlib import Path
-from typing import List, Dict
+import queue
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
 from .linkedin_scraper import scrape_jobs_linkedin
 from .indeed_scraper import scrape_jobs_indeed
@@ -18,6 +19,9 @@ from .remoteok_scraper import scrape_jobs_remoteok
 # Keep the correctly spelled implementation and drop the duplicate to avoid
 # returning the same jobs twice.
 from .angellist_scraper import scrape_jobs_angellist
+from .job_stream import DEFAULT_CHANGES_PATH, DEFAULT_JOBS_PATH, JobStreamWriter
+from .posting_index import DEFAULT_INDEX_PATH, PostingIndex
+from .scrape_metrics import ERROR, TIMEOUT, ScrapeMetrics, SourceMetrics
 
 
 SCRAPERS = [
@@ -29,23 +33,176 @@ SCRAPERS = [
     scrape_jobs_angellist,
 ]
 
+# Seconds each scraper may run before its results are abandoned
+DEFAULT_TIMEOUT = 60.0
 
 
-def scrape_jobs_live(keywords: List[str] | None = None,
-                      locations: List[str] | None = None) -> List[Dict]:
-    """Run all configured scrapers and persist results to JSONL."""
+def platform_name(scraper: Callable) -> str:
+    """Platform identifier of a ``scrape_jobs_<platform>`` function."""
+    return scraper.__name__.replace("scrape_jobs_", "")
+
+
+_JOB, _DONE, _FAILED = range(3)
+
+
+def _produce(scraper: Callable, keywords: List[str], locations: List[str],
+             events: queue.Queue) -> None:
+    """Worker thread: forward each record a scraper returns or yields."""
+    started = time.monotonic()
+    try:
+        for job in scraper(keywords, locations):
+            events.put((scraper, _JOB, job, time.monotonic()))
+    except Exception as exc:
+        events.put((scraper, _FAILED, exc, time.monotonic()))
+    else:
+        events.put((scraper, _DONE, time.monotonic() - started, time.monotonic()))
+
+
+def _iter_scraped(keywords: List[str], locations: List[str],
+                  timeout: float,
+                  timeouts: Optional[Dict[str, float]],
+                  metrics: ScrapeMetrics) -> Iterator[Tuple[Callable, Dict | None]]:
+    """Run every scraper concurrently and stream their records.
+
+    Yields ``(scraper, job)`` for each record as soon as it is produced and
+    ``(scraper, None)`` once a scraper has finished.  Records produced after a
+    scraper's deadline are dropped and the source is marked as timed out.
+    Scrapers run on daemon threads: a timed-out scraper keeps running in the
+    background, but neither the stream nor interpreter exit waits for it.
+    """
+    timeouts = timeouts or {}
+    events: queue.Queue = queue.Queue()
+    started = time.monotonic()
+    sources: Dict[Callable, SourceMetrics] = {}
+    deadlines: Dict[Callable, float] = {}
+    for scraper in SCRAPERS:
+        deadline = timeouts.get(platform_name(scraper), timeout)
+        sources[scraper] = SourceMetrics(platform_name(scraper), deadline=deadline)
+        deadlines[scraper] = started + deadline
+        metrics.record(sources[scraper])
+        threading.Thread(target=_produce, args=(scraper, keywords, locations, events),
+                         name=f"scraper-{platform_name(scraper)}", daemon=True).start()
+
+    def expire(scraper: Callable, now: float) -> None:
+        running.discard(scraper)
+        source = sources[scraper]
+        source.status = TIMEOUT
+        source.latency = now - started
+        print(f"[⚠️] {scraper.__name__} timed out after {source.deadline:.0f}s")
+
+    running = set(SCRAPERS)
+    try:
+        while running:
+            try:
+                scraper, kind, payload, stamp = events.get_nowait()
+            except queue.Empty:
+                now = time.monotonic()
+                for scraper in [s for s in running if deadlines[s] <= now]:
+                    expire(scraper, now)
+                if not running:
+                    break
+                try:
+                    scraper, kind, payload, stamp = events.get(
+                        timeout=max(0.0, min(deadlines[s] for s in running) - now))
+                except queue.Empty:
+                    continue
+
+            if scraper not in running:
+                continue
+            if stamp > deadlines[scraper]:
+                expire(scraper, stamp)
+                continue
+
+            source = sources[scraper]
+            if kind == _JOB:
+                source.jobs += 1
+                yield scraper, payload
+                continue
+
+            running.discard(scraper)
+            if kind == _DONE:
+                source.latency = payload
+                yield scraper, None
+            else:
+                source.status = ERROR
+                source.error = str(payload)
+                source.latency = stamp - started
+                print(f"[⚠️] {scraper.__name__} failed: {payload}")
+    finally:
+        metrics.wall_time = time.monotonic() - started
+
+
+def scrape_jobs_stream(keywords: List[str] | None = None,
+                       locations: List[str] | None = None,
+                       incremental: bool = False,
+                       index_path: str = DEFAULT_INDEX_PATH,
+                       timeout: float = DEFAULT_TIMEOUT,
+                       timeouts: Optional[Dict[str, float]] = None,
+                       metrics: Optional[ScrapeMetrics] = None,
+                       output_path: str = DEFAULT_JOBS_PATH,
+                       changes_path: str = DEFAULT_CHANGES_PATH) -> Iterator[Dict]:
+    """Run all configured scrapers concurrently, yielding jobs as they arrive.
+
+    Every record is appended to ``output_path`` through a buffered
+    :class:`JobStreamWriter` and yielded at once, so consumers can start
+    matching while slower sources are still scraping.  Every scraper gets
+    ``timeout`` seconds (``timeouts`` overrides it per platform name); records
+    a source produced before missing its deadline are kept.  Pass a
+    :class:`ScrapeMetrics` as ``metrics`` to inspect per-source latency,
+    status and yield afterwards.
+
+    With ``incremental=True`` only postings that are new or changed since the
+    previous cycle are emitted, each tagged with ``change`` and its
+    ``fingerprint``; postings a source no longer lists are emitted as
+    ``{"change": "removed"}`` tombstones.  A source is compared against the
+    index only once it completes, so sources that fail or time out are left
+    untouched rather than tombstoned.  The emitted changes are written to
+    ``changes_path``; ``output_path`` is rewritten with the index's full set
+    of live postings once the cycle ends, so it stays the complete corpus.
+    """
     keywords = keywords or ["engineer"]
     locations = locations or ["Remote"]
+    metrics = metrics if metrics is not None else ScrapeMetrics()
+    index = PostingIndex(index_path) if incremental else None
+    pending: Dict[Callable, List[Dict]] = {}
 
-    jobs: List[Dict] = []
-    for scraper in SCRAPERS:
-        try:
-            jobs.extend(scraper(keywords, locations))
-        except Exception as exc:  # pragma: no cover - defensive
-            print(f"[⚠️] {scraper.__name__} failed: {exc}")
-
-    Path("smart_scraper").mkdir(exist_ok=True)
-    with open("smart_scraper/scraped_jobs.jsonl", "w", encoding="utf-8") as f:
-        for job in jobs:
-            f.write(json.dumps(job) + "\n")
-    return jobs
+    try:
+        with JobStreamWriter(changes_path if incremental else output_path) as writer:
+            for scraper, job in _iter_scraped(keywords, locations, timeout, timeouts, metrics):
+                source = metrics.sources[platform_name(scraper)]
+                if index is None:
+                    if job is not None:
+                        source.emitted += 1
+                        writer.write(job)
+                        yield job
+                    continue
+
+                if job is not None:
+                    pending.setdefault(scraper, []).append(job)
+                    continue
+                changes = index.apply(platform_name(scraper), pending.pop(scraper, []))
+                source.emitted = len(changes)
+                for change in changes:
+                    writer.write(change)
+                    yield change
+    finally:
+        if index is not None:
+            with JobStreamWriter(output_path) as snapshot:
+                snapshot.write_many(index.live_jobs())
+            index.close()
+
+
+def scrape_jobs_live(keywords: List[str] | None = None,
+                      locations: List[str] | None = None,
+                      incremental: bool = False,
+                      index_path: str = DEFAULT_INDEX_PATH,
+                      timeout: float = DEFAULT_TIMEOUT,
+                      timeouts: Optional[Dict[str, float]] = None,
+                      metrics: Optional[ScrapeMetrics] = None) -> List[Dict]:
+    """Run all configured scrapers and persist results to JSONL.
+
+    Collects :func:`scrape_jobs_stream` into a list; see it for the
+    ``incremental``, deadline and ``metrics`` options.
+    """
+    return list(scrape_jobs_stream(keywords, locations, incremental, index_path,
+                                   timeout, timeouts, metrics))
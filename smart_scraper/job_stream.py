@@ -0,0 +1,98 @@
+"""Streaming JSONL storage for scraped job records.
+
+Scrapers write through :class:`JobStreamWriter`, which appends records in
+small buffered batches, and consumers read them back lazily with
+:func:`iter_jobs` and process them in fixed-size :func:`chunked` lists, so
+memory stays flat regardless of corpus size.  :func:`iter_matches` runs a
+``match_resume_to_jobs`` style function chunk by chunk over any job iterable,
+including :func:`job_scraper.scrape_jobs_stream` while scraping is running.
+"""
+
+import json
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List
+
+DEFAULT_JOBS_PATH = "smart_scraper/scraped_jobs.jsonl"
+DEFAULT_CHANGES_PATH = "smart_scraper/scraped_jobs.changes.jsonl"
+CHUNK_SIZE = 256
+
+
+class JobStreamWriter:
+    """Buffered JSONL writer; records reach the file every ``buffer_size`` writes."""
+
+    def __init__(self, path: str = DEFAULT_JOBS_PATH, buffer_size: int = 64, append: bool = False):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.buffer_size = buffer_size
+        self.count = 0
+        self._buffer: List[str] = []
+        self._file = open(self.path, "a" if append else "w", encoding="utf-8")
+
+    def write(self, job: Dict) -> None:
+        self._buffer.append(json.dumps(job) + "\n")
+        self.count += 1
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def write_many(self, jobs: Iterable[Dict]) -> None:
+        for job in jobs:
+            self.write(job)
+
+    def flush(self) -> None:
+        """Write buffered records and flush them so concurrent readers see them."""
+        if self._buffer:
+            self._file.write("".join(self._buffer))
+            self._buffer.clear()
+        self._file.flush()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self) -> "JobStreamWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def iter_jobs(path: str = DEFAULT_JOBS_PATH, include_removed: bool = False) -> Iterator[Dict]:
+    """Yield job records from a JSONL file one line at a time.
+
+    Tombstones in an incremental scrape's change log (``"change": "removed"``)
+    are skipped unless ``include_removed`` is set; blank lines are ignored.
+    """
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            job = json.loads(line)
+            if include_removed or job.get("change") != "removed":
+                yield job
+
+
+def chunked(records: Iterable[Dict], size: int = CHUNK_SIZE) -> Iterator[List[Dict]]:
+    """Group an iterable into lists of at most ``size`` records."""
+    iterator = iter(records)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_matches(match_fn: Callable[..., List[Dict]], resume_text: str, jobs: Iterable[Dict],
+                 chunk_size: int = CHUNK_SIZE, resume_vec=None, **kwargs) -> Iterator[Dict]:
+    """Score ``jobs`` in chunks with ``match_fn(resume_text, chunk, **kwargs)``.
+
+    Matches are yielded as each chunk is scored; combine with
+    ``heapq.nlargest`` to keep a running top-K without holding the corpus.
+    A precomputed ``resume_vec`` is passed to every call so the resume is
+    embedded once rather than once per chunk.
+    """
+    if resume_vec is not None:
+        kwargs["resume_vec"] = resume_vec
+    for chunk in chunked(jobs, chunk_size):
+        yield from match_fn(resume_text, chunk, **kwargs)
@@ -1,29 +1,138 @@
-import onnxruntime as ort
-import torch
-from transformers import AutoTokenizer
+import os
+
 import numpy as np
 
+from ml_models.model_registry import (
+    get_model,
+    hf_tokenizer_loader,
+    onnx_session_loader,
+    register_model,
+)
+
 MODEL_PATH = "onnx_model/jobbert-v3.onnx"
-TOKENIZER = AutoTokenizer.from_pretrained("TechWolf/JobBERT-v3")
+TOKENIZER_NAME = "TechWolf/JobBERT-v3"
+MAX_LENGTH = 256
+BATCH_SIZE = 32
+
+# Thread settings for the inference session.  Intra-op threads parallelise a
+# single batch; inter-op threads only matter for parallel graph execution.
+INTRA_OP_THREADS = int(os.getenv("JOBBERT_ORT_INTRA_OP_THREADS", os.cpu_count() or 1))
+INTER_OP_THREADS = int(os.getenv("JOBBERT_ORT_INTER_OP_THREADS", 1))
+
+
+def _session_options():
+    import onnxruntime as ort
+
+    options = ort.SessionOptions()
+    options.intra_op_num_threads = INTRA_OP_THREADS
+    options.inter_op_num_threads = INTER_OP_THREADS
+    options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    return options
+
+
+# The tokenizer and ONNX session are created on first use, not at import time.
+register_model("jobbert-v3-tokenizer", hf_tokenizer_loader(TOKENIZER_NAME))
+register_model("jobbert-v3-onnx", onnx_session_loader(MODEL_PATH, _session_options))
+
+
+def get_tokenizer():
+    return get_model("jobbert-v3-tokenizer")
+
+
+def get_session():
+    return get_model("jobbert-v3-onnx")
+
+
+def __getattr__(name):
+    # Backwards compatibility for the old module-level globals
+    if name == "TOKENIZER":
+        return get_tokenizer()
+    if name == "sess":
+        return get_session()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-sess = ort.InferenceSession(MODEL_PATH)
 
 def embed(text):
-    inputs = TOKENIZER(text, return_tensors="np", padding="max_length", truncation=True, max_length=256)
+    inputs = get_tokenizer()(text, return_tensors="np", padding="max_length", truncation=True, max_length=MAX_LENGTH)
     ort_inputs = {k: v for k, v in inputs.items()}
-    ort_outs = sess.run(None, ort_inputs)
+    ort_outs = get_session().run(None, ort_inputs)
     return ort_outs[0][0]
 
+
+def _pool(output, attention_mask):
+    """Reduce a model output to one vector per row.
+
+    Exports with a pooling head return ``(batch, dim)`` already; raw encoder
+    exports return ``(batch, seq, dim)`` and are mean-pooled over real tokens
+    so padding length never affects the result.
+    """
+    if output.ndim == 2:
+        return output
+    mask = attention_mask[..., None].astype(np.float32)
+    return (output * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+
+
+def _pad_batch(encoded, idx, pad_token_id):
+    """Right-pad the token lists of rows ``idx`` to their longest row as int64 arrays."""
+    width = max(len(encoded["input_ids"][i]) for i in idx)
+    batch = {}
+    for key, rows in encoded.items():
+        pad = pad_token_id if key == "input_ids" else 0
+        array = np.full((len(idx), width), pad, dtype=np.int64)
+        for row, i in enumerate(idx):
+            array[row, :len(rows[i])] = rows[i]
+        batch[key] = array
+    return batch
+
+
+def embed_batch(texts, batch_size=BATCH_SIZE):
+    """Embed ``texts`` into a ``(len(texts), dim)`` float32 matrix.
+
+    Inputs are tokenized once, sorted by token length and each batch is padded
+    only to its own longest sequence, so short postings no longer pay for a
+    full ``MAX_LENGTH`` pass.  Rows are returned in the original order.
+    """
+    texts = [t or "" for t in texts]
+    if not texts:
+        return np.zeros((0, 0), dtype=np.float32)
+
+    tokenizer = get_tokenizer()
+    sess = get_session()
+    session_inputs = {i.name for i in sess.get_inputs()}
+    pad_token_id = getattr(tokenizer, "pad_token_id", None) or 0
+
+    encoded = tokenizer(texts, truncation=True, max_length=MAX_LENGTH)
+    encoded = {k: v for k, v in encoded.items() if k in session_inputs or k == "attention_mask"}
+    order = np.argsort([len(ids) for ids in encoded["input_ids"]], kind="stable")
+
+    result = None
+    for start in range(0, len(texts), batch_size):
+        idx = order[start:start + batch_size]
+        inputs = _pad_batch(encoded, idx, pad_token_id)
+        ort_inputs = {k: v for k, v in inputs.items() if k in session_inputs}
+        vectors = _pool(sess.run(None, ort_inputs)[0], inputs["attention_mask"]).astype(np.float32)
+        if result is None:
+            result = np.empty((len(texts), vectors.shape[-1]), dtype=np.float32)
+        result[idx] = vectors
+    return result
+
+
 def cosine_similarity(vec1, vec2):
     return float(np.dot(vec1, vec2) / (np.linalg.norm(vec1) * np.linalg.norm(vec2)))
 
-def match_resume_to_jobs(resume_text, jobs):
-    resume_vec = embed(resume_text)
-    matches = []
+def match_resume_to_jobs(resume_text, jobs, batch_size=BATCH_SIZE, resume_vec=None):
+    """Score ``jobs`` against the resume; pass ``resume_vec`` to reuse a resume embedding."""
+    jobs = list(jobs)
+    if not jobs:
+        return []
+
+    if resume_vec is None:
+        resume_vec = embed_batch([resume_text])[0]
+    job_matrix = embed_batch([job["description"] for job in jobs], batch_size=batch_size)
 
-    for job in jobs:
-        job_vec = embed(job["description"])
-        score = round(cosine_similarity(resume_vec, job_vec) * 100, 2)
-        matches.append({**job, "score": score})
+    norms = np.linalg.norm(job_matrix, axis=1) * np.linalg.norm(resume_vec)
+    scores = job_matrix @ resume_vec / np.clip(norms, 1e-9, None)
 
-    return sorted(matches, key=lambda x: -x["score"])
\ No newline at end of file
+    matches = [{**job, "score": round(float(score) * 100, 2)} for job, score in zip(jobs, scores)]
+    return sorted(matches, key=lambda x: -x["score"])
@@ -0,0 +1,109 @@
+"""Persistent index of scraped postings for incremental scraping.
+
+Each posting is identified by a fingerprint of its platform, link, title,
+company and location, and versioned by a hash of its full content.  The index
+records when a posting was first and last seen, so a scrape cycle can emit only
+new or changed postings plus tombstones for postings that disappeared from a
+source.
+"""
+
+import hashlib
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+DEFAULT_INDEX_PATH = "smart_scraper/posting_index.sqlite"
+
+IDENTITY_FIELDS = ("platform", "link", "title", "company", "location")
+
+
+def posting_key(job: Dict) -> str:
+    """Stable identity of a posting across scrape cycles."""
+    identity = "\x1f".join(str(job.get(field, "")).strip().lower() for field in IDENTITY_FIELDS)
+    return hashlib.sha1(identity.encode("utf-8")).hexdigest()
+
+
+def content_hash(job: Dict) -> str:
+    """Hash of the whole posting, used to detect edits."""
+    return hashlib.sha1(json.dumps(job, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+class PostingIndex:
+    """SQLite-backed record of every posting seen per platform."""
+
+    def __init__(self, path: str = DEFAULT_INDEX_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS postings ("
+            "key TEXT PRIMARY KEY, platform TEXT NOT NULL, hash TEXT NOT NULL, "
+            "first_seen TEXT NOT NULL, last_seen TEXT NOT NULL, removed_at TEXT, job TEXT NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS postings_platform ON postings(platform)")
+        self._conn.commit()
+
+    # --------------------------------------------------------- postings
+    def apply(self, platform: str, jobs: Iterable[Dict], now: Optional[str] = None) -> List[Dict]:
+        """Record a complete scrape of ``platform`` and return what changed.
+
+        New and edited postings are returned with ``change`` set to ``"new"``
+        or ``"changed"``; postings of this platform that are no longer listed
+        come back as tombstones with ``change`` set to ``"removed"``.
+        """
+        now = now or datetime.now().isoformat()
+        current = {posting_key(job): job for job in jobs}
+        known = {
+            key: (digest, first_seen, removed_at)
+            for key, digest, first_seen, removed_at in self._conn.execute(
+                "SELECT key, hash, first_seen, removed_at FROM postings WHERE platform = ?", (platform,)
+            )
+        }
+
+        changes = []
+        rows = []
+        for key, job in current.items():
+            digest = content_hash(job)
+            previous = known.get(key)
+            first_seen = previous[1] if previous else now
+            if previous is None or previous[2] is not None:
+                change = "new"
+            elif previous[0] != digest:
+                change = "changed"
+            else:
+                change = None
+            if change:
+                changes.append(dict(job, fingerprint=key, change=change, first_seen=first_seen, last_seen=now))
+            rows.append((key, platform, digest, first_seen, now, json.dumps(job)))
+
+        removed = [key for key, (_, _, removed_at) in known.items() if key not in current and removed_at is None]
+        for key in removed:
+            changes.append({"fingerprint": key, "platform": platform, "change": "removed", "removed_at": now})
+
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO postings (key, platform, hash, first_seen, last_seen, removed_at, job) "
+                "VALUES (?, ?, ?, ?, ?, NULL, ?) "
+                "ON CONFLICT(key) DO UPDATE SET hash = excluded.hash, last_seen = excluded.last_seen, "
+                "removed_at = NULL, job = excluded.job",
+                rows,
+            )
+            self._conn.executemany(
+                "UPDATE postings SET removed_at = ? WHERE key = ?", [(now, key) for key in removed]
+            )
+        return changes
+
+    def live_jobs(self, platform: Optional[str] = None) -> List[Dict]:
+        """Full snapshot of postings that have not been removed."""
+        query = "SELECT job FROM postings WHERE removed_at IS NULL"
+        params = ()
+        if platform:
+            query += " AND platform = ?"
+            params = (platform,)
+        return [json.loads(job) for (job,) in self._conn.execute(query, params)]
+
+    def close(self) -> None:
+        self._conn.close()
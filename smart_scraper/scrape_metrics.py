@@ -0,0 +1,60 @@
+"""Per-source metrics for a :func:`job_scraper.scrape_jobs_live` run."""
+
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Optional
+
+OK = "ok"
+TIMEOUT = "timeout"
+ERROR = "error"
+
+
+@dataclass
+class SourceMetrics:
+    """Outcome of one scraper within a run."""
+
+    platform: str
+    status: str = OK
+    latency: float = 0.0
+    jobs: int = 0
+    emitted: int = 0
+    deadline: Optional[float] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class ScrapeMetrics:
+    """Latency and yield of every source plus totals for the whole run.
+
+    ``jobs`` counts postings a source returned; ``emitted`` counts what the run
+    passed downstream (equal to ``jobs`` unless scraping incrementally).
+    """
+
+    sources: Dict[str, SourceMetrics] = field(default_factory=dict)
+    wall_time: float = 0.0
+
+    def record(self, source: SourceMetrics) -> None:
+        self.sources[source.platform] = source
+
+    @property
+    def total_jobs(self) -> int:
+        return sum(source.jobs for source in self.sources.values())
+
+    @property
+    def total_emitted(self) -> int:
+        return sum(source.emitted for source in self.sources.values())
+
+    @property
+    def timed_out(self):
+        return [name for name, source in self.sources.items() if source.status == TIMEOUT]
+
+    @property
+    def failed(self):
+        return [name for name, source in self.sources.items() if source.status == ERROR]
+
+    def to_dict(self) -> Dict:
+        return {
+            "wall_time": self.wall_time,
+            "total_jobs": self.total_jobs,
+            "total_emitted": self.total_emitted,
+            "sources": {name: asdict(source) for name, source in self.sources.items()},
+        }
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+AI Client Pool
+Shared async provider clients with per-provider connection pooling and
+in-flight request coalescing
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import weakref
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Default connection limits for each provider's pooled HTTP client
+MAX_CONNECTIONS = 20
+MAX_KEEPALIVE_CONNECTIONS = 10
+
+
+def pooled_http_client(max_connections: int = MAX_CONNECTIONS,
+                       max_keepalive: int = MAX_KEEPALIVE_CONNECTIONS):
+    """Return an ``httpx.AsyncClient`` with bounded keep-alive pooling, or None.
+
+    The OpenAI and Anthropic SDKs accept it as ``http_client``; without httpx
+    they fall back to their own default client.
+    """
+    try:
+        import httpx
+    except ImportError:
+        return None
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive),
+        timeout=httpx.Timeout(60.0, connect=10.0)
+    )
+
+
+def _current_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class AsyncClientPool:
+    """One lazily created client per provider and event loop
+
+    Async SDK clients hold connections bound to the loop that opened them, so
+    callers that run ``asyncio.run`` repeatedly get a fresh client per loop,
+    while every service instance on the same loop shares one pooled client.
+    """
+
+    def __init__(self):
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._credentials: Dict[str, Optional[str]] = {}
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+        self._retired: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, List[Tuple[str, Any]]]" = weakref.WeakKeyDictionary()
+        self._loopless: Dict[str, Any] = {}
+
+    @staticmethod
+    def credentials_id(api_key: Optional[str]) -> Optional[str]:
+        """Digest identifying an API key without keeping the key itself."""
+        if api_key is None:
+            return None
+        return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+    def register(self, name: str, factory: Callable[[], Any], api_key: Optional[str] = None) -> None:
+        """Register the factory for provider ``name``.
+
+        Re-registering with the same ``api_key`` keeps the existing clients; a
+        different key (e.g. a rotated one) replaces the factory, and clients
+        built with the old key are closed by the next :meth:`aclose` on their loop.
+        """
+        credentials = self.credentials_id(api_key)
+        if name in self._factories and self._credentials.get(name) == credentials:
+            return
+        self._factories[name] = factory
+        self._credentials[name] = credentials
+        for loop, clients in list(self._clients.items()):
+            if name in clients:
+                self._retired.setdefault(loop, []).append((name, clients.pop(name)))
+        self._loopless.pop(name, None)
+
+    def is_registered(self, name: str) -> bool:
+        return name in self._factories
+
+    def get(self, name: str) -> Any:
+        """Client for ``name`` on the running loop, or None if not registered."""
+        factory = self._factories.get(name)
+        if factory is None:
+            return None
+        loop = _current_loop()
+        clients = self._loopless if loop is None else self._clients.setdefault(loop, {})
+        if name not in clients:
+            clients[name] = factory()
+        return clients[name]
+
+    async def aclose(self) -> None:
+        """Close the clients created on the running loop; later calls open new ones."""
+        loop = _current_loop()
+        if loop is None:
+            return
+        clients = list(self._clients.pop(loop, {}).items()) + self._retired.pop(loop, [])
+        for name, client in clients:
+            close = getattr(client, "close", None)
+            if close is None:
+                continue
+            try:
+                result = close()
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                logger.debug(f"Error closing {name} client: {e}")
+
+
+class InFlightCoalescer:
+    """Share one in-flight call among concurrent identical requests
+
+    Callers with the same key await a single task; the entry is dropped once
+    the task finishes, so later calls run again (caching is a separate layer).
+    """
+
+    def __init__(self):
+        self._inflight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Future]]" = weakref.WeakKeyDictionary()
+        self.coalesced = 0
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        payload = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def run(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        inflight = self._inflight.setdefault(asyncio.get_running_loop(), {})
+        future = inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            # shield: one waiter being cancelled must not cancel the others
+            return await asyncio.shield(future)
+
+        future = asyncio.ensure_future(call())
+        inflight[key] = future
+        future.add_done_callback(lambda _: inflight.pop(key, None))
+        return await asyncio.shield(future)
+
+
+# Shared by every MultiAIService instance in the process
+client_pool = AsyncClientPool()
+coalescer = InFlightCoalescer()
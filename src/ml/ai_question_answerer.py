@@ -5,10 +5,11 @@ Dynamically answers job application questions using multiple AI providers
 """
 
 import os
+import sys
 import json
 import hashlib
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
 from pathlib import Path
 import openai
 import anthropic
@@ -16,9 +17,24 @@ import google.generativeai as genai
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from ml_models.embedding_cache import EmbeddingCache, encode_cached
+from ml_models.model_registry import get_model, register_model, sentence_transformer_loader
+from src.ml.answer_store import AnswerStore, normalize_question
+from src.ml.llm_cache import LLMResponseCache, cached_completion, resolve_llm_cache
+from src.ml.semantic_answer_index import SemanticAnswerIndex, question_entities
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+QUESTION_MODEL_NAME = 'all-MiniLM-L6-v2'
+register_model(QUESTION_MODEL_NAME, sentence_transformer_loader(QUESTION_MODEL_NAME))
+
+# Answers to these categories do not depend on the job, so near-duplicate
+# questions may reuse them across applications; other categories only reuse
+# answers given for the same job title and company.
+CONTEXT_FREE_CATEGORIES = {"experience", "skills", "availability", "salary", "education", "location"}
+
 @dataclass
 class QuestionAnswer:
     question: str
@@ -30,9 +46,19 @@ class QuestionAnswer:
     confidence: float = 0.0
 
 class AIQuestionAnswerer:
-    def __init__(self, user_profile_path: str = "config/user_profile.yaml"):
+    def __init__(self, user_profile_path: str = "config/user_profile.yaml",
+                 llm_cache: Union[LLMResponseCache, bool, None] = None,
+                 semantic_threshold: Optional[float] = None):
         self.user_profile_path = user_profile_path
-        self.answers_cache_path = Path("data/question_answers_cache.json")
+        # Opt-in cosine similarity above which a near-duplicate question naming
+        # the same skills, places and currencies reuses a cached answer (e.g.
+        # semantic_answer_index.DEFAULT_SIMILARITY_THRESHOLD); None disables it
+        self.semantic_threshold = semantic_threshold
+        self._semantic_index = None
+        # Opt-in shared LLM response cache (True uses the default cache file)
+        self.llm_cache = resolve_llm_cache(llm_cache)
+        self.answers_cache_path = Path("data/question_answers.sqlite")
+        self.legacy_answers_cache_path = Path("data/question_answers_cache.json")
         self.answers_cache_path.parent.mkdir(exist_ok=True)
         
         # Load user profile and cache
@@ -97,22 +123,14 @@ class AIQuestionAnswerer:
             }
         }
     
-    def _load_answers_cache(self) -> Dict:
-        """Load previously answered questions from cache"""
-        try:
-            if self.answers_cache_path.exists():
-                with open(self.answers_cache_path, 'r') as f:
-                    return json.load(f)
-            return {}
-        except Exception as e:
-            logger.error(f"Error loading answers cache: {e}")
-            return {}
+    def _load_answers_cache(self) -> AnswerStore:
+        """Open the answer store, importing the legacy JSON cache on first use"""
+        return AnswerStore(str(self.answers_cache_path), legacy_json_path=str(self.legacy_answers_cache_path))
     
     def _save_answers_cache(self):
-        """Save answers cache to file"""
+        """Commit any buffered answers"""
         try:
-            with open(self.answers_cache_path, 'w') as f:
-                json.dump(self.answers_cache, f, indent=2)
+            self.answers_cache.commit()
         except Exception as e:
             logger.error(f"Error saving answers cache: {e}")
     
@@ -156,17 +174,93 @@ class AIQuestionAnswerer:
                 return category
         return "general"
     
-    def _check_cache(self, question_hash: str) -> Optional[QuestionAnswer]:
-        """Check if question was answered before"""
-        if question_hash in self.answers_cache:
-            cached_data = self.answers_cache[question_hash]
+    def _check_cache(self, question_hash: str, question: str = "", job_context: Dict = None) -> Optional[QuestionAnswer]:
+        """Check if question was answered before, by exact hash or normalized wording"""
+        cached_data = self.answers_cache.get(question_hash)
+        if cached_data is None and question:
+            cached_data = self.answers_cache.find(normalize_question(question, job_context))
+        if cached_data is not None:
             return QuestionAnswer(**cached_data)
         return None
     
-    def _cache_answer(self, question_hash: str, qa: QuestionAnswer):
-        """Cache the question-answer pair"""
-        self.answers_cache[question_hash] = asdict(qa)
-        self._save_answers_cache()
+    def _cache_answer(self, question_hash: str, qa: QuestionAnswer, job_context: Dict = None, category: str = ""):
+        """Cache the question-answer pair; committed at once unless inside a batch"""
+        try:
+            self.answers_cache.put(question_hash, normalize_question(qa.question, job_context), asdict(qa), category)
+            if self._semantic_index is not None:
+                self._semantic_index.add(self._semantic_bucket(category, job_context), question_hash, qa.question)
+        except Exception as e:
+            logger.error(f"Error saving answers cache: {e}")
+    
+    def _semantic_bucket(self, category: str, job_context: Dict = None) -> str:
+        """Index bucket for a question: its category, plus the job for job-specific categories"""
+        if category in CONTEXT_FREE_CATEGORIES:
+            return category
+        job_context = job_context or {}
+        return category + normalize_question('', {
+            'title': job_context.get('title', ''), 'company': job_context.get('company', '')
+        })
+    
+    def _get_semantic_index(self) -> Optional[SemanticAnswerIndex]:
+        """Build the semantic index from stored answers on first use"""
+        if self._semantic_index is not None or self.semantic_threshold is None:
+            return self._semantic_index
+        try:
+            model = get_model(QUESTION_MODEL_NAME)
+        except Exception as e:
+            logger.warning(f"Semantic question matching disabled: {e}")
+            self.semantic_threshold = None
+            return None
+        
+        embedding_cache = EmbeddingCache(QUESTION_MODEL_NAME)
+        index = SemanticAnswerIndex(
+            lambda questions: encode_cached(model.encode, questions, cache=embedding_cache),
+            threshold=self.semantic_threshold
+        )
+        index.add_many(
+            (self._semantic_bucket(category or self._categorize_question(record.get('question', '')),
+                                   {'title': record.get('job_title', ''), 'company': record.get('company', '')}),
+             question_hash,
+             record.get('question', ''))
+            for question_hash, category, record in self.answers_cache.records()
+        )
+        self._semantic_index = index
+        return index
+    
+    def _question_entities(self, question: str) -> frozenset:
+        """Entities that must agree before an answer is reused for ``question``"""
+        profile = self.user_profile or {}
+        known_terms = list(profile.get('skills') or [])
+        known_terms += list(profile.get('preferred_locations') or [])
+        return question_entities(question, known_terms)
+    
+    def _check_semantic_cache(self, question: str, job_context: Dict = None, category: str = "general") -> Optional[QuestionAnswer]:
+        """Reuse the answer of a near-duplicate question in the same category
+        
+        The stored question must also name the same entities, so "Years of
+        Python?" never reuses the answer to "Years of Java?".
+        """
+        index = self._get_semantic_index()
+        if index is None:
+            return None
+        entities = self._question_entities(question)
+        
+        def same_entities(question_hash: str) -> bool:
+            record = self.answers_cache.get(question_hash)
+            return record is not None and self._question_entities(record.get('question', '')) == entities
+        
+        match = index.search(self._semantic_bucket(category, job_context), question, accept=same_entities)
+        if match is None:
+            return None
+        cached_data = self.answers_cache.get(match[0])
+        logger.info(f"Reusing answer to similar question (similarity {match[1]:.2f}): {cached_data.get('question', '')[:50]}...")
+        job_context = job_context or {}
+        return QuestionAnswer(**{
+            **cached_data,
+            'question': question,
+            'job_title': job_context.get('title', ''),
+            'company': job_context.get('company', '')
+        })
     
     def _build_context_prompt(self, question: str, job_context: Dict = None, category: str = "general") -> str:
         """Build context-aware prompt for AI"""
@@ -229,16 +323,21 @@ Answer:"""
             if not self.openai_client:
                 return None
                 
-            response = self.openai_client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "You are a professional job application assistant."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=150,
-                temperature=0.3
-            )
-            return response.choices[0].message.content.strip()
+            def call():
+                response = self.openai_client.chat.completions.create(
+                    model="gpt-3.5-turbo",
+                    messages=[
+                        {"role": "system", "content": "You are a professional job application assistant."},
+                        {"role": "user", "content": prompt}
+                    ],
+                    max_tokens=150,
+                    temperature=0.3
+                )
+                return response.choices[0].message.content.strip()
+            
+            return cached_completion(self.llm_cache, "openai", "gpt-3.5-turbo", prompt, call,
+                                     {"max_tokens": 150, "temperature": 0.3},
+                                     system="You are a professional job application assistant.")
         except Exception as e:
             logger.error(f"OpenAI query error: {e}")
             return None
@@ -249,12 +348,16 @@ Answer:"""
             if not self.anthropic_client:
                 return None
                 
-            response = self.anthropic_client.messages.create(
-                model="claude-3-haiku-20240307",
-                max_tokens=150,
-                messages=[{"role": "user", "content": prompt}]
-            )
-            return response.content[0].text.strip()
+            def call():
+                response = self.anthropic_client.messages.create(
+                    model="claude-3-haiku-20240307",
+                    max_tokens=150,
+                    messages=[{"role": "user", "content": prompt}]
+                )
+                return response.content[0].text.strip()
+            
+            return cached_completion(self.llm_cache, "anthropic", "claude-3-haiku-20240307", prompt, call,
+                                     {"max_tokens": 150})
         except Exception as e:
             logger.error(f"Anthropic query error: {e}")
             return None
@@ -265,14 +368,18 @@ Answer:"""
             if not self.gemini_client:
                 return None
                 
-            response = self.gemini_client.generate_content(
-                prompt,
-                generation_config=genai.types.GenerationConfig(
-                    max_output_tokens=150,
-                    temperature=0.3,
+            def call():
+                response = self.gemini_client.generate_content(
+                    prompt,
+                    generation_config=genai.types.GenerationConfig(
+                        max_output_tokens=150,
+                        temperature=0.3,
+                    )
                 )
-            )
-            return response.text.strip()
+                return response.text.strip()
+            
+            return cached_completion(self.llm_cache, "gemini", "gemini-pro", prompt, call,
+                                     {"max_tokens": 150, "temperature": 0.3})
         except Exception as e:
             logger.error(f"Gemini query error: {e}")
             return None
@@ -306,7 +413,7 @@ Answer:"""
         
         # Check cache first
         question_hash = self._get_question_hash(question, job_context)
-        cached_answer = self._check_cache(question_hash)
+        cached_answer = self._check_cache(question_hash, question, job_context)
         
         if cached_answer:
             logger.info(f"Using cached answer for: {question[:50]}...")
@@ -316,6 +423,12 @@ Answer:"""
         category = self._categorize_question(question)
         logger.info(f"Question category: {category}")
         
+        # Reuse the answer of a semantically equivalent question
+        similar_answer = self._check_semantic_cache(question, job_context, category)
+        if similar_answer:
+            self._cache_answer(question_hash, similar_answer, job_context, category)
+            return similar_answer
+        
         # Build context prompt
         prompt = self._build_context_prompt(question, job_context, category)
         
@@ -363,31 +476,32 @@ Answer:"""
         )
         
         # Cache the answer
-        self._cache_answer(question_hash, qa)
+        self._cache_answer(question_hash, qa, job_context, category)
         
         logger.info(f"Generated answer with {ai_provider} (confidence: {confidence})")
         return qa
     
     def bulk_answer_questions(self, questions: List[str], job_context: Dict = None) -> List[QuestionAnswer]:
-        """Answer multiple questions at once"""
+        """Answer multiple questions at once; new answers are committed in one write"""
         answers = []
-        for question in questions:
-            try:
-                answer = self.answer_question(question, job_context)
-                answers.append(answer)
-            except Exception as e:
-                logger.error(f"Error answering question '{question[:50]}...': {e}")
-                # Create fallback answer
-                fallback_qa = QuestionAnswer(
-                    question=question,
-                    answer=self._get_fallback_answer(question, "general"),
-                    job_title=job_context.get('title', '') if job_context else '',
-                    company=job_context.get('company', '') if job_context else '',
-                    timestamp=datetime.now().isoformat(),
-                    ai_provider="fallback",
-                    confidence=0.5
-                )
-                answers.append(fallback_qa)
+        with self.answers_cache.batch():
+            for question in questions:
+                try:
+                    answer = self.answer_question(question, job_context)
+                    answers.append(answer)
+                except Exception as e:
+                    logger.error(f"Error answering question '{question[:50]}...': {e}")
+                    # Create fallback answer
+                    fallback_qa = QuestionAnswer(
+                        question=question,
+                        answer=self._get_fallback_answer(question, "general"),
+                        job_title=job_context.get('title', '') if job_context else '',
+                        company=job_context.get('company', '') if job_context else '',
+                        timestamp=datetime.now().isoformat(),
+                        ai_provider="fallback",
+                        confidence=0.5
+                    )
+                    answers.append(fallback_qa)
         return answers
     
     def get_answer_statistics(self) -> Dict:
@@ -413,7 +527,8 @@ Answer:"""
             "total_questions": len(self.answers_cache),
             "providers": providers,
             "companies": companies,
-            "cache_file": str(self.answers_cache_path)
+            "cache_file": str(self.answers_cache_path),
+            "llm_cache": self.llm_cache.stats() if self.llm_cache else None
         }
 
 
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Answer Store
+Indexed, transactional storage for answered application questions
+"""
+
+import json
+import logging
+import re
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_PATH = "data/question_answers.sqlite"
+
+_NON_WORD = re.compile(r"[^\w\s]")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_question(question: str, job_context: Dict = None) -> str:
+    """Case-, punctuation- and whitespace-insensitive key for a question in a job context"""
+    text = _WHITESPACE.sub(" ", _NON_WORD.sub(" ", (question or "").lower())).strip()
+    if job_context:
+        title = _WHITESPACE.sub(" ", str(job_context.get('title', '')).lower()).strip()
+        company = _WHITESPACE.sub(" ", str(job_context.get('company', '')).lower()).strip()
+        text += f"|{title}|{company}"
+    return text
+
+
+class AnswerStore(Mapping):
+    """SQLite answer store keyed by question hash, with a normalized-key index
+
+    Reads go through an in-memory LRU of ``lru_size`` entries. Writes are
+    buffered and committed in one transaction every ``commit_every`` answers,
+    at the end of a :meth:`batch` block, or on :meth:`commit`/:meth:`close`.
+    Behaves as a read-only mapping of hash -> answer record so existing
+    statistics code can iterate it like the old JSON dict.
+    """
+
+    def __init__(self,
+                 path: str = DEFAULT_STORE_PATH,
+                 legacy_json_path: Optional[str] = None,
+                 lru_size: int = 512,
+                 commit_every: int = 64):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lru_size = lru_size
+        self.commit_every = commit_every
+        self._lru: "OrderedDict[str, Dict]" = OrderedDict()
+        self._pending: Dict[str, tuple] = {}
+        self._batch_depth = 0
+        self._lock = threading.RLock()
+
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS answers ("
+            "hash TEXT PRIMARY KEY, norm_key TEXT NOT NULL, category TEXT, data TEXT NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS answers_norm_key ON answers(norm_key)")
+        self._conn.commit()
+
+        if legacy_json_path:
+            self._migrate_json(Path(legacy_json_path))
+
+    def _migrate_json(self, legacy_path: Path) -> None:
+        """Import the old whole-file JSON cache once, into an empty store"""
+        if not legacy_path.exists() or self._conn.execute("SELECT 1 FROM answers LIMIT 1").fetchone():
+            return
+        try:
+            with open(legacy_path, 'r') as f:
+                legacy = json.load(f)
+        except Exception as e:
+            logger.error(f"Error reading legacy answers cache: {e}")
+            return
+        with self.batch():
+            for question_hash, record in legacy.items():
+                key = normalize_question(record.get('question', ''), {
+                    'title': record.get('job_title', ''), 'company': record.get('company', '')
+                })
+                self.put(question_hash, key, record)
+        logger.info(f"Migrated {len(legacy)} cached answers from {legacy_path}")
+
+    # ------------------------------------------------------------ reads
+    def get(self, question_hash: str, default=None) -> Optional[Dict]:
+        with self._lock:
+            record = self._lru.get(question_hash)
+            if record is not None:
+                self._lru.move_to_end(question_hash)
+                return record
+            pending = self._pending.get(question_hash)
+            if pending is not None:
+                return json.loads(pending[2])
+            row = self._conn.execute("SELECT data FROM answers WHERE hash = ?", (question_hash,)).fetchone()
+            if row is None:
+                return default
+            record = json.loads(row[0])
+            self._remember(question_hash, record)
+            return record
+
+    def find(self, norm_key: str) -> Optional[Dict]:
+        """Most recently stored answer whose normalized key equals ``norm_key``"""
+        with self._lock:
+            for question_hash, (key, _, data) in reversed(list(self._pending.items())):
+                if key == norm_key:
+                    return json.loads(data)
+            row = self._conn.execute(
+                "SELECT hash, data FROM answers WHERE norm_key = ? ORDER BY rowid DESC LIMIT 1", (norm_key,)
+            ).fetchone()
+            if row is None:
+                return None
+            record = json.loads(row[1])
+            self._remember(row[0], record)
+            return record
+
+    def __getitem__(self, question_hash: str) -> Dict:
+        record = self.get(question_hash)
+        if record is None:
+            raise KeyError(question_hash)
+        return record
+
+    def __contains__(self, question_hash) -> bool:
+        return self.get(question_hash) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            self.commit()
+            hashes = [row[0] for row in self._conn.execute("SELECT hash FROM answers")]
+        return iter(hashes)
+
+    def __len__(self) -> int:
+        with self._lock:
+            stored = self._conn.execute("SELECT COUNT(*) FROM answers").fetchone()[0]
+            if not self._pending:
+                return stored
+            placeholders = ",".join("?" * len(self._pending))
+            existing = self._conn.execute(
+                f"SELECT COUNT(*) FROM answers WHERE hash IN ({placeholders})", list(self._pending)
+            ).fetchone()[0]
+            return stored + len(self._pending) - existing
+
+    def values(self):
+        with self._lock:
+            self.commit()
+            return [json.loads(row[0]) for row in self._conn.execute("SELECT data FROM answers")]
+
+    def records(self) -> Iterator[tuple]:
+        """``(hash, category, record)`` for every stored answer"""
+        with self._lock:
+            self.commit()
+            rows = self._conn.execute("SELECT hash, category, data FROM answers").fetchall()
+        for question_hash, category, data in rows:
+            yield question_hash, category or "", json.loads(data)
+
+    # ----------------------------------------------------------- writes
+    def put(self, question_hash: str, norm_key: str, record: Dict, category: str = "") -> None:
+        with self._lock:
+            self._pending.pop(question_hash, None)  # keep insertion order = recency
+            self._pending[question_hash] = (norm_key, category, json.dumps(record))
+            self._remember(question_hash, record)
+            if self._batch_depth == 0 or len(self._pending) >= self.commit_every:
+                self.commit()
+
+    @contextmanager
+    def batch(self):
+        """Defer commits until the outermost ``batch`` block exits"""
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self.commit()
+
+    def commit(self) -> None:
+        with self._lock:
+            if not self._pending:
+                return
+            rows = [(question_hash, key, category, data)
+                    for question_hash, (key, category, data) in self._pending.items()]
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO answers (hash, norm_key, category, data) VALUES (?, ?, ?, ?)", rows
+                )
+            self._pending.clear()
+
+    def close(self) -> None:
+        with self._lock:
+            self.commit()
+            self._conn.close()
+
+    def _remember(self, question_hash: str, record: Dict) -> None:
+        self._lru[question_hash] = record
+        self._lru.move_to_end(question_hash)
+        while len(self._lru) > self.lru_size:
+            self._lru.popitem(last=False)
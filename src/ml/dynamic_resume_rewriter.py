@@ -5,9 +5,10 @@ Automatically rewrites resumes to match specific job descriptions using AI
 """
 
 import os
+import sys
 import json
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
 from pathlib import Path
 from datetime import datetime
 import hashlib
@@ -22,6 +23,9 @@ from sentence_transformers import SentenceTransformer
 import numpy as np
 from sklearn.metrics.pairwise import cosine_similarity
 
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.ml.llm_cache import LLMResponseCache, cached_completion, resolve_llm_cache
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -39,8 +43,11 @@ class ResumeVersion:
     ai_provider: str
 
 class DynamicResumeRewriter:
-    def __init__(self, base_resume_path: str = "config/resume.pdf"):
+    def __init__(self, base_resume_path: str = "config/resume.pdf",
+                 llm_cache: Union[LLMResponseCache, bool, None] = None):
         self.base_resume_path = Path(base_resume_path)
+        # Opt-in shared LLM response cache (True uses the default cache file)
+        self.llm_cache = resolve_llm_cache(llm_cache)
         self.output_dir = Path("data/optimized_resumes")
         self.output_dir.mkdir(exist_ok=True)
         
@@ -324,17 +331,21 @@ Generate the optimized resume content:"""
     def _query_openai_for_resume(self, prompt: str) -> Optional[Dict]:
         """Query OpenAI for resume optimization"""
         try:
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are an expert ATS resume optimizer."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=2000,
-                temperature=0.3
-            )
+            def call():
+                response = self.openai_client.chat.completions.create(
+                    model="gpt-4",
+                    messages=[
+                        {"role": "system", "content": "You are an expert ATS resume optimizer."},
+                        {"role": "user", "content": prompt}
+                    ],
+                    max_tokens=2000,
+                    temperature=0.3
+                )
+                return response.choices[0].message.content.strip()
             
-            content = response.choices[0].message.content.strip()
+            content = cached_completion(self.llm_cache, "openai", "gpt-4", prompt, call,
+                                        {"max_tokens": 2000, "temperature": 0.3},
+                                        system="You are an expert ATS resume optimizer.")
             # Try to parse JSON
             if content.startswith('{'):
                 return json.loads(content)
@@ -347,13 +358,16 @@ Generate the optimized resume content:"""
     def _query_anthropic_for_resume(self, prompt: str) -> Optional[Dict]:
         """Query Anthropic for resume optimization"""
         try:
-            response = self.anthropic_client.messages.create(
-                model="claude-3-sonnet-20240229",
-                max_tokens=2000,
-                messages=[{"role": "user", "content": prompt}]
-            )
+            def call():
+                response = self.anthropic_client.messages.create(
+                    model="claude-3-sonnet-20240229",
+                    max_tokens=2000,
+                    messages=[{"role": "user", "content": prompt}]
+                )
+                return response.content[0].text.strip()
             
-            content = response.content[0].text.strip()
+            content = cached_completion(self.llm_cache, "anthropic", "claude-3-sonnet-20240229", prompt, call,
+                                        {"max_tokens": 2000})
             # Try to parse JSON
             if content.startswith('{'):
                 return json.loads(content)
@@ -366,15 +380,18 @@ Generate the optimized resume content:"""
     def _query_gemini_for_resume(self, prompt: str) -> Optional[Dict]:
         """Query Gemini for resume optimization"""
         try:
-            response = self.gemini_client.generate_content(
-                prompt,
-                generation_config=genai.types.GenerationConfig(
-                    max_output_tokens=2000,
-                    temperature=0.3,
+            def call():
+                response = self.gemini_client.generate_content(
+                    prompt,
+                    generation_config=genai.types.GenerationConfig(
+                        max_output_tokens=2000,
+                        temperature=0.3,
+                    )
                 )
-            )
+                return response.text.strip()
             
-            content = response.text.strip()
+            content = cached_completion(self.llm_cache, "gemini", "gemini-pro", prompt, call,
+                                        {"max_tokens": 2000, "temperature": 0.3})
             # Try to parse JSON
             if content.startswith('{'):
                 return json.loads(content)
@@ -13,20 +13,33 @@ from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, asdict
 import re
 import os
+import sys
 
 # ML and AI imports
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 from sklearn.preprocessing import StandardScaler
 from sklearn.ensemble import RandomForestRegressor
-import torch
-from transformers import pipeline, AutoTokenizer, AutoModel
 import openai
-from sentence_transformers import SentenceTransformer
 
 # Import our custom classes
 from advanced_resume_parser import ParsedResume, ResumeParser
 
+# Heavy models (torch, transformers) are loaded lazily through the shared registry
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from ml_models.model_registry import (
+    get_model,
+    hf_pipeline_loader,
+    register_model,
+    sentence_transformer_loader,
+)
+
+SENTENCE_MODEL_NAME = 'all-MiniLM-L6-v2'
+SKILL_CLASSIFIER_NAME = 'facebook/bart-large-mnli'
+register_model(SENTENCE_MODEL_NAME, sentence_transformer_loader(SENTENCE_MODEL_NAME))
+register_model(SKILL_CLASSIFIER_NAME, hf_pipeline_loader('zero-shot-classification', SKILL_CLASSIFIER_NAME))
+_MODEL_LOAD_WARNINGS = set()
+
 @dataclass
 class JobRequirement:
     id: str
@@ -68,11 +81,22 @@ class AIJobMatcher:
     """Advanced AI-powered job matching system"""
     
     def __init__(self):
-        # Initialize AI models
-        self.sentence_model = None
-        self.skill_classifier = None
+        # Initialize AI clients (ML models load on first use)
         self.openai_client = None
         
+        # Weights for the overall match score
+        self.match_weights = {
+            'skill_score': 0.35,
+            'experience_score': 0.25,
+            'education_score': 0.10,
+            'location_score': 0.15,
+            'culture_score': 0.10,
+            'salary_score': 0.05
+        }
+        
+        # Normalized skill-phrase embeddings shared across resumes and jobs
+        self.skill_embedding_cache: Dict[str, np.ndarray] = {}
+        
         # Initialize models
         self._initialize_models()
         
@@ -102,21 +126,30 @@ class AIJobMatcher:
             'onsite_different_country': 0.2
         }
         
+    @staticmethod
+    def _load_model(name: str, label: str):
+        """Fetch a model from the shared registry, loading it on first use"""
+        try:
+            return get_model(name)
+        except Exception as e:
+            if name not in _MODEL_LOAD_WARNINGS:
+                _MODEL_LOAD_WARNINGS.add(name)
+                print(f"⚠️  Error loading {label}: {e}")
+            return None
+    
+    @property
+    def sentence_model(self):
+        """Sentence transformer for semantic similarity (lazy)"""
+        return self._load_model(SENTENCE_MODEL_NAME, "sentence transformer model")
+    
+    @property
+    def skill_classifier(self):
+        """Zero-shot skill classification pipeline (lazy)"""
+        return self._load_model(SKILL_CLASSIFIER_NAME, "skill classification model")
+    
     def _initialize_models(self):
-        """Initialize AI models for matching"""
+        """Initialize AI clients for matching"""
         try:
-            # Load sentence transformer for semantic similarity
-            self.sentence_model = SentenceTransformer('all-MiniLM-L6-v2')
-            print("✅ Sentence transformer model loaded")
-            
-            # Initialize skill classification pipeline
-            self.skill_classifier = pipeline(
-                'zero-shot-classification',
-                model='facebook/bart-large-mnli',
-                device=0 if torch.cuda.is_available() else -1
-            )
-            print("✅ Skill classification model loaded")
-            
             # Initialize OpenAI client if API key is available
             openai_api_key = os.getenv('OPENAI_API_KEY')
             if openai_api_key:
@@ -133,58 +166,69 @@ class AIJobMatcher:
         self, 
         resume: ParsedResume, 
         job: JobRequirement,
-        user_preferences: Dict = None
+        user_preferences: Dict = None,
+        skill_score: Optional[float] = None
     ) -> MatchResult:
-        """Calculate comprehensive match score between resume and job"""
+        """Calculate comprehensive match score between resume and job
+        
+        ``skill_score`` may be supplied when it was already computed for a
+        batch of jobs (see ``batch_match_jobs``).
+        """
         
         # Default user preferences
         if not user_preferences:
-            user_preferences = {
-                'preferred_locations': ['Remote', 'Berlin', 'Munich'],
-                'min_salary': 70000,
-                'job_types': ['full-time'],
-                'industries': ['Technology', 'Financial Services'],
-                'company_sizes': ['Startup', 'Medium', 'Large']
-            }
+            user_preferences = self._default_preferences()
         
         print(f"🎯 Analyzing match for: {job.title} @ {job.company}")
         
         # Calculate individual match scores
-        skill_score = self._calculate_skill_match(resume, job)
-        experience_score = self._calculate_experience_match(resume, job)
-        education_score = self._calculate_education_match(resume, job)
-        location_score = self._calculate_location_match(resume, job, user_preferences)
-        culture_score = self._calculate_culture_fit(resume, job)
-        salary_score = self._calculate_salary_compatibility(resume, job, user_preferences)
-        
-        # Calculate weighted overall score
-        weights = {
-            'skills': 0.35,
-            'experience': 0.25,
-            'education': 0.10,
-            'location': 0.15,
-            'culture': 0.10,
-            'salary': 0.05
-        }
+        if skill_score is None:
+            skill_score = self._calculate_skill_match(resume, job)
+        scores = {'skill_score': skill_score}
+        scores.update(self._calculate_cheap_scores(resume, job, user_preferences))
         
-        overall_score = (
-            skill_score * weights['skills'] +
-            experience_score * weights['experience'] +
-            education_score * weights['education'] +
-            location_score * weights['location'] +
-            culture_score * weights['culture'] +
-            salary_score * weights['salary']
-        )
+        return self._build_match_result(resume, job, scores)
+    
+    @staticmethod
+    def _default_preferences() -> Dict:
+        return {
+            'preferred_locations': ['Remote', 'Berlin', 'Munich'],
+            'min_salary': 70000,
+            'job_types': ['full-time'],
+            'industries': ['Technology', 'Financial Services'],
+            'company_sizes': ['Startup', 'Medium', 'Large']
+        }
+    
+    def _calculate_cheap_scores(
+        self, 
+        resume: ParsedResume, 
+        job: JobRequirement, 
+        user_preferences: Dict
+    ) -> Dict[str, float]:
+        """Sub-scores that need no model calls (everything except skills)"""
+        return {
+            'experience_score': self._calculate_experience_match(resume, job),
+            'education_score': self._calculate_education_match(resume, job),
+            'location_score': self._calculate_location_match(resume, job, user_preferences),
+            'culture_score': self._calculate_culture_fit(resume, job),
+            'salary_score': self._calculate_salary_compatibility(resume, job, user_preferences)
+        }
+    
+    def _weighted_score(self, scores: Dict[str, float]) -> float:
+        """Calculate weighted overall score"""
+        return sum(scores[name] * weight for name, weight in self.match_weights.items())
+    
+    def _build_match_result(
+        self, 
+        resume: ParsedResume, 
+        job: JobRequirement, 
+        scores: Dict[str, float]
+    ) -> MatchResult:
+        """Assemble the full MatchResult (analysis, recommendation, skill lists)"""
+        overall_score = self._weighted_score(scores)
         
         # Detailed analysis
-        detailed_analysis = self._generate_detailed_analysis(resume, job, {
-            'skill_score': skill_score,
-            'experience_score': experience_score,
-            'education_score': education_score,
-            'location_score': location_score,
-            'culture_score': culture_score,
-            'salary_score': salary_score
-        })
+        detailed_analysis = self._generate_detailed_analysis(resume, job, scores)
         
         # Generate recommendation
         recommendation = self._generate_recommendation(overall_score, detailed_analysis)
@@ -199,12 +243,12 @@ class AIJobMatcher:
         return MatchResult(
             job_id=job.id,
             overall_score=overall_score,
-            skill_match_score=skill_score,
-            experience_match_score=experience_score,
-            education_match_score=education_score,
-            location_match_score=location_score,
-            culture_fit_score=culture_score,
-            salary_compatibility=salary_score,
+            skill_match_score=scores['skill_score'],
+            experience_match_score=scores['experience_score'],
+            education_match_score=scores['education_score'],
+            location_match_score=scores['location_score'],
+            culture_fit_score=scores['culture_score'],
+            salary_compatibility=scores['salary_score'],
             detailed_analysis=detailed_analysis,
             recommendation=recommendation,
             missing_skills=missing_skills,
@@ -214,59 +258,82 @@ class AIJobMatcher:
     
     def _calculate_skill_match(self, resume: ParsedResume, job: JobRequirement) -> float:
         """Calculate skill matching score using semantic similarity"""
+        return float(self._calculate_skill_matches(resume, [job])[0])
+    
+    def _candidate_skills(self, resume: ParsedResume) -> List[str]:
+        """Flatten the candidate's categorized skills"""
+        candidate_skills = []
+        for skill_category in resume.skills.values():
+            candidate_skills.extend(skill_category)
+        return candidate_skills
+    
+    def _encode_skills(self, skills: List[str]) -> np.ndarray:
+        """Return normalized embeddings for skill phrases, encoding only unseen ones"""
+        missing = [skill for skill in dict.fromkeys(skills) if skill not in self.skill_embedding_cache]
+        if missing:
+            embeddings = np.asarray(self.sentence_model.encode(missing), dtype=np.float32)
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            self.skill_embedding_cache.update(zip(missing, embeddings / norms))
+        return np.stack([self.skill_embedding_cache[skill] for skill in skills])
+    
+    def _calculate_skill_matches(self, resume: ParsedResume, jobs: List[JobRequirement]) -> np.ndarray:
+        """Calculate skill matching scores for a batch of jobs in one pass
+        
+        The candidate's skills and every distinct job skill phrase are embedded
+        once (phrases are cached across calls); a single similarity matrix is
+        reduced to the best candidate match per phrase, then averaged per job
+        over its required and preferred skills.
+        """
+        scores = np.zeros(len(jobs), dtype=np.float32)
+        candidate_skills = self._candidate_skills(resume)
+        if not candidate_skills or not jobs:
+            return scores
+        
+        def keyword_scores():
+            # Fallback to keyword matching
+            return np.array([
+                self._keyword_skill_match(candidate_skills, job.required_skills + job.preferred_skills)
+                for job in jobs
+            ])
+        
+        if not self.sentence_model:
+            return keyword_scores()
+        
         try:
-            # Get all candidate skills
-            candidate_skills = []
-            for skill_category in resume.skills.values():
-                candidate_skills.extend(skill_category)
+            # Vocabulary of distinct job skill phrases across the batch
+            vocabulary: Dict[str, int] = {}
+            required_pairs, preferred_pairs = [], []
+            for job_idx, job in enumerate(jobs):
+                for skill in job.required_skills:
+                    required_pairs.append((job_idx, vocabulary.setdefault(skill, len(vocabulary))))
+                for skill in job.preferred_skills:
+                    preferred_pairs.append((job_idx, vocabulary.setdefault(skill, len(vocabulary))))
+            if not vocabulary:
+                return scores
             
-            # Combine required and preferred job skills
-            job_skills = job.required_skills + job.preferred_skills
+            candidate_matrix = self._encode_skills(candidate_skills)
+            vocabulary_matrix = self._encode_skills(list(vocabulary))
             
-            if not candidate_skills or not job_skills:
-                return 0.0
+            # Best matching candidate skill for every job skill phrase
+            best_match = (candidate_matrix @ vocabulary_matrix.T).max(axis=0)
             
-            # Use sentence transformer for semantic similarity
-            if self.sentence_model:
-                # Create embeddings
-                candidate_embeddings = self.sentence_model.encode(candidate_skills)
-                job_embeddings = self.sentence_model.encode(job_skills)
-                
-                # Calculate similarity matrix
-                similarity_matrix = cosine_similarity(candidate_embeddings, job_embeddings)
-                
-                # Calculate match score
-                # For each required skill, find best matching candidate skill
-                required_matches = []
-                for i, job_skill in enumerate(job.required_skills):
-                    if i < len(job_embeddings):
-                        best_match = np.max(similarity_matrix[:, i])
-                        required_matches.append(best_match)
-                
-                # Required skills have higher weight
-                required_score = np.mean(required_matches) if required_matches else 0.0
-                
-                # Preferred skills
-                preferred_matches = []
-                for i, job_skill in enumerate(job.preferred_skills):
-                    job_idx = i + len(job.required_skills)
-                    if job_idx < len(job_embeddings):
-                        best_match = np.max(similarity_matrix[:, job_idx])
-                        preferred_matches.append(best_match)
-                
-                preferred_score = np.mean(preferred_matches) if preferred_matches else 0.0
-                
-                # Weighted combination (required skills more important)
-                final_score = (required_score * 0.8 + preferred_score * 0.2)
-                
-                return min(final_score, 1.0)
+            def masked_mean(pairs):
+                if not pairs:
+                    return np.zeros(len(jobs), dtype=np.float32)
+                job_idx, vocab_idx = np.asarray(pairs).T
+                totals = np.bincount(job_idx, weights=best_match[vocab_idx], minlength=len(jobs))
+                counts = np.bincount(job_idx, minlength=len(jobs))
+                return np.divide(totals, counts, out=np.zeros(len(jobs)), where=counts > 0)
             
-            # Fallback to keyword matching
-            return self._keyword_skill_match(candidate_skills, job_skills)
+            # Weighted combination (required skills more important)
+            scores = masked_mean(required_pairs) * 0.8 + masked_mean(preferred_pairs) * 0.2
+            has_skills = np.array([bool(job.required_skills or job.preferred_skills) for job in jobs])
+            return np.where(has_skills, np.minimum(scores, 1.0), 0.0)
             
         except Exception as e:
             print(f"Error calculating skill match: {e}")
-            return self._keyword_skill_match(candidate_skills, job_skills)
+            return keyword_scores()
     
     def _keyword_skill_match(self, candidate_skills: List[str], job_skills: List[str]) -> float:
         """Fallback keyword-based skill matching"""
@@ -562,16 +629,46 @@ class AIJobMatcher:
         resume: ParsedResume, 
         jobs: List[JobRequirement],
         user_preferences: Dict = None,
-        top_n: int = 20
+        top_n: int = 20,
+        two_stage: bool = False,
+        skill_bound_slack: Optional[float] = None
     ) -> List[MatchResult]:
-        """Match resume against multiple jobs and return top matches"""
+        """Match resume against multiple jobs and return top matches
+        
+        With ``two_stage`` enabled, a cheap pre-score (experience, education,
+        location, culture, salary) bounds each job's best possible overall
+        score, and jobs that cannot reach the current top-N threshold are
+        pruned before semantic skill scoring.  The full analysis is then built
+        only for the final top-N.
+        
+        Without ``skill_bound_slack`` the skill score is only known to lie in
+        its full range ([-1, 1] for cosine similarity, [0, 1] for keyword
+        matching), which is exact but prunes a job only when its cheap
+        sub-scores trail the top-N by more than the skill weight -- in practice
+        almost never, so stage 1 is then close to a no-op and the saving comes
+        from building the full analysis for the top-N only.  ``skill_bound_slack``
+        bounds the skill score by keyword overlap +/- slack instead; this prunes
+        far more but is a heuristic and can drop a job whose semantic skill
+        match differs from its keyword overlap by more than the slack.
+        """
         
         print(f"🎯 Matching resume against {len(jobs)} jobs...")
         
+        if two_stage:
+            return self._two_stage_match(
+                resume, jobs, user_preferences or self._default_preferences(),
+                top_n, skill_bound_slack
+            )
+        
+        # Skill scores for the whole batch come from a single similarity pass
+        skill_scores = self._calculate_skill_matches(resume, jobs)
+        
         matches = []
         for i, job in enumerate(jobs):
             try:
-                match_result = self.calculate_comprehensive_match(resume, job, user_preferences)
+                match_result = self.calculate_comprehensive_match(
+                    resume, job, user_preferences, skill_score=float(skill_scores[i])
+                )
                 matches.append(match_result)
                 
                 if (i + 1) % 10 == 0:
@@ -581,6 +678,9 @@ class AIJobMatcher:
                 print(f"   ❌ Error matching job {job.id}: {e}")
                 continue
         
+        return self._report_top_matches(matches, top_n)
+    
+    def _report_top_matches(self, matches: List[MatchResult], top_n: int) -> List[MatchResult]:
         # Sort by overall score (descending)
         matches.sort(key=lambda x: x.overall_score, reverse=True)
         
@@ -590,6 +690,71 @@ class AIJobMatcher:
         
         return matches[:top_n]
     
+    def _two_stage_match(
+        self, 
+        resume: ParsedResume, 
+        jobs: List[JobRequirement],
+        user_preferences: Dict,
+        top_n: int,
+        skill_bound_slack: Optional[float]
+    ) -> List[MatchResult]:
+        """Prune with cheap score bounds, then fully score only survivors"""
+        
+        # Stage 1: cheap sub-scores and bounds on the overall score
+        cheap_scores, kept_jobs = [], []
+        for job in jobs:
+            try:
+                cheap_scores.append(self._calculate_cheap_scores(resume, job, user_preferences))
+                kept_jobs.append(job)
+            except Exception as e:
+                print(f"   ❌ Error matching job {job.id}: {e}")
+        if not kept_jobs:
+            return []
+        jobs = kept_jobs
+        
+        skill_weight = self.match_weights['skill_score']
+        base = np.array([
+            sum(scores[name] * weight for name, weight in self.match_weights.items() if name != 'skill_score')
+            for scores in cheap_scores
+        ])
+        if skill_bound_slack is None:
+            # Full range of the skill score (cosine means can be negative)
+            skill_low = np.full(len(jobs), -1.0 if self.sentence_model else 0.0)
+            skill_high = np.ones(len(jobs))
+        else:
+            candidate_skills = self._candidate_skills(resume)
+            overlap = np.array([
+                self._keyword_skill_match(candidate_skills, job.required_skills + job.preferred_skills)
+                for job in jobs
+            ])
+            skill_low = np.clip(overlap - skill_bound_slack, 0.0, 1.0)
+            skill_high = np.clip(overlap + skill_bound_slack, 0.0, 1.0)
+        lower = base + skill_weight * skill_low
+        upper = base + skill_weight * skill_high
+        
+        # A job survives if its best case can still reach the N-th best worst case
+        keep = min(top_n, len(jobs))
+        threshold = np.partition(lower, len(lower) - keep)[len(lower) - keep]
+        survivors = np.flatnonzero(upper >= threshold)
+        print(f"   Stage 1 kept {len(survivors)}/{len(jobs)} jobs (threshold {threshold:.2%})")
+        
+        # Stage 2: semantic skill scoring for survivors in one vectorized pass
+        survivor_jobs = [jobs[i] for i in survivors]
+        skill_scores = self._calculate_skill_matches(resume, survivor_jobs)
+        overall = base[survivors] + skill_weight * skill_scores
+        
+        # Full analysis only for the final top-N
+        order = np.argsort(-overall, kind='stable')[:top_n]
+        finalists = []
+        for rank in order:
+            scores = dict(cheap_scores[survivors[rank]])
+            scores['skill_score'] = float(skill_scores[rank])
+            finalists.append((survivor_jobs[rank], scores))
+        
+        matches = [self._build_match_result(resume, job, scores) for job, scores in finalists]
+        
+        return self._report_top_matches(matches, top_n)
+    
     def generate_application_insights(self, match: MatchResult, resume: ParsedResume) -> Dict:
         """Generate insights for job application optimization"""
         insights = {
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+LLM Response Cache
+Persistent, content-addressed cache of LLM completions shared by the AI modules
+"""
+
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = "data/llm_cache.sqlite"
+DEFAULT_TTL = 7 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 5000
+
+# Cache hits refresh their LRU timestamp in batches of this many writes
+TOUCH_BATCH = 64
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Collapse whitespace so re-indented or re-wrapped prompts share a key."""
+    return _WHITESPACE.sub(" ", prompt or "").strip()
+
+
+class LLMResponseCache:
+    """SQLite cache of completions keyed on provider, model, prompt and parameters
+
+    Entries expire ``ttl`` seconds after they are written. When the cache grows
+    past ``max_entries``, the least recently read entries are evicted down to
+    90% of the limit. Read timestamps are buffered and written ``touch_batch``
+    at a time (and before eviction or close), so hits do not commit. Values
+    may be any JSON-serialisable object.
+    """
+
+    def __init__(self,
+                 path: str = DEFAULT_CACHE_PATH,
+                 ttl: Optional[float] = DEFAULT_TTL,
+                 max_entries: int = DEFAULT_MAX_ENTRIES,
+                 touch_batch: int = TOUCH_BATCH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.touch_batch = touch_batch
+        self._touched: Dict[str, float] = {}
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, provider TEXT, model TEXT, value TEXT NOT NULL, "
+            "created REAL NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses(accessed)")
+        self._conn.commit()
+        self._count = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    @staticmethod
+    def make_key(provider: str, model: str, prompt: str,
+                 params: Optional[Dict[str, Any]] = None, system: str = "") -> str:
+        payload = json.dumps(
+            [provider, model, normalize_prompt(system), normalize_prompt(prompt), params or {}],
+            sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT value, created FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            value, created = row
+            if self.ttl is not None and now - created > self.ttl:
+                self._touched.pop(key, None)
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                self._count -= 1
+                self.expired += 1
+                self.misses += 1
+                return None
+            self._touched[key] = now
+            if len(self._touched) >= self.touch_batch:
+                self._flush_touches()
+                self._conn.commit()
+            self.hits += 1
+        return json.loads(value)
+
+    def put(self, key: str, value: Any, provider: str = "", model: str = "") -> None:
+        now = time.time()
+        with self._lock:
+            inserted = self._conn.execute(
+                "INSERT OR IGNORE INTO responses (key, provider, model, value, created, accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, provider, model, json.dumps(value, default=str), now, now)
+            ).rowcount
+            if not inserted:
+                self._conn.execute(
+                    "UPDATE responses SET value = ?, created = ?, accessed = ? WHERE key = ?",
+                    (json.dumps(value, default=str), now, now, key)
+                )
+            self._touched.pop(key, None)
+            self._count += inserted
+            if self._count > self.max_entries:
+                self._evict()
+            self._conn.commit()
+
+    def _flush_touches(self) -> None:
+        if self._touched:
+            self._conn.executemany(
+                "UPDATE responses SET accessed = ? WHERE key = ?",
+                [(accessed, key) for key, accessed in self._touched.items()]
+            )
+            self._touched.clear()
+
+    def _evict(self) -> None:
+        self._flush_touches()
+        # Drop expired rows first, then the least recently read ones
+        if self.ttl is not None:
+            removed = self._conn.execute(
+                "DELETE FROM responses WHERE created < ?", (time.time() - self.ttl,)
+            ).rowcount
+            self.expired += removed
+            self._count -= removed
+        excess = self._count - int(self.max_entries * 0.9)
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN "
+                "(SELECT key FROM responses ORDER BY accessed LIMIT ?)", (excess,)
+            )
+            self.evictions += excess
+            self._count -= excess
+
+    def get_or_call(self, provider: str, model: str, prompt: str, call: Callable[[], Optional[Any]],
+                    params: Optional[Dict[str, Any]] = None, system: str = "") -> Optional[Any]:
+        """Return the cached value, or run ``call`` and cache a non-empty result."""
+        key = self.make_key(provider, model, prompt, params, system)
+        value = self.get(key)
+        if value is None:
+            value = call()
+            if value:
+                self.put(key, value, provider, model)
+        return value
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": self._count,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "expired": self.expired,
+            "evictions": self.evictions,
+            "cache_file": str(self.path),
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._touched.clear()
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+            self._count = 0
+
+    def flush(self) -> None:
+        """Write buffered read timestamps."""
+        with self._lock:
+            self._flush_touches()
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_touches()
+            self._conn.commit()
+            self._conn.close()
+
+
+_shared: Dict[str, LLMResponseCache] = {}
+_shared_lock = threading.Lock()
+
+
+def get_llm_cache(path: str = DEFAULT_CACHE_PATH) -> LLMResponseCache:
+    """Process-wide cache instance for ``path``."""
+    with _shared_lock:
+        if path not in _shared:
+            _shared[path] = LLMResponseCache(path)
+        return _shared[path]
+
+
+def cached_completion(cache: Optional[LLMResponseCache], provider: str, model: str, prompt: str,
+                      call: Callable[[], Optional[Any]], params: Optional[Dict[str, Any]] = None,
+                      system: str = "") -> Optional[Any]:
+    """Run ``call`` through ``cache`` when one is configured, else just run it."""
+    if cache is None:
+        return call()
+    return cache.get_or_call(provider, model, prompt, call, params, system)
+
+
+def resolve_llm_cache(llm_cache: Union[LLMResponseCache, bool, None]) -> Optional[LLMResponseCache]:
+    """Map a module's ``llm_cache`` option to a cache: True uses the shared default."""
+    if llm_cache is True:
+        return get_llm_cache()
+    if isinstance(llm_cache, LLMResponseCache):
+        return llm_cache
+    return None
@@ -7,12 +7,19 @@ Integrates OpenAI, Anthropic (Claude), and Google Gemini for enhanced AI capabil
 import os
 import logging
 import json
+import sys
+import time
+from pathlib import Path
 from typing import Dict, List, Optional, Any, Union
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
 import asyncio
 from dotenv import load_dotenv
 
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.ml.ai_client_pool import client_pool, coalescer, pooled_http_client
+from src.ml.llm_cache import LLMResponseCache, resolve_llm_cache
+
 # Load environment variables
 load_dotenv()
 
@@ -24,7 +31,7 @@ except ImportError:
     HAS_OPENAI = False
 
 try:
-    from anthropic import Anthropic
+    from anthropic import AsyncAnthropic
     HAS_ANTHROPIC = True
 except ImportError:
     HAS_ANTHROPIC = False
@@ -41,6 +48,20 @@ class AIProvider(Enum):
     ANTHROPIC = "anthropic"
     GEMINI = "gemini"
 
+# Model requested from each provider; part of the LLM cache key
+PROVIDER_MODELS = {
+    AIProvider.OPENAI: "gpt-3.5-turbo",
+    AIProvider.ANTHROPIC: "claude-3-sonnet-20240229",
+    AIProvider.GEMINI: "gemini-1.5-flash",
+}
+
+# Generation parameters sent to each provider; also part of the LLM cache key
+PROVIDER_PARAMS = {
+    AIProvider.OPENAI: {"max_tokens": 1000, "temperature": 0.7},
+    AIProvider.ANTHROPIC: {"max_tokens": 1000},
+    AIProvider.GEMINI: {},
+}
+
 @dataclass
 class AIResponse:
     """Standardized AI response"""
@@ -56,13 +77,22 @@ class AIResponse:
 class MultiAIService:
     """Multi-AI service integration for enhanced resume processing"""
     
-    def __init__(self):
+    def __init__(self, hedge_after: Optional[float] = None, coalesce: bool = True,
+                 llm_cache: Union[LLMResponseCache, bool, None] = None):
+        """
+        Args:
+            hedge_after: if set, seconds to wait on a provider before also
+                firing the next one; the first successful answer wins.
+                ``None`` keeps strict one-after-another fallback.
+            coalesce: share one in-flight call among concurrent identical
+                requests.
+            llm_cache: opt-in persistent response cache; ``True`` uses the
+                shared default cache file.
+        """
         self.logger = logging.getLogger(__name__)
-        
-        # Initialize available services
-        self.openai_client = None
-        self.anthropic_client = None
-        self.gemini_client = None
+        self.hedge_after = hedge_after
+        self.coalesce = coalesce
+        self.llm_cache = resolve_llm_cache(llm_cache)
         
         self._initialize_services()
         
@@ -70,13 +100,21 @@ class MultiAIService:
         self.service_priority = [AIProvider.OPENAI, AIProvider.ANTHROPIC, AIProvider.GEMINI]
         
     def _initialize_services(self):
-        """Initialize available AI services"""
+        """Register available AI services with the shared client pool
+        
+        Clients are created lazily, one per provider and event loop, and are
+        shared by every ``MultiAIService`` instance in the process.
+        """
         
         # Initialize OpenAI
         if HAS_OPENAI and os.getenv("OPENAI_API_KEY"):
             try:
-                openai.api_key = os.getenv("OPENAI_API_KEY")
-                self.openai_client = openai
+                api_key = os.getenv("OPENAI_API_KEY")
+                client_pool.register(
+                    AIProvider.OPENAI.value,
+                    lambda: openai.AsyncOpenAI(api_key=api_key, http_client=pooled_http_client()),
+                    api_key=api_key
+                )
                 self.logger.info("OpenAI service initialized")
             except Exception as e:
                 self.logger.error(f"Failed to initialize OpenAI: {e}")
@@ -84,7 +122,12 @@ class MultiAIService:
         # Initialize Anthropic (Claude)
         if HAS_ANTHROPIC and os.getenv("ANTHROPIC_API_KEY"):
             try:
-                self.anthropic_client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+                api_key = os.getenv("ANTHROPIC_API_KEY")
+                client_pool.register(
+                    AIProvider.ANTHROPIC.value,
+                    lambda: AsyncAnthropic(api_key=api_key, http_client=pooled_http_client()),
+                    api_key=api_key
+                )
                 self.logger.info("Anthropic (Claude) service initialized")
             except Exception as e:
                 self.logger.error(f"Failed to initialize Anthropic: {e}")
@@ -92,22 +135,42 @@ class MultiAIService:
         # Initialize Google Gemini
         if HAS_GEMINI and os.getenv("GEMINI_API_KEY"):
             try:
-                genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
-                self.gemini_client = genai
+                api_key = os.getenv("GEMINI_API_KEY")
+                genai.configure(api_key=api_key)
+                client_pool.register(AIProvider.GEMINI.value, lambda: genai, api_key=api_key)
                 self.logger.info("Google Gemini service initialized")
             except Exception as e:
                 self.logger.error(f"Failed to initialize Gemini: {e}")
     
+    @property
+    def openai_client(self):
+        return client_pool.get(AIProvider.OPENAI.value)
+    
+    @property
+    def anthropic_client(self):
+        return client_pool.get(AIProvider.ANTHROPIC.value)
+    
+    @property
+    def gemini_client(self):
+        return client_pool.get(AIProvider.GEMINI.value)
+    
+    async def aclose(self):
+        """Close the pooled provider clients opened on the running event loop
+        
+        The clients are shared with other instances on the same loop; any
+        later call opens fresh ones.
+        """
+        await client_pool.aclose()
+    
+    async def __aenter__(self) -> "MultiAIService":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
     def get_available_services(self) -> List[AIProvider]:
         """Get list of available AI services"""
-        available = []
-        if self.openai_client:
-            available.append(AIProvider.OPENAI)
-        if self.anthropic_client:
-            available.append(AIProvider.ANTHROPIC)
-        if self.gemini_client:
-            available.append(AIProvider.GEMINI)
-        return available
+        return [provider for provider in AIProvider if client_pool.is_registered(provider.value)]
     
     async def enhance_resume_summary(
         self, 
@@ -315,33 +378,45 @@ class MultiAIService:
         prompt: str,
         system_message: str,
         preferred_provider: Optional[AIProvider] = None,
-        task: str = "general"
+        task: str = "general",
+        hedge_after: Optional[float] = None
     ) -> AIResponse:
-        """Call AI service with fallback support"""
+        """Call AI service with fallback support
+        
+        Identical concurrent requests share one provider call. With
+        ``hedge_after`` (or the instance default) a slow provider is raced
+        against the next one in line instead of waiting for it to fail.
+        """
         
-        import time
         start_time = time.time()
+        hedge_after = self.hedge_after if hedge_after is None else hedge_after
         
         # Determine service order
+        available = self.get_available_services()
         services_to_try = []
-        if preferred_provider and preferred_provider in self.get_available_services():
+        if preferred_provider and preferred_provider in available:
             services_to_try.append(preferred_provider)
         
         # Add other available services as fallbacks
         for provider in self.service_priority:
-            if provider not in services_to_try and provider in self.get_available_services():
+            if provider not in services_to_try and provider in available:
                 services_to_try.append(provider)
         
-        # Try each service
-        for provider in services_to_try:
-            try:
-                response = await self._call_specific_service(provider, prompt, system_message)
-                response.processing_time = time.time() - start_time
-                return response
-                
-            except Exception as e:
-                self.logger.warning(f"{provider.value} failed for task {task}: {e}")
-                continue
+        async def call() -> Optional[AIResponse]:
+            cached = self._cached_response(services_to_try, prompt, system_message)
+            if cached is not None:
+                return cached
+            return await self._race_services(services_to_try, prompt, system_message, task, hedge_after)
+        
+        if self.coalesce:
+            key = coalescer.make_key([p.value for p in services_to_try], hedge_after, system_message, prompt)
+            response = await coalescer.run(key, call)
+        else:
+            response = await call()
+        
+        if response is not None:
+            # Coalesced callers share the result object; give each its own copy
+            return replace(response, processing_time=time.time() - start_time)
         
         # All services failed
         return AIResponse(
@@ -353,6 +428,75 @@ class MultiAIService:
             processing_time=time.time() - start_time
         )
     
+    async def _race_services(
+        self,
+        services: List[AIProvider],
+        prompt: str,
+        system_message: str,
+        task: str,
+        hedge_after: Optional[float]
+    ) -> Optional[AIResponse]:
+        """Return the first successful response, or None if every service failed
+        
+        A provider is started when the previous one fails or, when hedging,
+        once ``hedge_after`` seconds pass without an answer.
+        """
+        queue = list(services)
+        running: Dict[asyncio.Future, AIProvider] = {}
+        
+        def launch():
+            provider = queue.pop(0)
+            task_future = asyncio.ensure_future(self._call_specific_service(provider, prompt, system_message))
+            running[task_future] = provider
+        
+        if queue:
+            launch()
+        try:
+            while running:
+                timeout = hedge_after if queue and hedge_after is not None else None
+                done, _ = await asyncio.wait(running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    self.logger.info(f"{running[next(iter(running))].value} slow for task {task}, hedging with {queue[0].value}")
+                    launch()
+                    continue
+                
+                for finished in done:
+                    provider = running.pop(finished)
+                    if finished.exception() is None:
+                        return finished.result()
+                    self.logger.warning(f"{provider.value} failed for task {task}: {finished.exception()}")
+                    if queue:
+                        launch()
+        finally:
+            for pending in running:
+                pending.cancel()
+        return None
+    
+    def _cache_key(self, provider: AIProvider, prompt: str, system_message: str) -> str:
+        return self.llm_cache.make_key(provider.value, PROVIDER_MODELS[provider], prompt,
+                                       PROVIDER_PARAMS[provider], system_message)
+    
+    def _cached_response(
+        self,
+        providers: List[AIProvider],
+        prompt: str,
+        system_message: str
+    ) -> Optional[AIResponse]:
+        """First cached answer among ``providers``, in priority order"""
+        if self.llm_cache is None:
+            return None
+        for provider in providers:
+            cached = self.llm_cache.get(self._cache_key(provider, prompt, system_message))
+            if cached is not None:
+                return AIResponse(
+                    content=cached["content"],
+                    provider=provider,
+                    model=cached["model"],
+                    tokens_used=cached.get("tokens_used"),
+                    cost_estimate=0.0
+                )
+        return None
+    
     async def _call_specific_service(
         self, 
         provider: AIProvider, 
@@ -362,24 +506,32 @@ class MultiAIService:
         """Call specific AI service"""
         
         if provider == AIProvider.OPENAI and self.openai_client:
-            return await self._call_openai(prompt, system_message)
+            response = await self._call_openai(prompt, system_message)
         elif provider == AIProvider.ANTHROPIC and self.anthropic_client:
-            return await self._call_anthropic(prompt, system_message)
+            response = await self._call_anthropic(prompt, system_message)
         elif provider == AIProvider.GEMINI and self.gemini_client:
-            return await self._call_gemini(prompt, system_message)
+            response = await self._call_gemini(prompt, system_message)
         else:
             raise ValueError(f"Service {provider.value} not available")
+        
+        if self.llm_cache is not None and response.success and response.content:
+            self.llm_cache.put(
+                self._cache_key(provider, prompt, system_message),
+                {"content": response.content, "model": response.model, "tokens_used": response.tokens_used},
+                provider.value,
+                PROVIDER_MODELS[provider]
+            )
+        return response
     
     async def _call_openai(self, prompt: str, system_message: str) -> AIResponse:
         """Call OpenAI GPT"""
         response = await self.openai_client.chat.completions.create(
-            model="gpt-3.5-turbo",
+            model=PROVIDER_MODELS[AIProvider.OPENAI],
             messages=[
                 {"role": "system", "content": system_message},
                 {"role": "user", "content": prompt}
             ],
-            max_tokens=1000,
-            temperature=0.7
+            **PROVIDER_PARAMS[AIProvider.OPENAI]
         )
         
         return AIResponse(
@@ -393,9 +545,9 @@ class MultiAIService:
     async def _call_anthropic(self, prompt: str, system_message: str) -> AIResponse:
         """Call Anthropic Claude"""
         message = await self.anthropic_client.messages.create(
-            model="claude-3-sonnet-20240229",
-            max_tokens=1000,
+            model=PROVIDER_MODELS[AIProvider.ANTHROPIC],
             system=system_message,
+            **PROVIDER_PARAMS[AIProvider.ANTHROPIC],
             messages=[{"role": "user", "content": prompt}]
         )
         
@@ -408,7 +560,7 @@ class MultiAIService:
     
     async def _call_gemini(self, prompt: str, system_message: str) -> AIResponse:
         """Call Google Gemini"""
-        model = self.gemini_client.GenerativeModel('gemini-1.5-flash')  # Use available model
+        model = self.gemini_client.GenerativeModel(PROVIDER_MODELS[AIProvider.GEMINI])  # Use available model
         
         full_prompt = f"{system_message}\n\nUser Request:\n{prompt}"
         
@@ -460,23 +612,22 @@ async def enhance_resume_with_ai(
 ) -> AIResponse:
     """Enhanced resume processing with multi-AI support"""
     
-    ai_service = MultiAIService()
-    
-    if task == "summary":
-        return await ai_service.enhance_resume_summary(resume_data, target_job)
-    elif task == "analysis":
-        return await ai_service.analyze_resume_quality(resume_data)
-    elif task == "job_match" and job_description:
-        return await ai_service.match_job_compatibility(resume_data, job_description)
-    elif task == "ats_optimization":
-        keywords = job_description.split() if job_description else []
-        return await ai_service.optimize_for_ats(resume_data, keywords)
-    elif task == "cover_letter" and job_description:
-        return await ai_service.generate_cover_letter(
-            resume_data, job_description, "Company", "Position"
-        )
-    else:
-        raise ValueError(f"Unknown task: {task}")
+    async with MultiAIService() as ai_service:
+        if task == "summary":
+            return await ai_service.enhance_resume_summary(resume_data, target_job)
+        elif task == "analysis":
+            return await ai_service.analyze_resume_quality(resume_data)
+        elif task == "job_match" and job_description:
+            return await ai_service.match_job_compatibility(resume_data, job_description)
+        elif task == "ats_optimization":
+            keywords = job_description.split() if job_description else []
+            return await ai_service.optimize_for_ats(resume_data, keywords)
+        elif task == "cover_letter" and job_description:
+            return await ai_service.generate_cover_letter(
+                resume_data, job_description, "Company", "Position"
+            )
+        else:
+            raise ValueError(f"Unknown task: {task}")
 
 if __name__ == "__main__":
     # Test the multi-AI service
@@ -496,7 +647,8 @@ if __name__ == "__main__":
         }
         
         # Test summary enhancement
-        response = await ai_service.enhance_resume_summary(sample_resume)
+        async with ai_service:
+            response = await ai_service.enhance_resume_summary(sample_resume)
         
         if response.success:
             print(f"\n✅ AI Enhancement Success ({response.provider.value}):")
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Semantic Answer Index
+Per-category vector index of answered questions for near-duplicate answer reuse
+"""
+
+import logging
+import re
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIMILARITY_THRESHOLD = 0.85
+
+CURRENCY_CODES = {"usd", "eur", "gbp", "inr", "cad", "aud", "chf", "jpy", "sgd", "sek", "nok", "dkk", "pln"}
+
+_SENTENCES = re.compile(r"(?<=[.?!:;])\s+")
+_TOKENS = re.compile(r"[$€£¥₹]|[A-Za-z0-9][\w+#.\-]*[\w+#]|\w")
+_TECH_TOKEN = re.compile(r"\d|[+#]|\w\.\w")
+
+
+def question_entities(question: str, known_terms: Iterable[str] = ()) -> FrozenSet[str]:
+    """Skills, places, currencies and amounts named in a question (lower-cased)
+
+    Embeddings barely separate "Years of Python?" from "Years of Java?", so an
+    answer is only reused when both questions name the same entities.  A
+    token counts when it is capitalised mid-sentence, contains digits or
+    tech punctuation (C++, C#, Node.js), is a currency symbol or code, or is
+    one of ``known_terms`` (e.g. the profile's skills).
+    """
+    entities = set()
+    for sentence in _SENTENCES.split(question or ""):
+        for position, token in enumerate(_TOKENS.findall(sentence)):
+            lowered = token.lower()
+            if (not token[0].isalnum() or lowered in CURRENCY_CODES or _TECH_TOKEN.search(token)
+                    or (position and token[0].isupper() and token != "I")):
+                entities.add(lowered.rstrip("."))
+    lowered_question = f" {(question or '').lower()} "
+    for term in known_terms:
+        term = str(term).lower().strip()
+        if term and re.search(rf"(?<![\w+#]){re.escape(term)}(?![\w+#])", lowered_question):
+            entities.add(term)
+    return frozenset(entities)
+
+
+class SemanticAnswerIndex:
+    """Small exact cosine index of question embeddings, one matrix per bucket
+
+    Buckets are typically question categories (optionally combined with a job
+    context), so "How many years of Python experience do you have?" only ever
+    competes with other experience questions. ``encode`` maps a list of
+    questions to a row-normalised matrix.
+    """
+
+    def __init__(self, encode: Callable[[List[str]], np.ndarray],
+                 threshold: float = DEFAULT_SIMILARITY_THRESHOLD):
+        self.encode = encode
+        self.threshold = threshold
+        self._hashes: Dict[str, List[str]] = {}
+        self._vectors: Dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return sum(len(hashes) for hashes in self._hashes.values())
+
+    def add_many(self, items: Iterable[Tuple[str, str, str]]) -> None:
+        """Index ``(bucket, question_hash, question)`` triples with one encode call"""
+        items = [item for item in items if item[2]]
+        if not items:
+            return
+        vectors = self.encode([question for _, _, question in items])
+        for (bucket, question_hash, _), vector in zip(items, vectors):
+            self._append(bucket, question_hash, vector)
+
+    def add(self, bucket: str, question_hash: str, question: str) -> None:
+        self.add_many([(bucket, question_hash, question)])
+
+    def search(self, bucket: str, question: str,
+               accept: Optional[Callable[[str], bool]] = None) -> Optional[Tuple[str, float]]:
+        """Best ``(question_hash, similarity)`` in ``bucket`` at or above the threshold
+
+        With ``accept``, the most similar question whose hash it accepts wins.
+        """
+        matrix = self._vectors.get(bucket)
+        if matrix is None or not len(matrix):
+            return None
+        query = self.encode([question])[0]
+        scores = matrix @ query
+        for row in np.argsort(-scores, kind="stable"):
+            if scores[row] < self.threshold:
+                break
+            question_hash = self._hashes[bucket][row]
+            if accept is None or accept(question_hash):
+                return question_hash, float(scores[row])
+        return None
+
+    def _append(self, bucket: str, question_hash: str, vector: np.ndarray) -> None:
+        hashes = self._hashes.setdefault(bucket, [])
+        vector = np.asarray(vector, dtype=np.float32).reshape(1, -1)
+        if question_hash in hashes:
+            self._vectors[bucket][hashes.index(question_hash)] = vector[0]
+            return
+        hashes.append(question_hash)
+        matrix = self._vectors.get(bucket)
+        self._vectors[bucket] = vector if matrix is None else np.vstack([matrix, vector])
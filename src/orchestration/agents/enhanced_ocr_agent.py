@@ -5,13 +5,15 @@ Handles accurate text extraction from images and scanned PDFs using a multi-engi
 
 import asyncio
 import base64
+import contextlib
 import io
 import json
 import os
 import tempfile
 import logging
+import threading
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from pathlib import Path
 from PIL import Image, ImageEnhance, ImageFilter
 import pdf2image
@@ -23,6 +25,7 @@ except ImportError:
     CV2_AVAILABLE = False
 from datetime import datetime
 import concurrent.futures
+from concurrent.futures.process import BrokenProcessPool
 from difflib import SequenceMatcher
 
 try:
@@ -51,6 +54,9 @@ except ImportError:
 
 from .base_agent import BaseAgent, ProcessingResult
 
+class EngineUnavailableError(RuntimeError):
+    """An OCR engine could not be initialized in a pool worker."""
+
 class OCRAgent(BaseAgent):
     """
     📖 OCRAgent: Multi-engine text extraction with intelligent ensemble processing
@@ -78,6 +84,47 @@ class OCRAgent(BaseAgent):
         self.multilingual_support = True
         self.layout_preservation = True
         
+        # Page-parallel execution: CPU-bound local engines run in a long-lived
+        # process pool whose workers load the engine models once; network-bound
+        # engines stay on threads in this process. Each worker holds its own
+        # copy of every model, so the pool is kept small by default
+        settings = self.config.custom_settings or {}
+        self.use_process_pool = settings.get('use_process_pool', True)
+        self.process_pool_workers = settings.get('process_pool_workers', min(4, os.cpu_count() or 1))
+        self.process_pool_engines = {'paddleocr', 'easyocr', 'tesseract'}
+        self.engine_timeout = 60
+        self._ocr_pool = None
+        self._pool_slots = None
+        self._engine_init_lock = threading.Lock()
+        
+        # Engine cascade (opt-in): run engines cheapest-first (by observed time
+        # per unit of accuracy, from _calculate_engine_performance across runs)
+        # and stop once cascade_min_engines engines have produced text whose
+        # consensus reaches cascade_confidence_threshold. A single engine's
+        # self-reported confidence is never enough to skip the rest
+        self.engine_cascade = settings.get('engine_cascade', False)
+        self.cascade_confidence_threshold = 0.85
+        self.cascade_min_engines = 2
+        self.engine_cost_priors = {  # expected seconds per page before any history
+            'tesseract': 1.0,
+            'paddleocr': 2.0,
+            'easyocr': 3.0,
+            'google_vision': 4.0
+        }
+        self.engine_history = {}
+        
+        # PDF rasterization: pages are rendered one at a time at a DPI chosen
+        # from a low-resolution probe (page size and ink density), and at most
+        # max_pages_in_flight rendered pages wait for OCR at once
+        self.pdf_min_dpi = 200
+        self.pdf_max_dpi = 300
+        self.pdf_probe_dpi = 36
+        self.pdf_dense_ink_ratio = 0.08  # ink coverage treated as dense, small text
+        self.pdf_max_page_pixels = 2550 * 3300  # US Letter at 300 DPI
+        self.pdf_grayscale = False
+        self.pdf_render_to_disk = False
+        self.max_pages_in_flight = self.process_pool_workers
+        
         # Image preprocessing settings
         self.image_enhancement = {
             'contrast_factor': 1.2,
@@ -87,16 +134,27 @@ class OCRAgent(BaseAgent):
             'deskew': True
         }
         
-        # Initialize available OCR engines
-        self._initialize_ocr_engines()
+        # Initialize available OCR engines. With the process pool the local
+        # engine models are loaded by the workers, not here
+        if self._process_pool_enabled():
+            self._initialize_ocr_engines(set(self.engine_priorities) - self.process_pool_engines)
+            self._register_pooled_engines()
+        else:
+            self._initialize_ocr_engines()
+        
+        if not self.available_engines:
+            raise RuntimeError("No OCR engines available. Please install at least one OCR engine.")
         
         self.logger.info(f"📖 OCRAgent initialized with {len(self.available_engines)} engines: {self.available_engines}")
     
-    def _initialize_ocr_engines(self):
-        """Initialize all available OCR engines."""
+    def _initialize_ocr_engines(self, engines: Optional[set] = None):
+        """Initialize the available OCR engines (all of them unless ``engines`` is given)."""
+        
+        if engines is None:
+            engines = set(self.engine_priorities)
         
         # Google Vision API
-        if GOOGLE_VISION_AVAILABLE and os.getenv('GOOGLE_APPLICATION_CREDENTIALS'):
+        if 'google_vision' in engines and GOOGLE_VISION_AVAILABLE and os.getenv('GOOGLE_APPLICATION_CREDENTIALS'):
             try:
                 self.google_client = vision.ImageAnnotatorClient()
                 self.available_engines.append('google_vision')
@@ -106,7 +164,7 @@ class OCRAgent(BaseAgent):
                 self.logger.warning(f"⚠️ Google Vision API failed to initialize: {e}")
         
         # PaddleOCR
-        if PADDLEOCR_AVAILABLE:
+        if 'paddleocr' in engines and PADDLEOCR_AVAILABLE:
             try:
                 # Initialize with English and common languages
                 self.paddle_ocr = paddleocr.PaddleOCR(
@@ -122,7 +180,7 @@ class OCRAgent(BaseAgent):
                 self.logger.warning(f"⚠️ PaddleOCR failed to initialize: {e}")
         
         # EasyOCR
-        if EASYOCR_AVAILABLE:
+        if 'easyocr' in engines and EASYOCR_AVAILABLE:
             try:
                 self.easy_reader = easyocr.Reader(['en'], gpu=False)  # Add more languages as needed
                 self.available_engines.append('easyocr')
@@ -132,7 +190,7 @@ class OCRAgent(BaseAgent):
                 self.logger.warning(f"⚠️ EasyOCR failed to initialize: {e}")
         
         # Tesseract
-        if TESSERACT_AVAILABLE:
+        if 'tesseract' in engines and TESSERACT_AVAILABLE:
             try:
                 # Test Tesseract availability
                 pytesseract.get_tesseract_version()
@@ -142,8 +200,48 @@ class OCRAgent(BaseAgent):
             except Exception as e:
                 self.logger.warning(f"⚠️ Tesseract failed to initialize: {e}")
         
-        if not self.available_engines:
-            raise RuntimeError("No OCR engines available. Please install at least one OCR engine.")
+        # Keep engine_priorities order whichever call registered an engine
+        self.available_engines.sort(key=self.engine_priorities.index)
+    
+    def _register_pooled_engines(self):
+        """Mark installed pool engines available without loading their models.
+        
+        Tesseract's binary is checked here since that is cheap; the model-based
+        engines are dropped later if a worker fails to load them.
+        """
+        
+        installed = {
+            'paddleocr': PADDLEOCR_AVAILABLE,
+            'easyocr': EASYOCR_AVAILABLE,
+            'tesseract': TESSERACT_AVAILABLE
+        }
+        for engine in self.engine_priorities:
+            if engine not in self.process_pool_engines or not installed.get(engine) \
+                    or engine in self.available_engines:
+                continue
+            if engine == 'tesseract':
+                try:
+                    pytesseract.get_tesseract_version()
+                except Exception as e:
+                    self.logger.warning(f"⚠️ Tesseract failed to initialize: {e}")
+                    continue
+            self.available_engines.append(engine)
+    
+    def _drop_engine(self, engine: str, reason: str):
+        """Stop using an engine that turned out to be unusable."""
+        
+        if engine in self.available_engines:
+            self.available_engines.remove(engine)
+            self.logger.warning(f"⚠️ Dropping OCR engine {engine}: {reason}")
+            if not self.available_engines:
+                self.logger.error("No OCR engines left available")
+    
+    def _ensure_engine_loaded(self, engine: str):
+        """Load an engine's model in this process, e.g. when the pool broke."""
+        
+        with self._engine_init_lock:
+            if not self.engines_initialized.get(engine):
+                self._initialize_ocr_engines({engine})
     
     async def _validate_input(self, input_data: Any) -> Dict[str, Any]:
         """Validate OCR input data."""
@@ -195,16 +293,15 @@ class OCRAgent(BaseAgent):
         }
         
         total_confidence = 0.0
+        cascade = processing_options.get('cascade', self.engine_cascade)
+        if cascade:
+            results['extraction_metadata']['engine_order'] = self._get_cascade_order()
         
         for doc_index, document in enumerate(documents):
+            page_tasks = []
             try:
                 self.logger.info(f"📄 Processing document {doc_index + 1}/{len(documents)}")
                 
-                # Load and preprocess document
-                images = await self._load_document(document)
-                if not images:
-                    continue
-                
                 document_result = {
                     'document_id': document.get('document_id', f'doc_{doc_index}'),
                     'document_type': document.get('document_type', 'resume'),
@@ -212,13 +309,32 @@ class OCRAgent(BaseAgent):
                     'pages': [],
                     'consolidated_text': '',
                     'confidence': 0.0,
-                    'engine_results': {}
+                    'engine_results': {},
+                    'partial': False,
+                    'page_errors': []
                 }
                 
-                # Process each page/image
-                for page_index, image in enumerate(images):
-                    page_result = await self._process_image_ensemble(image, page_index)
-                    document_result['pages'].append(page_result)
+                # Start OCR on each page as soon as it is rendered, keeping a
+                # bounded number of rendered pages in memory; collect in page order.
+                # Pages that failed to render keep their place as error pages
+                pages = []
+                async for page_index, image in self._iter_document_pages(document, processing_options):
+                    if isinstance(image, Exception):
+                        document_result['page_errors'].append(f"Page {page_index + 1}: {image}")
+                        pages.append(self._failed_page_result(page_index, image))
+                        continue
+                    task = asyncio.create_task(self._process_image_ensemble(image, page_index, cascade))
+                    page_tasks.append(task)
+                    pages.append(task)
+                    in_flight = [task for task in page_tasks if not task.done()]
+                    if len(in_flight) >= self.max_pages_in_flight:
+                        await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                
+                if not pages:
+                    continue
+                
+                for page in pages:
+                    document_result['pages'].append(await page if isinstance(page, asyncio.Task) else page)
                 
                 # Consolidate results across pages
                 await self._consolidate_document_results(document_result)
@@ -226,7 +342,14 @@ class OCRAgent(BaseAgent):
                 results['extracted_documents'].append(document_result)
                 results['documents_processed'] += 1
                 
-                if document_result['confidence'] >= self.confidence_threshold:
+                if document_result['page_errors']:
+                    # Text from the other pages is kept, but a document with
+                    # missing pages is not a successful extraction
+                    document_result['partial'] = True
+                    results['extraction_metadata'].setdefault('errors', []).extend(
+                        f"Document {doc_index}: {error}" for error in document_result['page_errors']
+                    )
+                elif document_result['confidence'] >= self.confidence_threshold:
                     results['successful_extractions'] += 1
                 
                 total_confidence += document_result['confidence']
@@ -235,6 +358,13 @@ class OCRAgent(BaseAgent):
                 self.logger.error(f"Failed to process document {doc_index}: {str(e)}")
                 results['extraction_metadata']['errors'] = results['extraction_metadata'].get('errors', [])
                 results['extraction_metadata']['errors'].append(f"Document {doc_index}: {str(e)}")
+            finally:
+                # Don't leave OCR running for a document that was abandoned
+                pending = [task for task in page_tasks if not task.done()]
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    await asyncio.gather(*pending, return_exceptions=True)
         
         # Calculate overall confidence
         if results['documents_processed'] > 0:
@@ -242,6 +372,7 @@ class OCRAgent(BaseAgent):
         
         # Update engine performance statistics
         results['engine_performance'] = self._calculate_engine_performance(results['extracted_documents'])
+        self._update_engine_history(results['engine_performance'])
         
         return ProcessingResult(
             success=results['successful_extractions'] > 0,
@@ -262,23 +393,36 @@ class OCRAgent(BaseAgent):
     async def _load_document(self, document: Dict[str, Any]) -> List[Image.Image]:
         """Load and convert document to images for processing."""
         
-        images = []
+        return [image async for _, image in self._iter_document_pages(document) if not isinstance(image, Exception)]
+    
+    async def _iter_document_pages(self, document: Dict[str, Any],
+                                   options: Optional[Dict[str, Any]] = None) -> AsyncIterator[Tuple[int, Image.Image]]:
+        """Yield ``(page_index, preprocessed_image)`` one page at a time.
+        
+        PDFs are rasterized page by page, so only the pages currently being
+        processed are held in memory. A page that fails to render is yielded
+        as ``(page_index, exception)`` and the remaining pages still follow.
+        ``options`` may set ``grayscale`` and ``render_to_disk`` (render
+        through a temporary directory instead of piping full-resolution
+        bitmaps).
+        """
+        
+        options = options or {}
+        pdf_path = None
         
         try:
             if 'file_path' in document:
                 file_path = Path(document['file_path'])
                 if not file_path.exists():
                     self.logger.error(f"File not found: {file_path}")
-                    return images
+                    return
                 
                 if document['file_format'].lower() == 'pdf':
-                    # Convert PDF to images
-                    pdf_images = pdf2image.convert_from_path(file_path, dpi=300)
-                    images.extend(pdf_images)
+                    pdf_path = file_path
+                    page_count = (await asyncio.to_thread(pdf2image.pdfinfo_from_path, str(file_path)))['Pages']
                 else:
                     # Load image directly
                     image = Image.open(file_path)
-                    images.append(image)
             
             elif 'file_data' in document:
                 # Handle base64 encoded data
@@ -286,30 +430,98 @@ class OCRAgent(BaseAgent):
                     # Assume base64 encoded
                     image_data = base64.b64decode(document['file_data'])
                     image = Image.open(io.BytesIO(image_data))
-                    images.append(image)
                 else:
                     # Handle binary data
                     image = Image.open(io.BytesIO(document['file_data']))
-                    images.append(image)
+            
+            else:
+                return
         
         except Exception as e:
             self.logger.error(f"Failed to load document: {str(e)}")
-            return []
+            return
+        
+        if pdf_path is None:
+            yield 0, await self._preprocess_image(image)
+            return
         
-        # Preprocess images
-        processed_images = []
-        for image in images:
-            processed_image = await self._preprocess_image(image)
-            processed_images.append(processed_image)
+        grayscale = options.get('grayscale', self.pdf_grayscale)
+        render_to_disk = options.get('render_to_disk', self.pdf_render_to_disk)
+        with tempfile.TemporaryDirectory(prefix='ocr_pages_') if render_to_disk else contextlib.nullcontext() as output_folder:
+            for page_number in range(1, page_count + 1):
+                try:
+                    image = await self._render_pdf_page(pdf_path, page_number, grayscale, output_folder)
+                except Exception as e:
+                    self.logger.error(f"Failed to render page {page_number} of {pdf_path}: {e}")
+                    yield page_number - 1, e
+                    continue
+                yield page_number - 1, await self._preprocess_image(image)
+    
+    def _failed_page_result(self, page_index: int, error: Exception) -> Dict[str, Any]:
+        """Page result standing in for a page that could not be rendered."""
         
-        return processed_images
+        return {
+            'page_number': page_index + 1,
+            'engine_results': {},
+            'consensus_text': '',
+            'confidence': 0.0,
+            'text_blocks': [],
+            'layout_info': {},
+            'error': str(error)
+        }
+    
+    async def _render_pdf_page(self, file_path: Path, page_number: int, grayscale: bool,
+                               output_folder: Optional[str] = None) -> Image.Image:
+        """Rasterize one PDF page at an adaptively chosen DPI."""
+        
+        preview = (await asyncio.to_thread(
+            pdf2image.convert_from_path, str(file_path), dpi=self.pdf_probe_dpi,
+            first_page=page_number, last_page=page_number, grayscale=True
+        ))[0]
+        dpi = self._choose_pdf_dpi(preview)
+        
+        if output_folder is None:
+            return (await asyncio.to_thread(
+                pdf2image.convert_from_path, str(file_path), dpi=dpi,
+                first_page=page_number, last_page=page_number, grayscale=grayscale
+            ))[0]
+        
+        page_path = (await asyncio.to_thread(
+            pdf2image.convert_from_path, str(file_path), dpi=dpi,
+            first_page=page_number, last_page=page_number, grayscale=grayscale,
+            output_folder=output_folder, fmt='png', paths_only=True
+        ))[0]
+        with Image.open(page_path) as page_image:
+            page_image.load()
+            image = page_image.copy()
+        os.remove(page_path)
+        return image
+    
+    def _choose_pdf_dpi(self, preview: Image.Image) -> int:
+        """Pick a render DPI from a low-resolution preview of the page.
+        
+        Pages with more ink (denser, usually smaller text) get up to
+        ``pdf_max_dpi``; sparse pages get ``pdf_min_dpi``. Large page sizes are
+        capped so the rendered page stays within ``pdf_max_page_pixels``.
+        """
+        
+        gray = np.asarray(preview.convert('L'))
+        ink_ratio = float((gray < 128).mean()) if gray.size else 0.0
+        density = min(1.0, ink_ratio / self.pdf_dense_ink_ratio)
+        dpi = self.pdf_min_dpi + (self.pdf_max_dpi - self.pdf_min_dpi) * density
+        
+        page_area = (preview.width / self.pdf_probe_dpi) * (preview.height / self.pdf_probe_dpi)
+        if page_area > 0:
+            dpi = min(dpi, (self.pdf_max_page_pixels / page_area) ** 0.5)
+        
+        return max(72, int(dpi) // 10 * 10)
     
     async def _preprocess_image(self, image: Image.Image) -> Image.Image:
         """Preprocess image for better OCR accuracy."""
         
         try:
-            # Convert to RGB if necessary
-            if image.mode != 'RGB':
+            # Convert to RGB if necessary (grayscale renders stay single-channel)
+            if image.mode not in ('RGB', 'L'):
                 image = image.convert('RGB')
             
             # Apply image enhancements
@@ -335,8 +547,16 @@ class OCRAgent(BaseAgent):
             self.logger.warning(f"Image preprocessing failed: {str(e)}")
             return image
     
-    async def _process_image_ensemble(self, image: Image.Image, page_index: int) -> Dict[str, Any]:
-        """Process single image through all available OCR engines in parallel."""
+    async def _process_image_ensemble(self, image: Image.Image, page_index: int,
+                                      cascade: bool = False) -> Dict[str, Any]:
+        """Process single image through the OCR engines.
+        
+        By default all available engines run in parallel. With ``cascade``,
+        engines run one at a time in :meth:`_get_cascade_order` and the page
+        escalates to the next engine until ``cascade_min_engines`` engines have
+        returned text and their consensus confidence reaches
+        ``cascade_confidence_threshold``.
+        """
         
         page_result = {
             'page_number': page_index + 1,
@@ -347,33 +567,165 @@ class OCRAgent(BaseAgent):
             'layout_info': {}
         }
         
-        # Run OCR engines in parallel
-        engine_tasks = []
-        
-        with concurrent.futures.ThreadPoolExecutor(max_workers=len(self.available_engines)) as executor:
-            for engine in self.available_engines:
-                future = executor.submit(self._run_single_engine, engine, image)
-                engine_tasks.append((engine, future))
+        if cascade and len(self.available_engines) > 1:
+            engine_order = self._get_cascade_order()
+            for engine in engine_order:
+                page_result['engine_results'][engine] = await self._run_engine_safely(engine, image)
+                await self._create_consensus(page_result)
+                engines_with_text = sum(
+                    1 for result in page_result['engine_results'].values()
+                    if result['text'].strip() and 'error' not in result
+                )
+                if engines_with_text >= self.cascade_min_engines and \
+                        page_result['confidence'] >= self.cascade_confidence_threshold:
+                    break
             
-            # Collect results
-            for engine, future in engine_tasks:
-                try:
-                    result = future.result(timeout=60)  # 60 second timeout per engine
-                    page_result['engine_results'][engine] = result
-                except Exception as e:
-                    self.logger.warning(f"Engine {engine} failed: {str(e)}")
-                    page_result['engine_results'][engine] = {
-                        'text': '',
-                        'confidence': 0.0,
-                        'blocks': [],
-                        'error': str(e)
-                    }
+            page_result['cascade'] = {
+                'engines_run': list(page_result['engine_results']),
+                'engines_skipped': engine_order[len(page_result['engine_results']):]
+            }
+            return page_result
+        
+        # Run OCR engines in parallel (engines may be dropped while this runs)
+        engines = list(self.available_engines)
+        engine_results = await asyncio.gather(
+            *(self._run_engine_safely(engine, image) for engine in engines)
+        )
+        page_result['engine_results'] = dict(zip(engines, engine_results))
         
         # Create consensus from multiple engine results
         await self._create_consensus(page_result)
         
         return page_result
     
+    async def _run_engine_safely(self, engine: str, image: Image.Image) -> Dict[str, Any]:
+        """Run one engine, turning failures and timeouts into an error result."""
+        
+        try:
+            return await self._run_engine_async(engine, image)
+        except Exception as e:
+            error = 'timeout' if isinstance(e, asyncio.TimeoutError) else str(e)
+            self.logger.warning(f"Engine {engine} failed: {error}")
+            return {
+                'text': '',
+                'confidence': 0.0,
+                'blocks': [],
+                'error': error
+            }
+    
+    def _get_cascade_order(self) -> List[str]:
+        """Available engines ordered by expected seconds per unit of accuracy."""
+        
+        def expected_cost(engine: str) -> float:
+            history = self.engine_history.get(engine)
+            if history and history['total_pages'] and not history['successful_pages']:
+                # Never succeeded so far: try it last
+                avg_time = self.engine_cost_priors.get(engine, 5.0)
+                accuracy = 0.0
+            elif history and history['successful_pages']:
+                avg_time = history['processing_time'] / history['successful_pages']
+                accuracy = (history['confidence'] / history['successful_pages']) * \
+                    (history['successful_pages'] / history['total_pages'])
+            else:
+                avg_time = self.engine_cost_priors.get(engine, 5.0)
+                accuracy = 0.8
+            return avg_time / max(accuracy, 0.05)
+        
+        return sorted(self.available_engines, key=expected_cost)
+    
+    def _update_engine_history(self, engine_performance: Dict[str, Any]):
+        """Fold one run's _calculate_engine_performance output into the running totals."""
+        
+        for engine, stats in engine_performance.items():
+            if not stats['total_pages']:
+                continue
+            history = self.engine_history.setdefault(engine, {
+                'total_pages': 0,
+                'successful_pages': 0,
+                'confidence': 0.0,
+                'processing_time': 0.0
+            })
+            history['total_pages'] += stats['total_pages']
+            history['successful_pages'] += stats['successful_pages']
+            history['confidence'] += stats['avg_confidence'] * stats['successful_pages']
+            history['processing_time'] += stats['avg_processing_time'] * stats['successful_pages']
+    
+    def _process_pool_enabled(self) -> bool:
+        return self.use_process_pool and self.process_pool_workers >= 2
+    
+    def _get_process_pool(self) -> Optional[concurrent.futures.ProcessPoolExecutor]:
+        """Lazily start the shared OCR worker pool."""
+        
+        if not self._process_pool_enabled():
+            return None
+        if self._ocr_pool is None:
+            self._ocr_pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.process_pool_workers,
+                initializer=_init_ocr_worker,
+                initargs=(frozenset(self.process_pool_engines),)
+            )
+            self.logger.info(f"🧵 Started OCR process pool with {self.process_pool_workers} workers")
+        return self._ocr_pool
+    
+    async def _run_engine_async(self, engine: str, image: Image.Image) -> Dict[str, Any]:
+        """Run one engine on a page without blocking the event loop."""
+        
+        loop = asyncio.get_running_loop()
+        pool = self._get_process_pool() if engine in self.process_pool_engines else None
+        
+        if pool is not None:
+            # Submit only when a worker is free, so queued pages don't eat into
+            # the engine timeout. The slot belongs to the worker, not to this
+            # call: a timed-out run keeps its worker busy, so the slot is only
+            # released once the worker has actually finished
+            if self._pool_slots is None or self._pool_slots[0] is not loop:
+                self._pool_slots = (loop, asyncio.Semaphore(self.process_pool_workers))
+            slots = self._pool_slots[1]
+            await slots.acquire()
+            try:
+                future = loop.run_in_executor(pool, _run_engine_in_worker, engine, image)
+            except BaseException:
+                slots.release()
+                raise
+            
+            def release_slot(done: asyncio.Future):
+                slots.release()
+                if not done.cancelled():
+                    done.exception()  # retrieved so abandoned runs don't log "never retrieved"
+            
+            future.add_done_callback(release_slot)
+            try:
+                return await asyncio.wait_for(asyncio.shield(future), timeout=self.engine_timeout)
+            except EngineUnavailableError as e:
+                self._drop_engine(engine, str(e))
+                raise
+            except BrokenProcessPool:
+                # A worker died (e.g. out of memory); restart the pool next time
+                self.logger.warning(f"OCR process pool broke while running {engine}; falling back to threads")
+                self._ocr_pool = None
+        
+        def run_locally():
+            if engine in self.process_pool_engines:
+                self._ensure_engine_loaded(engine)
+            return self._run_single_engine(engine, image)
+        
+        return await asyncio.wait_for(
+            loop.run_in_executor(None, run_locally),
+            timeout=self.engine_timeout
+        )
+    
+    def shutdown_process_pool(self):
+        """Stop the OCR worker processes."""
+        
+        if self._ocr_pool is not None:
+            self._ocr_pool.shutdown(wait=False, cancel_futures=True)
+            self._ocr_pool = None
+    
+    async def _cleanup(self):
+        """Cleanup resources when shutting down."""
+        self.shutdown_process_pool()
+        await super()._cleanup()
+    
     def _run_single_engine(self, engine: str, image: Image.Image) -> Dict[str, Any]:
         """Run single OCR engine on image."""
         
@@ -450,8 +802,8 @@ class OCRAgent(BaseAgent):
     def _run_paddleocr(self, image: Image.Image) -> Dict[str, Any]:
         """Run PaddleOCR."""
         
-        # Convert PIL image to numpy array
-        img_array = np.array(image)
+        # Convert PIL image to numpy array (PaddleOCR expects three channels)
+        img_array = np.array(image if image.mode == 'RGB' else image.convert('RGB'))
         
         # Run OCR
         results = self.paddle_ocr.ocr(img_array, cls=True)
@@ -690,4 +1042,27 @@ class OCRAgent(BaseAgent):
             if document['consolidated_text'].strip():
                 all_text.append(document['consolidated_text'].strip())
         
-        return '\n\n--- DOCUMENT SEPARATOR ---\n\n'.join(all_text)
\ No newline at end of file
+        return '\n\n--- DOCUMENT SEPARATOR ---\n\n'.join(all_text)
+
+_worker_agent: Optional[OCRAgent] = None
+
+def _init_ocr_worker(engines: frozenset):
+    """Process-pool initializer: load the pooled local OCR engine models once per worker."""
+    global _worker_agent
+    worker = OCRAgent.__new__(OCRAgent)
+    worker.logger = logging.getLogger(f"{__name__}.worker")
+    worker.engine_priorities = ['google_vision', 'paddleocr', 'easyocr', 'tesseract']
+    worker.available_engines = []
+    worker.engines_initialized = {}
+    worker._initialize_ocr_engines(set(engines))
+    if not worker.available_engines:
+        worker.logger.warning(f"No OCR engines available in worker process (wanted {sorted(engines)})")
+    _worker_agent = worker
+
+def _run_engine_in_worker(engine: str, image: Image.Image) -> Dict[str, Any]:
+    """Process-pool entry point for OCRAgent._run_single_engine"""
+    if _worker_agent is None:
+        _init_ocr_worker(frozenset({engine}))
+    if engine not in _worker_agent.available_engines:
+        raise EngineUnavailableError(f"OCR engine {engine} is not available in worker process")
+    return _worker_agent._run_single_engine(engine, image)
@@ -13,6 +13,8 @@ from datetime import datetime, timedelta
 import openai
 import anthropic
 import hashlib
+import copy
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum
 import logging
@@ -25,6 +27,76 @@ except ImportError:
 
 from .base_agent import BaseAgent, ProcessingResult
 
+# Resume sections parsed as independent chunks: schema sections filled from
+# each chunk, and the heading keywords that start it
+SECTION_GROUPS = {
+    'contact': (
+        ('personal_information', 'professional_summary'),
+        re.compile(r'\b(contact|summary|profile|objective|about)\b')
+    ),
+    'experience': (
+        ('work_experience', 'projects', 'volunteer_experience'),
+        re.compile(r'\b(experience|employment|work history|career history|projects?|volunteer\w*)\b')
+    ),
+    'education': (
+        ('education', 'certifications'),
+        re.compile(r'\b(education|academic\w*|certifications?|licen[cs]es|training|courses?)\b')
+    ),
+    'skills': (
+        ('skills', 'publications', 'awards_honors', 'additional_information'),
+        re.compile(r'\b(skills?|technologies|competencies|expertise|languages|publications|awards?|honou?rs|interests|additional)\b')
+    ),
+}
+
+# Common section headings, matched exactly (lower-case, punctuation removed)
+KNOWN_HEADINGS = frozenset({
+    'contact', 'contact information', 'contact details', 'personal information', 'personal details',
+    'summary', 'professional summary', 'career summary', 'profile', 'professional profile',
+    'objective', 'career objective', 'about', 'about me',
+    'experience', 'work experience', 'professional experience', 'relevant experience',
+    'employment', 'employment history', 'work history', 'career history',
+    'projects', 'key projects', 'personal projects', 'volunteer experience', 'volunteering',
+    'education', 'education & training', 'academic background', 'certifications', 'certificates',
+    'licenses', 'licences', 'licenses & certifications', 'training', 'courses',
+    'skills', 'technical skills', 'core skills', 'key skills', 'skills & expertise', 'technologies',
+    'core competencies', 'competencies', 'expertise', 'languages', 'publications',
+    'awards', 'honors', 'honours', 'awards & honors', 'interests', 'additional information',
+})
+
+HEADING_WORDS = frozenset(word for heading in KNOWN_HEADINGS for word in heading.split()) | {'and'}
+
+def _is_heading(heading: str) -> bool:
+    """Whether a normalized resume line is a section heading rather than content.
+    
+    The line must be a known heading or made up only of heading words, so
+    job titles and company names that merely contain a section keyword
+    ("Training Manager", "ACME TRAINING LTD", "Technologies used:") stay
+    with their section.
+    """
+    if not heading:
+        return False
+    return heading in KNOWN_HEADINGS or all(word in HEADING_WORDS for word in heading.split())
+
+def split_resume_sections(text: str) -> Dict[str, str]:
+    """Split resume text into SECTION_GROUPS chunks by heading lines.
+    
+    Text before the first heading belongs to ``contact``; lines under an
+    unrecognised heading stay with the preceding section.
+    """
+    
+    chunks: Dict[str, List[str]] = {}
+    current = 'contact'
+    for line in text.splitlines():
+        heading = ' '.join(re.sub(r'[^a-z& ]', ' ', line.lower()).split())
+        if _is_heading(heading):
+            for group, (_, pattern) in SECTION_GROUPS.items():
+                if pattern.search(heading):
+                    current = group
+                    break
+        chunks.setdefault(current, []).append(line)
+    
+    return {group: '\n'.join(lines).strip() for group, lines in chunks.items() if '\n'.join(lines).strip()}
+
 class ParsingConfidence(Enum):
     LOW = "low"
     MEDIUM = "medium" 
@@ -107,9 +179,34 @@ class ParserAgent(BaseAgent):
             'gemini-pro': 0.9
         }
         
+        # Parallel execution: per-model deadlines, and quorum mode which starts
+        # consensus as soon as min_models_agreement models agree above
+        # quorum_confidence and cancels the remaining parses
+        self.default_model_timeout = 60.0
+        self.model_timeouts = {
+            'gpt-4o': 60.0,
+            'claude-3.5-sonnet': 60.0,
+            'gemini-pro': 45.0
+        }
+        self.quorum_enabled = True
+        self.quorum_confidence = self.consensus_threshold
+        
         # Define comprehensive structured output schema
         self.resume_schema = self._get_comprehensive_resume_schema()
         
+        # Section-level parsing: each chunk is sent with only its part of the
+        # schema, and results are memoized by model and chunk content hash
+        self.chunked_parsing = True
+        self.section_schemas = {
+            group: {
+                'type': 'object',
+                'properties': {name: self.resume_schema['properties'][name] for name in sections}
+            }
+            for group, (sections, _) in SECTION_GROUPS.items()
+        }
+        self.section_cache: OrderedDict = OrderedDict()
+        self.section_cache_size = 512
+        
         # Data normalization settings
         self.normalization_enabled = True
         self.date_formats = [
@@ -560,36 +657,13 @@ class ParserAgent(BaseAgent):
         enable_ensemble = processing_options.get('enable_ensemble', True)
         
         # Process with multiple models in parallel
-        model_tasks = []
-        for model_name in preferred_models:
-            if model_name in self.available_models:
-                task = self._parse_with_single_model(model_name, extracted_text, processing_options)
-                model_tasks.append((model_name, task))
-        
-        # Wait for all models to complete
-        model_results = []
-        for model_name, task in model_tasks:
-            try:
-                results['models_attempted'] += 1
-                result = await task
-                result.model_name = model_name
-                model_results.append(result)
-                results['successful_models'] += 1
-                
-                self.logger.info(f"✅ {model_name} parsing completed with confidence: {result.confidence}")
-                
-            except Exception as e:
-                self.logger.warning(f"⚠️ {model_name} parsing failed: {str(e)}")
-                # Create error result
-                error_result = ModelResult(
-                    model_name=model_name,
-                    parsed_data={},
-                    confidence=0.0,
-                    processing_time=0.0,
-                    errors=[str(e)],
-                    warnings=[]
-                )
-                model_results.append(error_result)
+        models = [model_name for model_name in preferred_models if model_name in self.available_models]
+        quorum = enable_ensemble and processing_options.get('quorum', self.quorum_enabled)
+        model_results, execution = await self._run_model_ensemble(models, extracted_text, processing_options, quorum)
+        
+        results['models_attempted'] = len(models)
+        results['successful_models'] = sum(1 for r in model_results if r.confidence > 0)
+        results['processing_metadata'] = execution
         
         if not any(r.confidence > 0 for r in model_results):
             raise Exception("All AI models failed to parse the resume")
@@ -625,24 +699,124 @@ class ParserAgent(BaseAgent):
                 'ensemble_enabled': enable_ensemble,
                 'consensus_areas': len(results.get('consensus_data', {})),
                 'disagreement_count': len(results.get('disagreement_areas', [])),
-                'text_length': len(extracted_text)
+                'text_length': len(extracted_text),
+                'quorum_reached': execution['quorum_reached'],
+                'cancelled_models': execution['cancelled_models'],
+                'timed_out_models': execution['timed_out_models']
             }
         )
     
+    async def _run_model_ensemble(self, models: List[str], text: str, options: Dict[str, Any],
+                                  quorum: bool = False) -> tuple:
+        """Run all model parses concurrently, each under its own deadline.
+        
+        In quorum mode, returns as soon as ``min_models_agreement`` successful
+        results agree with each other above ``quorum_confidence``; parses still
+        running at that point are cancelled. Returns the completed model results
+        (in completion order) and execution metadata.
+        """
+        
+        timeouts = {**self.model_timeouts, **options.get('model_timeouts', {})}
+        tasks = {
+            asyncio.create_task(self._parse_with_deadline(
+                model_name, text, options, timeouts.get(model_name, self.default_model_timeout)
+            )): model_name
+            for model_name in models
+        }
+        
+        model_results: List[ModelResult] = []
+        quorum_reached = False
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    result = task.result()
+                    model_results.append(result)
+                    if result.confidence > 0:
+                        self.logger.info(f"✅ {result.model_name} parsing completed with confidence: {result.confidence}")
+                    else:
+                        self.logger.warning(f"⚠️ {result.model_name} parsing failed: {'; '.join(result.errors)}")
+                
+                if quorum and pending and self._has_quorum(model_results):
+                    quorum_reached = True
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        
+        cancelled_models = [tasks[task] for task in pending]
+        if cancelled_models:
+            self.logger.info(f"⚡ Quorum reached, cancelled slower models: {cancelled_models}")
+        
+        return model_results, {
+            'parallel_execution': True,
+            'quorum_enabled': quorum,
+            'quorum_reached': quorum_reached,
+            'completion_order': [r.model_name for r in model_results],
+            'cancelled_models': cancelled_models,
+            'timed_out_models': [r.model_name for r in model_results if r.errors and r.errors[0].startswith('Timed out')],
+            'model_timeouts': {model_name: timeouts.get(model_name, self.default_model_timeout) for model_name in models}
+        }
+    
+    async def _parse_with_deadline(self, model: str, text: str, options: Dict[str, Any], timeout: float) -> ModelResult:
+        """Run ``_parse_with_single_model`` under a deadline; failures become error results."""
+        
+        start_time = time.time()
+        try:
+            return await asyncio.wait_for(self._parse_with_single_model(model, text, options), timeout=timeout)
+        except asyncio.TimeoutError:
+            error = f"Timed out after {timeout}s"
+        except Exception as e:
+            error = str(e)
+        
+        return ModelResult(
+            model_name=model,
+            parsed_data={},
+            confidence=0.0,
+            processing_time=time.time() - start_time,
+            errors=[error],
+            warnings=[]
+        )
+    
+    def _has_quorum(self, model_results: List[ModelResult]) -> bool:
+        """Whether enough confident results agree to start consensus early.
+        
+        Only results that contain every compared section count, so a result
+        missing one cannot "agree" by omission.
+        """
+        
+        compared_sections = ('personal_information', 'work_experience')
+        confident = [
+            r for r in model_results
+            if r.parsed_data and r.confidence >= self.quorum_confidence
+            and all(r.parsed_data.get(section) for section in compared_sections)
+        ]
+        if len(confident) < self.min_models_agreement:
+            return False
+        
+        weights = [r.confidence for r in confident]
+        for section in compared_sections:
+            disagreement = self._check_section_disagreement(
+                section, [r.parsed_data.get(section) for r in confident], weights
+            )
+            if disagreement and disagreement['disagreement_type']:
+                return False
+        return True
+    
     async def _parse_with_single_model(self, model: str, text: str, options: Dict[str, Any]) -> ModelResult:
         """Parse resume using a single AI model with comprehensive error handling."""
         
         start_time = time.time()
         
         try:
-            if model == 'gpt-4o':
-                result_data = await self._parse_with_openai(text, options)
-            elif model == 'claude-3.5-sonnet':
-                result_data = await self._parse_with_anthropic(text, options)
-            elif model == 'gemini-pro':
-                result_data = await self._parse_with_gemini(text, options)
+            sections = split_resume_sections(text) if options.get('chunked', self.chunked_parsing) else {}
+            if len(sections) >= 2:
+                result_data = await self._parse_sections(model, sections, options)
             else:
-                raise ValueError(f"Unsupported model: {model}")
+                result_data = await self._parse_with_model(model, text, options)
             
             processing_time = time.time() - start_time
             
@@ -674,7 +848,56 @@ class ParserAgent(BaseAgent):
                 warnings=[]
             )
     
-    async def _parse_with_openai(self, text: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    async def _parse_with_model(self, model: str, text: str, options: Dict[str, Any],
+                                schema: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Dispatch one parse request to the given model's provider."""
+        
+        if model == 'gpt-4o':
+            return await self._parse_with_openai(text, options, schema)
+        elif model == 'claude-3.5-sonnet':
+            return await self._parse_with_anthropic(text, options, schema)
+        elif model == 'gemini-pro':
+            return await self._parse_with_gemini(text, options, schema)
+        else:
+            raise ValueError(f"Unsupported model: {model}")
+    
+    async def _parse_sections(self, model: str, sections: Dict[str, str], options: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse resume section chunks concurrently, reusing memoized chunk results.
+        
+        Only sections whose text changed since an earlier parse with the same
+        model are sent again; each chunk carries only its section schema.
+        """
+        
+        override_option = {'gpt-4o': 'openai_model', 'claude-3.5-sonnet': 'claude_model'}.get(model)
+        model_override = options.get(override_option) if override_option else None
+        parsed_count = 0
+        
+        async def parse_section(group: str, chunk: str) -> Dict[str, Any]:
+            nonlocal parsed_count
+            key = hashlib.sha256(json.dumps([model, model_override, group, chunk]).encode('utf-8')).hexdigest()
+            cached = self.section_cache.get(key)
+            if cached is not None:
+                self.section_cache.move_to_end(key)
+                return copy.deepcopy(cached)
+            
+            parsed = await self._parse_with_model(model, chunk, options, self.section_schemas[group])
+            parsed_count += 1
+            section_data = {name: parsed[name] for name in SECTION_GROUPS[group][0] if name in parsed}
+            self.section_cache[key] = copy.deepcopy(section_data)
+            while len(self.section_cache) > self.section_cache_size:
+                self.section_cache.popitem(last=False)
+            return section_data
+        
+        section_results = await asyncio.gather(*(parse_section(group, chunk) for group, chunk in sections.items()))
+        self.logger.info(f"📑 {model}: parsed {parsed_count}/{len(sections)} sections, reused {len(sections) - parsed_count}")
+        
+        merged: Dict[str, Any] = {}
+        for section_data in section_results:
+            merged.update(section_data)
+        return merged
+    
+    async def _parse_with_openai(self, text: str, options: Dict[str, Any],
+                                 schema: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Parse resume using OpenAI GPT-4o with enhanced prompting."""
         
         system_prompt = """You are an expert resume parser specializing in comprehensive information extraction. 
@@ -703,7 +926,7 @@ class ParserAgent(BaseAgent):
         {text}
         
         JSON SCHEMA:
-        {json.dumps(self.resume_schema, indent=2)}
+        {json.dumps(schema or self.resume_schema, indent=2)}
         
         RESPONSE: Return only the JSON data structure matching the schema above."""
         
@@ -723,7 +946,8 @@ class ParserAgent(BaseAgent):
         
         return parsed_data
     
-    async def _parse_with_anthropic(self, text: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    async def _parse_with_anthropic(self, text: str, options: Dict[str, Any],
+                                    schema: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Parse resume using Anthropic Claude 3.5 Sonnet with enhanced analysis."""
         
         system_prompt = """You are an expert resume parser with deep understanding of professional document structures and career progression patterns.
@@ -753,7 +977,7 @@ class ParserAgent(BaseAgent):
         {text}
         
         TARGET JSON SCHEMA:
-        {json.dumps(self.resume_schema, indent=2)}
+        {json.dumps(schema or self.resume_schema, indent=2)}
         
         OUTPUT: Provide only the complete JSON data structure matching the schema."""
         
@@ -772,7 +996,8 @@ class ParserAgent(BaseAgent):
         
         return parsed_data
     
-    async def _parse_with_gemini(self, text: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    async def _parse_with_gemini(self, text: str, options: Dict[str, Any],
+                                 schema: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Parse resume using Google Gemini Pro with advanced reasoning."""
         
         prompt = f"""You are an expert resume parsing system with advanced natural language understanding capabilities.
@@ -795,7 +1020,7 @@ class ParserAgent(BaseAgent):
         {text}
         
         JSON SCHEMA TO FOLLOW:
-        {json.dumps(self.resume_schema, indent=2)}
+        {json.dumps(schema or self.resume_schema, indent=2)}
         
         INSTRUCTION: Generate the complete JSON structure following the schema exactly. Include all fields, even if empty. Return only the JSON data."""
         
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+🧭 Browser Page Pool
+Managed Playwright pages for concurrent scraping, with recycling and crash recovery
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from playwright.async_api import Browser, BrowserContext, Page
+
+logger = logging.getLogger(__name__)
+
+# Evaluated in the page: first matching element's text for each named selector,
+# plus presence checks for buttons identified by selector or visible text.  The
+# text check is case-insensitive and whitespace-normalised, like Playwright's
+# ``:has-text()``.
+EXTRACT_FIELDS_JS = """
+({fields, buttons}) => {
+    const text = (selector) => {
+        const element = document.querySelector(selector);
+        return element ? (element.textContent || '').trim() : '';
+    };
+    const normalize = (value) => (value || '').replace(/\\s+/g, ' ').trim().toLowerCase();
+    const out = {};
+    for (const [name, selector] of Object.entries(fields || {})) {
+        out[name] = text(selector);
+    }
+    for (const [name, spec] of Object.entries(buttons || {})) {
+        const wanted = normalize(spec.text);
+        out[name] = !!document.querySelector(spec.selector) ||
+            (!!wanted && Array.from(document.querySelectorAll('button'))
+                .some(button => normalize(button.textContent).includes(wanted)));
+    }
+    return out;
+}
+"""
+
+# Evaluated over every element matching a card selector: per-card field texts
+# and, for list fields, the texts of all matching descendants.
+EXTRACT_CARDS_JS = """
+(cards, {fields, lists}) => cards.map(card => {
+    const out = {};
+    for (const [name, selector] of Object.entries(fields || {})) {
+        const element = card.querySelector(selector);
+        out[name] = element ? (element.textContent || '').trim() : '';
+    }
+    for (const [name, selector] of Object.entries(lists || {})) {
+        out[name] = Array.from(card.querySelectorAll(selector))
+            .map(element => (element.textContent || '').trim())
+            .filter(Boolean);
+    }
+    return out;
+})
+"""
+
+
+class PooledPage:
+    """A page in its own browser context, tracking navigations and crashes"""
+
+    def __init__(self, context: BrowserContext, page: Page):
+        self.context = context
+        self.page = page
+        self.navigations = 0
+        self.crashed = False
+        page.on("crash", self._on_crash)
+        page.on("framenavigated", self._on_navigated)
+
+    def _on_crash(self, *_):
+        self.crashed = True
+
+    def _on_navigated(self, frame):
+        if frame == self.page.main_frame:
+            self.navigations += 1
+
+    @property
+    def healthy(self) -> bool:
+        return not self.crashed and not self.page.is_closed()
+
+    async def close(self):
+        try:
+            await self.context.close()
+        except Exception:
+            pass
+
+
+class BrowserPagePool:
+    """Pool of ``pages_per_platform`` pages per platform on one browser
+
+    Each page lives in a separate context, so platforms and parallel searches
+    do not share cookies. A page is replaced with a fresh context after
+    ``max_navigations`` navigations or as soon as it crashes or closes.
+    """
+
+    def __init__(self,
+                 browser: Browser,
+                 pages_per_platform: int = 2,
+                 max_navigations: int = 25,
+                 context_factory: Optional[Callable[[], Dict[str, Any]]] = None):
+        self.browser = browser
+        self.pages_per_platform = pages_per_platform
+        self.max_navigations = max_navigations
+        self.context_factory = context_factory or dict
+        self._idle: Dict[str, asyncio.Queue] = {}
+        self._pages: List[PooledPage] = []
+
+    async def _open(self) -> PooledPage:
+        context = await self.browser.new_context(**self.context_factory())
+        pooled = PooledPage(context, await context.new_page())
+        self._pages.append(pooled)
+        return pooled
+
+    async def _recycle(self, pooled: Optional[PooledPage]) -> PooledPage:
+        if pooled is not None:
+            if pooled in self._pages:
+                self._pages.remove(pooled)
+            await pooled.close()
+        return await self._open()
+
+    def _queue(self, platform: str) -> asyncio.Queue:
+        if platform not in self._idle:
+            queue = asyncio.Queue()
+            # ``None`` slots are opened lazily on first lease
+            for _ in range(self.pages_per_platform):
+                queue.put_nowait(None)
+            self._idle[platform] = queue
+        return self._idle[platform]
+
+    @asynccontextmanager
+    async def lease(self, platform: str):
+        """Borrow a healthy page for ``platform``; waits while all are busy"""
+        queue = self._queue(platform)
+        pooled = await queue.get()
+        try:
+            if pooled is None or not pooled.healthy or pooled.navigations >= self.max_navigations:
+                pooled = await self._recycle(pooled)
+            yield pooled
+        finally:
+            queue.put_nowait(pooled)
+
+    async def run(self, platform: str, func: Callable[..., Awaitable[Any]], *args, retries: int = 1) -> Any:
+        """Call ``func(page, *args)`` on a pooled page
+
+        If the page crashes or closes during the call, the call is retried on
+        a fresh page up to ``retries`` times.
+        """
+        for attempt in range(retries + 1):
+            async with self.lease(platform) as pooled:
+                try:
+                    result = await func(pooled.page, *args)
+                except Exception:
+                    if pooled.healthy or attempt == retries:
+                        raise
+                    logger.warning(f"{platform} page crashed, retrying on a fresh page")
+                    continue
+                if pooled.healthy or attempt == retries:
+                    return result
+                logger.warning(f"{platform} page crashed, retrying on a fresh page")
+
+    async def close(self):
+        """Close every context opened by the pool"""
+        await asyncio.gather(*(pooled.close() for pooled in self._pages))
+        self._pages.clear()
+        self._idle.clear()
+
+
+async def extract_fields(page: Page,
+                         fields: Dict[str, str],
+                         buttons: Optional[Dict[str, Dict[str, str]]] = None) -> Dict[str, Any]:
+    """Read several page fields in a single ``evaluate`` round trip"""
+    try:
+        return await page.evaluate(EXTRACT_FIELDS_JS, {'fields': fields, 'buttons': buttons or {}})
+    except Exception:
+        return {**{name: '' for name in fields}, **{name: False for name in (buttons or {})}}
+
+
+async def extract_cards(page: Page,
+                        card_selector: str,
+                        fields: Dict[str, str],
+                        lists: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+    """Read the fields of every card in a result list with one ``evaluate`` call"""
+    try:
+        return await page.eval_on_selector_all(card_selector, EXTRACT_CARDS_JS, {'fields': fields, 'lists': lists or {}})
+    except Exception:
+        return []
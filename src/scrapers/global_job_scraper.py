@@ -6,14 +6,19 @@ Scrapes jobs from LinkedIn, Indeed, Glassdoor, AngelList, and more
 import requests
 import asyncio
 import aiohttp
-from typing import List, Dict, Optional
+from typing import AsyncIterator, List, Dict, Optional
 import json
 import re
+import sys
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 import logging
+from pathlib import Path
 from urllib.parse import quote_plus
 
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.scrapers.async_fetch import TokenBucket
+
 @dataclass
 class JobListing:
     title: str
@@ -55,14 +60,35 @@ class GlobalJobScraper:
     ) -> List[JobListing]:
         """Search for jobs globally across multiple platforms"""
         
+        all_jobs = [job async for job in self.iter_jobs_worldwide(keywords, countries, max_results)]
+        
+        # Remove duplicates and sort by relevance
+        unique_jobs = self._deduplicate_jobs(all_jobs)
+        return sorted(unique_jobs, key=lambda x: x.match_score, reverse=True)[:max_results]
+    
+    async def iter_jobs_worldwide(
+        self,
+        keywords: List[str],
+        countries: List[str] = None,
+        max_results: int = 50,
+        high_score_threshold: float = 0.85,
+        max_concurrency: int = 8,
+        requests_per_second: float = 1.0
+    ) -> AsyncIterator[JobListing]:
+        """Stream unique jobs as they arrive from the platform x keyword x country matrix
+        
+        All combinations are scheduled at once, bounded by a global concurrency
+        cap and a token bucket per platform host (``requests_per_second``).
+        Outstanding requests are cancelled once ``max_results`` jobs scoring at
+        least ``high_score_threshold`` have been yielded.
+        """
+        
         if not countries:
             countries = [
                 "United States", "Canada", "United Kingdom", "Germany", "Netherlands", 
                 "Australia", "Singapore", "India", "UAE", "Switzerland"
             ]
         
-        all_jobs = []
-        
         async with aiohttp.ClientSession(headers=self.headers) as session:
             self.session = session
             
@@ -75,23 +101,48 @@ class GlobalJobScraper:
                 self.scrape_weworkremotely_jobs
             ]
             
-            for platform in platforms:
-                try:
-                    for keyword in keywords:
-                        for country in countries[:3]:  # Limit to 3 countries per search
-                            jobs = await platform(keyword, country, max_results // len(platforms))
-                            all_jobs.extend(jobs)
-                            
-                            # Rate limiting
-                            await asyncio.sleep(1)
-                            
-                except Exception as e:
-                    self.logger.error(f"Error scraping from platform: {e}")
-                    continue
-        
-        # Remove duplicates and sort by relevance
-        unique_jobs = self._deduplicate_jobs(all_jobs)
-        return sorted(unique_jobs, key=lambda x: x.match_score, reverse=True)[:max_results]
+            limit = max_results // len(platforms)
+            concurrency = asyncio.Semaphore(max_concurrency)
+            buckets = [TokenBucket(requests_per_second) for _ in platforms]
+            
+            async def run(slot, keyword, country):
+                # Wait for the host's token before taking a global slot so a
+                # throttled platform never starves the others
+                await buckets[slot].acquire()
+                async with concurrency:
+                    try:
+                        return await platforms[slot](keyword, country, limit)
+                    except Exception as e:
+                        self.logger.error(f"Error scraping from platform: {e}")
+                        return []
+            
+            tasks = [
+                asyncio.ensure_future(run(slot, keyword, country))
+                for slot in range(len(platforms))
+                for keyword in keywords
+                for country in countries[:3]  # Limit to 3 countries per search
+            ]
+            
+            seen = set()
+            high_scores = 0
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    for job in await next_done:
+                        key = (job.title.lower(), job.company.lower(), job.location.lower())
+                        if key in seen:
+                            continue
+                        seen.add(key)
+                        yield job
+                        
+                        if job.match_score >= high_score_threshold:
+                            high_scores += 1
+                    
+                    if high_scores >= max_results:
+                        break
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
     
     async def scrape_indeed_jobs(self, keyword: str, country: str, limit: int) -> List[JobListing]:
         """Scrape jobs from Indeed"""
@@ -12,8 +12,10 @@ import re
 from typing import Dict, List, Any, Optional, Tuple
 from urllib.parse import urlencode, quote_plus
 import random
+import sys
 import time
 from datetime import datetime, timedelta
+from pathlib import Path
 from bs4 import BeautifulSoup
 import requests
 from selenium import webdriver
@@ -22,6 +24,9 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.scrapers.async_fetch import AsyncFetcher
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -35,6 +40,13 @@ class InternetJobScraper:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         })
         
+        # Shared pooled async client for the current search (see search_jobs_across_internet)
+        self.fetcher: Optional[AsyncFetcher] = None
+        
+        # Per-domain politeness: one request at a time, 1-3s apart
+        self.per_domain_concurrency = 1
+        self.per_domain_interval = (1.0, 3.0)
+        
         # Job search engines and career portals
         self.job_sources = {
             'indeed': {
@@ -132,53 +144,28 @@ class InternetJobScraper:
         
         logger.info(f"🌐 Starting comprehensive internet job search for {len(job_titles)} titles across {len(self.job_sources)} sources")
         
-        all_jobs = []
-        
-        # Search major job boards
-        for source_name, source_config in self.job_sources.items():
+        async with AsyncFetcher(
+            headers=dict(self.session.headers),
+            per_domain_concurrency=self.per_domain_concurrency,
+            per_domain_interval=self.per_domain_interval
+        ) as fetcher:
+            self.fetcher = fetcher
             try:
-                logger.info(f"🔍 Searching {source_name}...")
-                source_jobs = await self._search_job_source(
-                    source_name, source_config, job_titles, locations, max_jobs_per_source
-                )
-                
-                # Add source metadata
-                for job in source_jobs:
-                    job['source'] = source_name
-                    job['source_type'] = 'job_board'
-                
-                all_jobs.extend(source_jobs)
-                logger.info(f"✅ Found {len(source_jobs)} jobs from {source_name}")
-                
-                # Rate limiting
-                await asyncio.sleep(random.uniform(1, 3))
+                # Query all job boards and career pages concurrently; per-domain
+                # limits in the fetcher keep each site's request rate unchanged
+                tasks = [
+                    self._search_board(source_name, source_config, job_titles, locations, max_jobs_per_source)
+                    for source_name, source_config in self.job_sources.items()
+                ]
+                for company in company_preferences or []:
+                    if company.lower() in self.company_career_pages:
+                        tasks.append(self._search_company(company, job_titles, max_jobs_per_source // 2))
                 
-            except Exception as e:
-                logger.error(f"❌ Error searching {source_name}: {e}")
-        
-        # Search company career pages
-        if company_preferences:
-            for company in company_preferences:
-                company_lower = company.lower()
-                if company_lower in self.company_career_pages:
-                    try:
-                        logger.info(f"🏢 Searching {company} career page...")
-                        company_jobs = await self._search_company_careers(
-                            company_lower, job_titles, max_jobs_per_source // 2
-                        )
-                        
-                        for job in company_jobs:
-                            job['source'] = f"{company}_careers"
-                            job['source_type'] = 'company_direct'
-                            job['company'] = company
-                        
-                        all_jobs.extend(company_jobs)
-                        logger.info(f"✅ Found {len(company_jobs)} jobs from {company}")
-                        
-                        await asyncio.sleep(random.uniform(2, 4))
-                        
-                    except Exception as e:
-                        logger.error(f"❌ Error searching {company} careers: {e}")
+                results = await asyncio.gather(*tasks)
+            finally:
+                self.fetcher = None
+        
+        all_jobs = [job for source_jobs in results for job in source_jobs]
         
         # Remove duplicates and enhance jobs
         unique_jobs = self._deduplicate_jobs(all_jobs)
@@ -190,6 +177,49 @@ class InternetJobScraper:
         logger.info(f"🎯 Total unique jobs found: {len(enhanced_jobs)}")
         return enhanced_jobs
     
+    async def _search_board(self,
+                            source_name: str,
+                            source_config: Dict[str, Any],
+                            job_titles: List[str],
+                            locations: List[str],
+                            max_jobs: int) -> List[Dict[str, Any]]:
+        """Search one job board and tag results with source metadata"""
+        try:
+            logger.info(f"🔍 Searching {source_name}...")
+            source_jobs = await self._search_job_source(
+                source_name, source_config, job_titles, locations, max_jobs
+            )
+            
+            # Add source metadata
+            for job in source_jobs:
+                job['source'] = source_name
+                job['source_type'] = 'job_board'
+            
+            logger.info(f"✅ Found {len(source_jobs)} jobs from {source_name}")
+            return source_jobs
+            
+        except Exception as e:
+            logger.error(f"❌ Error searching {source_name}: {e}")
+            return []
+    
+    async def _search_company(self, company: str, job_titles: List[str], max_jobs: int) -> List[Dict[str, Any]]:
+        """Search one company career page and tag results with source metadata"""
+        try:
+            logger.info(f"🏢 Searching {company} career page...")
+            company_jobs = await self._search_company_careers(company.lower(), job_titles, max_jobs)
+            
+            for job in company_jobs:
+                job['source'] = f"{company}_careers"
+                job['source_type'] = 'company_direct'
+                job['company'] = company
+            
+            logger.info(f"✅ Found {len(company_jobs)} jobs from {company}")
+            return company_jobs
+            
+        except Exception as e:
+            logger.error(f"❌ Error searching {company} careers: {e}")
+            return []
+    
     async def _search_job_source(self, 
                                 source_name: str, 
                                 source_config: Dict[str, Any], 
@@ -238,17 +268,26 @@ class InternetJobScraper:
             # Use both requests and Selenium for different sites
             jobs = []
             
-            # Try requests first (faster)
+            # Try plain HTTP first (faster), through the pooled client when available
             try:
-                response = self.session.get(url, timeout=10)
-                if response.status_code == 200:
-                    jobs = self._parse_jobs_from_html(response.text, selectors, max_jobs)
+                if self.fetcher:
+                    status, html = await self.fetcher.get_text(url)
+                else:
+                    response = await asyncio.to_thread(self.session.get, url, timeout=10)
+                    status, html = response.status_code, response.text
+                if status == 200:
+                    jobs = self._parse_jobs_from_html(html, selectors, max_jobs)
             except Exception as e:
                 logger.warning(f"⚠️ Requests failed for {url}: {e}")
             
-            # If no jobs found, try Selenium (handles JavaScript)
+            # If no jobs found, try Selenium (handles JavaScript) off the event loop
             if not jobs:
-                jobs = await self._fetch_with_selenium(url, selectors, max_jobs)
+                if self.fetcher:
+                    jobs = await self.fetcher.run_blocking(
+                        url, self._fetch_with_selenium_sync, url, selectors, max_jobs
+                    )
+                else:
+                    jobs = await self._fetch_with_selenium(url, selectors, max_jobs)
             
             return jobs
             
@@ -300,6 +339,13 @@ class InternetJobScraper:
                                   selectors: Dict[str, str], 
                                   max_jobs: int) -> List[Dict[str, Any]]:
         """Fetch jobs using Selenium for JavaScript-heavy sites"""
+        return await asyncio.to_thread(self._fetch_with_selenium_sync, url, selectors, max_jobs)
+    
+    def _fetch_with_selenium_sync(self, 
+                                  url: str, 
+                                  selectors: Dict[str, str], 
+                                  max_jobs: int) -> List[Dict[str, Any]]:
+        """Blocking Selenium fetch; run in a worker thread"""
         
         driver = None
         try:
@@ -313,7 +359,7 @@ class InternetJobScraper:
             
             # Scroll to load more jobs
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            await asyncio.sleep(2)
+            time.sleep(2)
             
             # Get page source and parse
             html = driver.page_source
@@ -9,8 +9,9 @@ import json
 import os
 import re
 import random
+import sys
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, Tuple
 from urllib.parse import urlparse, urljoin
 import aiohttp
 from playwright.async_api import async_playwright, Browser, Page
@@ -19,6 +20,10 @@ import hashlib
 from pathlib import Path
 import yaml
 
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.scrapers.browser_pool import BrowserPagePool, extract_cards, extract_fields
+from src.utils.job_store import JobStore
+
 # AI imports for skill matching
 import openai
 from transformers import pipeline, AutoTokenizer, AutoModel
@@ -60,110 +65,121 @@ class JobPlatformScraper:
             "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         ]
     
-    async def scrape(self, keywords: List[str], locations: List[str], page: Page) -> List[JobListing]:
+    def searches(self, keywords: List[str], locations: List[str]) -> List[Tuple[str, str]]:
+        """Keyword/location pairs to search, limited to prevent rate limiting"""
+        return [(keyword, location) for keyword in keywords[:3] for location in locations[:2]]
+    
+    async def scrape(self, keywords: List[str], locations: List[str], pool: BrowserPagePool) -> List[JobListing]:
+        """Run every search concurrently on this platform's pooled pages"""
+        searches = self.searches(keywords, locations)
+        results = await asyncio.gather(
+            *(pool.run(self.platform_name, self.scrape_search, keyword, location) for keyword, location in searches),
+            return_exceptions=True
+        )
+        
+        jobs = []
+        for (keyword, _), result in zip(searches, results):
+            if isinstance(result, Exception):
+                print(f"   ❌ Error scraping {self.platform_name} for '{keyword}': {str(result)}")
+                continue
+            jobs.extend(result)
+        return jobs
+    
+    async def scrape_search(self, page: Page, keyword: str, location: str) -> List[JobListing]:
         """Override this method in platform-specific scrapers"""
         raise NotImplementedError
 
 class LinkedInScraper(JobPlatformScraper):
     """LinkedIn job scraper with Easy Apply detection"""
     
+    CARD_SELECTOR = '[data-entity-urn*="urn:li:fsd_jobPosting"], .job-search-card'
+    DETAIL_FIELDS = {
+        'title': '.job-details-jobs-unified-top-card__job-title h1, .jobs-unified-top-card__job-title',
+        'company': '.job-details-jobs-unified-top-card__company-name a, .jobs-unified-top-card__company-name',
+        'location': '.job-details-jobs-unified-top-card__bullet, .jobs-unified-top-card__bullet',
+        'description': '.jobs-description__content, .jobs-box__html-content'
+    }
+    DETAIL_BUTTONS = {
+        'easy_apply': {'selector': '.jobs-apply-button--top-card', 'text': 'Easy Apply'}
+    }
+    
     def __init__(self):
         super().__init__("LinkedIn", "https://www.linkedin.com/jobs/search/")
     
-    async def scrape(self, keywords: List[str], locations: List[str], page: Page) -> List[JobListing]:
+    async def scrape_search(self, page: Page, keyword: str, location: str) -> List[JobListing]:
         jobs = []
         
-        for keyword in keywords[:3]:  # Limit to prevent rate limiting
-            for location in locations[:2]:
-                try:
-                    # Build LinkedIn search URL
-                    search_url = f"{self.base_url}?keywords={keyword.replace(' ', '%20')}&location={location.replace(' ', '%20')}&f_LF=f_AL"  # f_AL = Easy Apply
-                    
-                    await page.goto(search_url)
-                    await page.wait_for_timeout(random.randint(3000, 5000))
+        # Build LinkedIn search URL
+        search_url = f"{self.base_url}?keywords={keyword.replace(' ', '%20')}&location={location.replace(' ', '%20')}&f_LF=f_AL"  # f_AL = Easy Apply
+        
+        await page.goto(search_url)
+        await page.wait_for_timeout(random.randint(3000, 5000))
+        
+        # Handle LinkedIn login if needed
+        if "login" in page.url or "challenge" in page.url:
+            print(f"   ⚠️  LinkedIn login required for {keyword}")
+            return jobs
+        
+        # Scroll to load more jobs
+        for _ in range(3):
+            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            await page.wait_for_timeout(2000)
+        
+        # Extract job cards
+        job_cards = page.locator(self.CARD_SELECTOR)
+        card_count = await job_cards.count()
+        
+        print(f"   📊 Found {card_count} LinkedIn jobs for '{keyword}' in {location}")
+        
+        for i in range(min(card_count, 20)):  # Process first 20
+            try:
+                await job_cards.nth(i).click()
+                await page.wait_for_timeout(2000)
+                
+                # Extract job details and check for the Easy Apply button in one round trip
+                details = await extract_fields(page, self.DETAIL_FIELDS, self.DETAIL_BUTTONS)
+                title = details['title']
+                company = details['company']
+                job_location = details['location']
+                description = details['description']
+                has_easy_apply = details['easy_apply']
+                
+                if title and company and has_easy_apply:
+                    job_id = hashlib.md5(f"{title}{company}{job_location}".encode()).hexdigest()[:12]
                     
-                    # Handle LinkedIn login if needed
-                    if "login" in page.url or "challenge" in page.url:
-                        print(f"   ⚠️  LinkedIn login required for {keyword}")
-                        continue
+                    job = JobListing(
+                        id=f"linkedin_{job_id}",
+                        title=title,
+                        company=company,
+                        location=job_location or location,
+                        description=description[:1000],
+                        requirements=self._extract_requirements(description),
+                        salary=None,  # LinkedIn often doesn't show salary
+                        experience_level=self._extract_experience_level(description),
+                        job_type="full-time",
+                        remote_friendly="remote" in description.lower() or "remote" in title.lower(),
+                        application_url=page.url,
+                        source_platform="LinkedIn",
+                        posted_date=None,
+                        skills_required=self._extract_skills(description),
+                        benefits=None,
+                        company_size=None,
+                        industry=None,
+                        scraped_at=datetime.now().isoformat()
+                    )
                     
-                    # Scroll to load more jobs
-                    for _ in range(3):
-                        await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                        await page.wait_for_timeout(2000)
+                    jobs.append(job)
+                    print(f"   ✅ {title} @ {company}")
                     
-                    # Extract job cards
-                    job_cards = await page.locator('[data-entity-urn*="urn:li:fsd_jobPosting"], .job-search-card').all()
-                    
-                    print(f"   📊 Found {len(job_cards)} LinkedIn jobs for '{keyword}' in {location}")
-                    
-                    for i, card in enumerate(job_cards[:20]):  # Process first 20
-                        try:
-                            await card.click()
-                            await page.wait_for_timeout(2000)
-                            
-                            # Extract job details
-                            title_elem = page.locator('.job-details-jobs-unified-top-card__job-title h1, .jobs-unified-top-card__job-title')
-                            company_elem = page.locator('.job-details-jobs-unified-top-card__company-name a, .jobs-unified-top-card__company-name')
-                            location_elem = page.locator('.job-details-jobs-unified-top-card__bullet, .jobs-unified-top-card__bullet')
-                            description_elem = page.locator('.jobs-description__content, .jobs-box__html-content')
-                            
-                            title = await self._safe_text(title_elem)
-                            company = await self._safe_text(company_elem)
-                            job_location = await self._safe_text(location_elem)
-                            description = await self._safe_text(description_elem)
-                            
-                            # Check for Easy Apply button
-                            easy_apply_btn = page.locator('button:has-text("Easy Apply"), .jobs-apply-button--top-card')
-                            has_easy_apply = await easy_apply_btn.count() > 0
-                            
-                            if title and company and has_easy_apply:
-                                job_id = hashlib.md5(f"{title}{company}{job_location}".encode()).hexdigest()[:12]
-                                
-                                job = JobListing(
-                                    id=f"linkedin_{job_id}",
-                                    title=title,
-                                    company=company,
-                                    location=job_location or location,
-                                    description=description[:1000],
-                                    requirements=self._extract_requirements(description),
-                                    salary=None,  # LinkedIn often doesn't show salary
-                                    experience_level=self._extract_experience_level(description),
-                                    job_type="full-time",
-                                    remote_friendly="remote" in description.lower() or "remote" in title.lower(),
-                                    application_url=page.url,
-                                    source_platform="LinkedIn",
-                                    posted_date=None,
-                                    skills_required=self._extract_skills(description),
-                                    benefits=None,
-                                    company_size=None,
-                                    industry=None,
-                                    scraped_at=datetime.now().isoformat()
-                                )
-                                
-                                jobs.append(job)
-                                print(f"   ✅ {title} @ {company}")
-                                
-                        except Exception as e:
-                            print(f"   ❌ Error processing LinkedIn job {i+1}: {str(e)}")
-                            continue
-                    
-                    await page.wait_for_timeout(3000)
-                    
-                except Exception as e:
-                    print(f"   ❌ Error scraping LinkedIn for '{keyword}': {str(e)}")
-                    continue
+            except Exception as e:
+                if page.is_closed():
+                    raise
+                print(f"   ❌ Error processing LinkedIn job {i+1}: {str(e)}")
+                continue
         
+        await page.wait_for_timeout(3000)
         return jobs
     
-    async def _safe_text(self, locator) -> str:
-        try:
-            if await locator.count() > 0:
-                return (await locator.first.text_content()).strip()
-        except:
-            pass
-        return ""
-    
     def _extract_requirements(self, description: str) -> str:
         """Extract requirements from job description"""
         requirements_patterns = [
@@ -212,94 +228,91 @@ class LinkedInScraper(JobPlatformScraper):
 class IndeedScraper(JobPlatformScraper):
     """Indeed job scraper with apply tracking"""
     
+    CARD_SELECTOR = '[data-jk], .job_seen_beacon'
+    DETAIL_FIELDS = {
+        'title': 'h1[data-testid="jobsearch-JobInfoHeader-title"], .jobsearch-JobInfoHeader-title',
+        'company': '[data-testid="inlineHeader-companyName"], .jobsearch-CompanyReview--link',
+        'location': '[data-testid="job-location"], .jobsearch-JobMetadataHeader-iconLabel',
+        'description': '[data-testid="jobsearch-jobDescriptionText"], .jobsearch-jobDescriptionText',
+        'salary': '[data-testid="jobsearch-JobMetadataHeader-item"], .jobsearch-JobMetadataHeader-item'
+    }
+    DETAIL_BUTTONS = {
+        'can_apply_directly': {'selector': '.ia-IndeedApplyButton', 'text': 'Apply now'}
+    }
+    
     def __init__(self):
         super().__init__("Indeed", "https://www.indeed.com/jobs")
     
-    async def scrape(self, keywords: List[str], locations: List[str], page: Page) -> List[JobListing]:
+    async def scrape_search(self, page: Page, keyword: str, location: str) -> List[JobListing]:
         jobs = []
         
-        for keyword in keywords[:3]:
-            for location in locations[:2]:
-                try:
-                    search_url = f"{self.base_url}?q={keyword.replace(' ', '+')}&l={location.replace(' ', '+')}"
-                    
-                    await page.goto(search_url)
-                    await page.wait_for_timeout(random.randint(2000, 4000))
-                    
-                    # Handle Indeed's popup if present
-                    try:
-                        popup_close = page.locator('button[aria-label="close"], .icl-CloseIcon')
-                        if await popup_close.count() > 0:
-                            await popup_close.first.click()
-                    except:
-                        pass
-                    
-                    # Extract job cards
-                    job_cards = await page.locator('[data-jk], .job_seen_beacon').all()
+        search_url = f"{self.base_url}?q={keyword.replace(' ', '+')}&l={location.replace(' ', '+')}"
+        
+        await page.goto(search_url)
+        await page.wait_for_timeout(random.randint(2000, 4000))
+        
+        # Handle Indeed's popup if present
+        try:
+            popup_close = page.locator('button[aria-label="close"], .icl-CloseIcon')
+            if await popup_close.count() > 0:
+                await popup_close.first.click()
+        except:
+            pass
+        
+        # Extract job cards
+        job_cards = page.locator(self.CARD_SELECTOR)
+        card_count = await job_cards.count()
+        
+        print(f"   📊 Found {card_count} Indeed jobs for '{keyword}' in {location}")
+        
+        for i in range(min(card_count, 15)):
+            try:
+                await job_cards.nth(i).click()
+                await page.wait_for_timeout(2000)
+                
+                # Extract job details in one round trip
+                details = await extract_fields(page, self.DETAIL_FIELDS, self.DETAIL_BUTTONS)
+                title = details['title']
+                company = details['company']
+                job_location = details['location']
+                description = details['description']
+                salary = details['salary']
+                
+                if title and company:
+                    job_id = hashlib.md5(f"{title}{company}{job_location}".encode()).hexdigest()[:12]
                     
-                    print(f"   📊 Found {len(job_cards)} Indeed jobs for '{keyword}' in {location}")
+                    job = JobListing(
+                        id=f"indeed_{job_id}",
+                        title=title,
+                        company=company,
+                        location=job_location or location,
+                        description=description[:1000],
+                        requirements=self._extract_requirements(description),
+                        salary=salary if '$' in salary else None,
+                        experience_level=self._extract_experience_level(description),
+                        job_type=self._extract_job_type(description),
+                        remote_friendly="remote" in description.lower() or "remote" in title.lower(),
+                        application_url=page.url,
+                        source_platform="Indeed",
+                        posted_date=None,
+                        skills_required=self._extract_skills(description),
+                        benefits=None,
+                        company_size=None,
+                        industry=None,
+                        scraped_at=datetime.now().isoformat()
+                    )
                     
-                    for i, card in enumerate(job_cards[:15]):
-                        try:
-                            await card.click()
-                            await page.wait_for_timeout(2000)
-                            
-                            # Extract job details
-                            title = await self._safe_text(page.locator('h1[data-testid="jobsearch-JobInfoHeader-title"], .jobsearch-JobInfoHeader-title'))
-                            company = await self._safe_text(page.locator('[data-testid="inlineHeader-companyName"], .jobsearch-CompanyReview--link'))
-                            job_location = await self._safe_text(page.locator('[data-testid="job-location"], .jobsearch-JobMetadataHeader-iconLabel'))
-                            description = await self._safe_text(page.locator('[data-testid="jobsearch-jobDescriptionText"], .jobsearch-jobDescriptionText'))
-                            salary = await self._safe_text(page.locator('[data-testid="jobsearch-JobMetadataHeader-item"], .jobsearch-JobMetadataHeader-item'))
-                            
-                            # Check if we can apply directly
-                            apply_btn = page.locator('button:has-text("Apply now"), .ia-IndeedApplyButton')
-                            can_apply_directly = await apply_btn.count() > 0
-                            
-                            if title and company:
-                                job_id = hashlib.md5(f"{title}{company}{job_location}".encode()).hexdigest()[:12]
-                                
-                                job = JobListing(
-                                    id=f"indeed_{job_id}",
-                                    title=title,
-                                    company=company,
-                                    location=job_location or location,
-                                    description=description[:1000],
-                                    requirements=self._extract_requirements(description),
-                                    salary=salary if '$' in salary else None,
-                                    experience_level=self._extract_experience_level(description),
-                                    job_type=self._extract_job_type(description),
-                                    remote_friendly="remote" in description.lower() or "remote" in title.lower(),
-                                    application_url=page.url,
-                                    source_platform="Indeed",
-                                    posted_date=None,
-                                    skills_required=self._extract_skills(description),
-                                    benefits=None,
-                                    company_size=None,
-                                    industry=None,
-                                    scraped_at=datetime.now().isoformat()
-                                )
-                                
-                                jobs.append(job)
-                                print(f"   ✅ {title} @ {company}")
-                                
-                        except Exception as e:
-                            print(f"   ❌ Error processing Indeed job {i+1}: {str(e)}")
-                            continue
+                    jobs.append(job)
+                    print(f"   ✅ {title} @ {company}")
                     
-                except Exception as e:
-                    print(f"   ❌ Error scraping Indeed for '{keyword}': {str(e)}")
-                    continue
+            except Exception as e:
+                if page.is_closed():
+                    raise
+                print(f"   ❌ Error processing Indeed job {i+1}: {str(e)}")
+                continue
         
         return jobs
     
-    async def _safe_text(self, locator) -> str:
-        try:
-            if await locator.count() > 0:
-                return (await locator.first.text_content()).strip()
-        except:
-            pass
-        return ""
-    
     def _extract_requirements(self, description: str) -> str:
         requirements_patterns = [
             r"Requirements?:?\s*(.*?)(?:\n\n|\n[A-Z]|$)",
@@ -342,89 +355,83 @@ class IndeedScraper(JobPlatformScraper):
 class RemoteOKScraper(JobPlatformScraper):
     """Remote OK scraper for remote jobs"""
     
+    CARD_SELECTOR = '.job, [data-jobid]'
+    CARD_FIELDS = {
+        'title': '.company h2, .title',
+        'company': '.company h3, .company_name'
+    }
+    CARD_LISTS = {
+        'tags': '.tag, .tags span'
+    }
+    DETAIL_FIELDS = {
+        'description': '.jobpage, .job-description'
+    }
+    
     def __init__(self):
         super().__init__("RemoteOK", "https://remoteok.io/remote-dev-jobs")
     
-    async def scrape(self, keywords: List[str], locations: List[str], page: Page) -> List[JobListing]:
+    def searches(self, keywords: List[str], locations: List[str]) -> List[Tuple[str, str]]:
+        # One listing page covers every keyword
+        return [("remote dev jobs", "Remote")]
+    
+    async def scrape_search(self, page: Page, keyword: str, location: str) -> List[JobListing]:
         jobs = []
         
-        try:
-            await page.goto(self.base_url)
-            await page.wait_for_timeout(3000)
-            
-            # Extract job listings
-            job_elements = await page.locator('.job, [data-jobid]').all()
-            
-            print(f"   📊 Found {len(job_elements)} RemoteOK jobs")
-            
-            for i, job_elem in enumerate(job_elements[:20]):
-                try:
-                    title = await self._safe_text(job_elem.locator('.company h2, .title'))
-                    company = await self._safe_text(job_elem.locator('.company h3, .company_name'))
-                    location = "Remote"
-                    tags = await self._get_tags(job_elem)
+        await page.goto(self.base_url)
+        await page.wait_for_timeout(3000)
+        
+        # Extract title, company and tags of every listing in one round trip
+        cards = await extract_cards(page, self.CARD_SELECTOR, self.CARD_FIELDS, self.CARD_LISTS)
+        job_elements = page.locator(self.CARD_SELECTOR)
+        
+        print(f"   📊 Found {len(cards)} RemoteOK jobs")
+        
+        for i, card in enumerate(cards[:20]):
+            try:
+                title = card['title']
+                company = card['company']
+                tags = [tag.lower() for tag in card['tags']]
+                
+                # Click to get more details
+                await job_elements.nth(i).click()
+                await page.wait_for_timeout(2000)
+                
+                description = (await extract_fields(page, self.DETAIL_FIELDS))['description']
+                
+                if title and company:
+                    job_id = hashlib.md5(f"{title}{company}remoteok".encode()).hexdigest()[:12]
                     
-                    # Click to get more details
-                    await job_elem.click()
-                    await page.wait_for_timeout(2000)
+                    job = JobListing(
+                        id=f"remoteok_{job_id}",
+                        title=title,
+                        company=company,
+                        location=location,
+                        description=description[:1000],
+                        requirements="",
+                        salary=None,
+                        experience_level="mid",
+                        job_type="full-time",
+                        remote_friendly=True,
+                        application_url=page.url,
+                        source_platform="RemoteOK",
+                        posted_date=None,
+                        skills_required=tags,
+                        benefits=None,
+                        company_size=None,
+                        industry=None,
+                        scraped_at=datetime.now().isoformat()
+                    )
                     
-                    description = await self._safe_text(page.locator('.jobpage, .job-description'))
+                    jobs.append(job)
+                    print(f"   ✅ {title} @ {company}")
                     
-                    if title and company:
-                        job_id = hashlib.md5(f"{title}{company}remoteok".encode()).hexdigest()[:12]
-                        
-                        job = JobListing(
-                            id=f"remoteok_{job_id}",
-                            title=title,
-                            company=company,
-                            location=location,
-                            description=description[:1000],
-                            requirements="",
-                            salary=None,
-                            experience_level="mid",
-                            job_type="full-time",
-                            remote_friendly=True,
-                            application_url=page.url,
-                            source_platform="RemoteOK",
-                            posted_date=None,
-                            skills_required=tags,
-                            benefits=None,
-                            company_size=None,
-                            industry=None,
-                            scraped_at=datetime.now().isoformat()
-                        )
-                        
-                        jobs.append(job)
-                        print(f"   ✅ {title} @ {company}")
-                        
-                except Exception as e:
-                    print(f"   ❌ Error processing RemoteOK job {i+1}: {str(e)}")
-                    continue
-                    
-        except Exception as e:
-            print(f"   ❌ Error scraping RemoteOK: {str(e)}")
+            except Exception as e:
+                if page.is_closed():
+                    raise
+                print(f"   ❌ Error processing RemoteOK job {i+1}: {str(e)}")
+                continue
         
         return jobs
-    
-    async def _safe_text(self, locator) -> str:
-        try:
-            if await locator.count() > 0:
-                return (await locator.first.text_content()).strip()
-        except:
-            pass
-        return ""
-    
-    async def _get_tags(self, job_elem) -> List[str]:
-        try:
-            tag_elements = await job_elem.locator('.tag, .tags span').all()
-            tags = []
-            for tag_elem in tag_elements:
-                tag_text = await self._safe_text(tag_elem)
-                if tag_text:
-                    tags.append(tag_text.lower())
-            return tags
-        except:
-            return []
 
 class UniversalJobScraper:
     """Universal job scraper orchestrating all platforms"""
@@ -517,9 +524,15 @@ class UniversalJobScraper:
         self, 
         keywords: List[str] = None, 
         locations: List[str] = None,
-        min_match_score: float = 0.6
+        min_match_score: float = 0.6,
+        pages_per_platform: int = 2,
+        max_navigations_per_page: int = 25
     ) -> List[JobListing]:
-        """Scrape jobs from all platforms and filter by match score"""
+        """Scrape jobs from all platforms concurrently and filter by match score
+        
+        Each platform gets ``pages_per_platform`` pooled pages, recycled after
+        ``max_navigations_per_page`` navigations or when they crash.
+        """
         
         if not keywords:
             keywords = [
@@ -548,39 +561,44 @@ class UniversalJobScraper:
                 ]
             )
             
-            context = await browser.new_context(
-                user_agent=random.choice(self.scrapers['linkedin'].user_agents),
-                viewport={'width': 1920, 'height': 1080}
+            pool = BrowserPagePool(
+                browser,
+                pages_per_platform=pages_per_platform,
+                max_navigations=max_navigations_per_page,
+                context_factory=lambda: {
+                    'user_agent': random.choice(self.scrapers['linkedin'].user_agents),
+                    'viewport': {'width': 1920, 'height': 1080}
+                }
             )
             
-            page = await context.new_page()
-            
-            # Scrape each platform
-            for platform_name, scraper in self.scrapers.items():
+            async def scrape_platform(platform_name: str, scraper: JobPlatformScraper) -> List[JobListing]:
                 try:
                     print(f"\n🔍 Scraping {platform_name.upper()}...")
-                    
-                    jobs = await scraper.scrape(keywords, locations, page)
-                    
-                    # Filter jobs by match score
-                    scored_jobs = []
-                    for job in jobs:
-                        match_score = self.calculate_job_match_score(job)
-                        if match_score >= min_match_score:
-                            job.match_score = match_score  # Add match score to job
-                            scored_jobs.append(job)
-                    
-                    print(f"   ✅ {len(scored_jobs)} high-match jobs from {platform_name}")
-                    all_jobs.extend(scored_jobs)
-                    
-                    # Random delay between platforms
-                    await asyncio.sleep(random.randint(5, 10))
-                    
+                    return await scraper.scrape(keywords, locations, pool)
                 except Exception as e:
                     print(f"   ❌ Error scraping {platform_name}: {str(e)}")
-                    continue
+                    return []
             
-            await browser.close()
+            # Scrape all platforms concurrently, each on its own pages
+            try:
+                platform_jobs = await asyncio.gather(
+                    *(scrape_platform(name, scraper) for name, scraper in self.scrapers.items())
+                )
+            finally:
+                await pool.close()
+                await browser.close()
+        
+        for platform_name, jobs in zip(self.scrapers, platform_jobs):
+            # Filter jobs by match score
+            scored_jobs = []
+            for job in jobs:
+                match_score = self.calculate_job_match_score(job)
+                if match_score >= min_match_score:
+                    job.match_score = match_score  # Add match score to job
+                    scored_jobs.append(job)
+            
+            print(f"   ✅ {len(scored_jobs)} high-match jobs from {platform_name}")
+            all_jobs.extend(scored_jobs)
         
         # Sort by match score (highest first)
         all_jobs.sort(key=lambda x: getattr(x, 'match_score', 0), reverse=True)
@@ -634,6 +652,9 @@ class UniversalJobScraper:
         
         print(f"💾 Saved {len(jobs)} jobs to {output_file}")
         
+        # Columnar copy that load_jobs() memory-maps instead of parsing the JSON
+        JobStore.from_records(jobs_data).save(output_dir / Path(filename).stem)
+        
         # Also save a summary
         summary = {
             'total_jobs': len(jobs),
@@ -647,6 +668,25 @@ class UniversalJobScraper:
         with open(output_dir / 'scraping_summary.json', 'w') as f:
             json.dump(summary, f, indent=2)
     
+    def load_jobs(self, filename: str = "scraped_jobs.json") -> List[JobListing]:
+        """Load jobs written by save_jobs(), from the columnar store when present"""
+        output_dir = Path("data/scraped_jobs")
+        store_dir = output_dir / Path(filename).stem
+        if (store_dir / 'meta.json').exists():
+            records = iter(JobStore.load(store_dir))
+        else:
+            with open(output_dir / filename, 'r', encoding='utf-8') as f:
+                records = json.load(f)
+        
+        jobs = []
+        for record in records:
+            match_score = record.pop('match_score', None)
+            job = JobListing(**record)
+            if match_score is not None:
+                job.match_score = match_score
+            jobs.append(job)
+        return jobs
+    
     def _analyze_skill_distribution(self, jobs: List[JobListing]) -> Dict[str, int]:
         """Analyze skill distribution across jobs"""
         skill_count = {}
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+🗄️ Columnar Job Store
+Compact, memory-mappable storage for large job corpora shared across modules
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from dataclasses import asdict, is_dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+# Low-cardinality fields, stored as int32 codes into an interned vocabulary.
+# ``layout`` is internal: the JSON list of a row's original field names and
+# the column each one is stored in, so records come back exactly as written.
+CATEGORICAL_COLUMNS = ('company', 'location', 'platform', 'source', 'country', 'job_type', 'experience_level',
+                       'layout')
+
+# Free text, stored as one UTF-8 blob per column plus row offsets
+TEXT_COLUMNS = ('id', 'title', 'url', 'salary', 'posted_date', 'description', 'extra')
+
+NUMERIC_COLUMNS = ('match_score',)
+
+# Field names used by the scrapers' record types, mapped onto store columns;
+# the original names are restored on read
+FIELD_ALIASES = {
+    'job_id': 'id',
+    'link': 'url',
+    'application_url': 'url',
+    'source_platform': 'platform',
+    'salary_range': 'salary',
+    'score': 'match_score',
+}
+
+FORMAT_VERSION = 2
+
+
+def _as_dict(record: Any) -> Dict[str, Any]:
+    if isinstance(record, dict):
+        return record
+    if is_dataclass(record):
+        return asdict(record)
+    return dict(vars(record))
+
+
+def _column_for(key: str, value: Any) -> Optional[str]:
+    """Store column that can hold ``value`` without changing its type, if any."""
+    column = FIELD_ALIASES.get(key, key)
+    if (column in CATEGORICAL_COLUMNS and column != 'layout') or (column in TEXT_COLUMNS and column != 'extra'):
+        return column if isinstance(value, str) else None
+    if column in NUMERIC_COLUMNS:
+        return column if isinstance(value, float) else None
+    return None
+
+
+def _encode_extra(value: Any) -> Any:
+    # JSON has no tuples; tag them so they are rebuilt as tuples
+    if isinstance(value, tuple):
+        return {'__tuple__': [_encode_extra(item) for item in value]}
+    if isinstance(value, list):
+        return [_encode_extra(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _encode_extra(item) for key, item in value.items()}
+    return value
+
+
+def _decode_extra(value: Dict[str, Any]) -> Any:
+    if set(value) == {'__tuple__'}:
+        return tuple(value['__tuple__'])
+    return value
+
+
+class JobStoreBuilder:
+    """Accumulates job records column by column
+
+    Accepts dicts or dataclass instances (``JobListing``, ``JobOpportunity``,
+    ...). Known string fields (and a float ``match_score``/``score``) are
+    mapped onto the store's columns through ``FIELD_ALIASES``; every other
+    field, or a known one holding another type (``None``, a salary tuple,
+    ...), is kept as JSON in the ``extra`` text column.
+    """
+
+    def __init__(self):
+        self._vocab: Dict[str, Dict[str, int]] = {name: {} for name in CATEGORICAL_COLUMNS}
+        self._codes: Dict[str, List[int]] = {name: [] for name in CATEGORICAL_COLUMNS}
+        self._blobs: Dict[str, bytearray] = {name: bytearray() for name in TEXT_COLUMNS}
+        self._offsets: Dict[str, List[int]] = {name: [0] for name in TEXT_COLUMNS}
+        self._numbers: Dict[str, List[float]] = {name: [] for name in NUMERIC_COLUMNS}
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, record: Any) -> int:
+        """Add one record and return its row number."""
+        values: Dict[str, Any] = {}
+        extra: Dict[str, Any] = {}
+        layout = []
+        for key, value in _as_dict(record).items():
+            column = _column_for(key, value)
+            if column is None or column in values:
+                extra[key] = _encode_extra(value)
+                column = None
+            else:
+                values[column] = value
+            layout.append((key, column))
+        if extra:
+            values['extra'] = json.dumps(extra, default=str)
+        values['layout'] = json.dumps(layout)
+
+        for name in CATEGORICAL_COLUMNS:
+            value = values.get(name)
+            vocab = self._vocab[name]
+            if value is None:
+                self._codes[name].append(-1)
+                continue
+            code = vocab.get(value)
+            if code is None:
+                code = vocab[value] = len(vocab)
+            self._codes[name].append(code)
+
+        for name in TEXT_COLUMNS:
+            value = values.get(name)
+            if value:
+                self._blobs[name].extend(value.encode('utf-8'))
+            self._offsets[name].append(len(self._blobs[name]))
+
+        for name in NUMERIC_COLUMNS:
+            self._numbers[name].append(values.get(name, np.nan))
+
+        self._count += 1
+        return self._count - 1
+
+    def extend(self, records: Iterable[Any]) -> None:
+        for record in records:
+            self.append(record)
+
+    def build(self) -> 'JobStore':
+        """Freeze the accumulated columns into an in-memory :class:`JobStore`."""
+        columns = {}
+        for name in CATEGORICAL_COLUMNS:
+            columns[f'{name}.codes'] = np.asarray(self._codes[name], dtype=np.int32)
+        for name in TEXT_COLUMNS:
+            columns[f'{name}.blob'] = np.frombuffer(bytes(self._blobs[name]), dtype=np.uint8)
+            columns[f'{name}.offsets'] = np.asarray(self._offsets[name], dtype=np.int64)
+        for name in NUMERIC_COLUMNS:
+            columns[f'{name}.values'] = np.asarray(self._numbers[name], dtype=np.float64)
+        vocabularies = {name: list(vocab) for name, vocab in self._vocab.items()}
+        return JobStore(self._count, vocabularies, columns)
+
+
+class JobStore:
+    """Read-only columnar job corpus
+
+    Categorical columns are int32 codes (``-1`` for missing) into per-column
+    vocabularies, text columns are UTF-8 blobs addressed by int64 offsets, and
+    ``match_score`` is a float64 array. :meth:`save` writes one ``.npy`` file
+    per array plus ``meta.json``; :meth:`load` memory-maps them, so several
+    processes can share one corpus through the page cache without copying.
+    Rows read back equal the records that were stored, with their original
+    field names, order and value types.
+    """
+
+    def __init__(self, count: int, vocabularies: Dict[str, List[str]], columns: Dict[str, np.ndarray]):
+        self._count = count
+        self.vocabularies = vocabularies
+        self._columns = columns
+        self._lookup = {name: {value: code for code, value in enumerate(vocab)}
+                        for name, vocab in vocabularies.items()}
+
+    @classmethod
+    def from_records(cls, records: Iterable[Any]) -> 'JobStore':
+        builder = JobStoreBuilder()
+        builder.extend(records)
+        return builder.build()
+
+    @classmethod
+    def from_jsonl(cls, path: str) -> 'JobStore':
+        """Build a store from a JSONL file of job records, streaming line by line."""
+        def records():
+            with open(path, encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+        return cls.from_records(records())
+
+    # ------------------------------------------------------------------ access
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, row: int) -> Dict[str, Any]:
+        if row < 0:
+            row += self._count
+        if not 0 <= row < self._count:
+            raise IndexError(row)
+        extra = self.text('extra', row)
+        extra = json.loads(extra, object_hook=_decode_extra) if extra else {}
+        record: Dict[str, Any] = {}
+        for key, column in json.loads(self._category('layout', row)):
+            if column is None:
+                record[key] = extra[key]
+            elif column in CATEGORICAL_COLUMNS:
+                record[key] = self._category(column, row)
+            elif column in TEXT_COLUMNS:
+                record[key] = self.text(column, row)
+            else:
+                record[key] = float(self._columns[f'{column}.values'][row])
+        return record
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for row in range(self._count):
+            yield self[row]
+
+    def _category(self, column: str, row: int) -> str:
+        return self.vocabularies[column][int(self._columns[f'{column}.codes'][row])]
+
+    def text(self, column: str, row: int) -> str:
+        """Decode one cell of a text column."""
+        offsets = self._columns[f'{column}.offsets']
+        start, end = int(offsets[row]), int(offsets[row + 1])
+        return bytes(self._columns[f'{column}.blob'][start:end]).decode('utf-8')
+
+    def texts(self, column: str, rows: Optional[Iterable[int]] = None) -> Iterator[str]:
+        """Decode a text column lazily, optionally only for ``rows``."""
+        for row in (range(self._count) if rows is None else rows):
+            yield self.text(column, int(row))
+
+    def codes(self, column: str) -> np.ndarray:
+        """Raw int32 codes of a categorical column."""
+        return self._columns[f'{column}.codes']
+
+    def values(self, column: str) -> np.ndarray:
+        """Float64 values of a numeric column (NaN where missing)."""
+        return self._columns[f'{column}.values']
+
+    def where(self, **criteria: Any) -> np.ndarray:
+        """Row numbers whose categorical columns equal the given values.
+
+        Each criterion may be a single value or a collection of values, e.g.
+        ``store.where(platform='LinkedIn', location=['Berlin', 'Remote'])``.
+        """
+        mask = np.ones(self._count, dtype=bool)
+        for column, wanted in criteria.items():
+            if isinstance(wanted, (str, bytes)) or not isinstance(wanted, Iterable):
+                wanted = [wanted]
+            codes = [self._lookup[column][value] for value in wanted if value in self._lookup[column]]
+            mask &= np.isin(self.codes(column), codes)
+        return np.flatnonzero(mask)
+
+    # ------------------------------------------------------------- persistence
+    def save(self, path: str) -> None:
+        """Write the store to directory ``path``.
+
+        The store is written to a sibling staging directory and swapped in by
+        rename, so stores already memory-mapped from ``path`` keep reading the
+        old files and a crash mid-save never leaves ``meta.json`` out of step
+        with the columns.
+        """
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f'.{target.name}.', suffix='.tmp', dir=target.parent))
+        try:
+            for name, array in self._columns.items():
+                np.save(staging / f'{name}.npy', array)
+            meta = {
+                'version': FORMAT_VERSION,
+                'count': self._count,
+                'vocabularies': self.vocabularies,
+            }
+            (staging / 'meta.json').write_text(json.dumps(meta, ensure_ascii=False), encoding='utf-8')
+
+            if target.exists():
+                retired = staging.with_suffix('.old')
+                os.replace(target, retired)
+                os.replace(staging, target)
+                shutil.rmtree(retired, ignore_errors=True)
+            else:
+                os.replace(staging, target)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> 'JobStore':
+        """Open a store written by :meth:`save`, memory-mapped unless ``mmap`` is False."""
+        target = Path(path)
+        meta = json.loads((target / 'meta.json').read_text(encoding='utf-8'))
+        if meta.get('version') != FORMAT_VERSION:
+            raise ValueError(f"Unsupported job store version: {meta.get('version')}")
+        mode = 'r' if mmap else None
+        columns = {}
+        for name in CATEGORICAL_COLUMNS:
+            columns[f'{name}.codes'] = np.load(target / f'{name}.codes.npy', mmap_mode=mode)
+        for name in TEXT_COLUMNS:
+            columns[f'{name}.blob'] = np.load(target / f'{name}.blob.npy', mmap_mode=mode)
+            columns[f'{name}.offsets'] = np.load(target / f'{name}.offsets.npy', mmap_mode=mode)
+        for name in NUMERIC_COLUMNS:
+            columns[f'{name}.values'] = np.load(target / f'{name}.values.npy', mmap_mode=mode)
+        return cls(meta['count'], meta['vocabularies'], columns)
+
+    def nbytes(self) -> int:
+        """Size of all column arrays in bytes (excluding vocabularies)."""
+        return sum(array.nbytes for array in self._columns.values())
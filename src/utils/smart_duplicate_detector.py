@@ -8,17 +8,28 @@ import os
 import json
 import logging
 import hashlib
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from pathlib import Path
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
 from urllib.parse import urlparse
 import re
-from sentence_transformers import SentenceTransformer
+import zlib
+import sqlite3
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from collections.abc import MutableMapping
+import sys
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
 from difflib import SequenceMatcher
 
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from ml_models.embedding_cache import EmbeddingCache, encode_cached
+from ml_models.model_registry import get_model, register_model, sentence_transformer_loader
+
+SIMILARITY_MODEL_NAME = 'all-MiniLM-L6-v2'
+register_model(SIMILARITY_MODEL_NAME, sentence_transformer_loader(SIMILARITY_MODEL_NAME))
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -46,21 +57,422 @@ class DuplicateMatch:
     matching_factors: List[str]
     confidence: float
 
+class MinHashLSH:
+    """MinHash signatures with banded LSH buckets over character shingles.
+    
+    Two strings land in a shared bucket with high probability when their
+    shingle sets overlap, so only those pairs need full similarity scoring.
+    With the defaults (32 bands of 2 rows) the collision probability is about
+    50% at Jaccard 0.15 and above 99% at Jaccard 0.5.
+    """
+    
+    _PRIME = (1 << 31) - 1
+    
+    def __init__(self, num_bands: int = 32, rows_per_band: int = 2, shingle_size: int = 3, seed: int = 1):
+        self.num_bands = num_bands
+        self.rows_per_band = rows_per_band
+        self.shingle_size = shingle_size
+        num_perm = num_bands * rows_per_band
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, self._PRIME, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, self._PRIME, size=num_perm, dtype=np.uint64)
+        self._buckets: Dict[Tuple[int, bytes], Set[str]] = defaultdict(set)
+        self._keys: Dict[str, List[Tuple[int, bytes]]] = {}
+    
+    def _shingles(self, text: str) -> Set[int]:
+        text = re.sub(r'\s+', ' ', text.lower()).strip()
+        if len(text) <= self.shingle_size:
+            return {zlib.crc32(text.encode()) % self._PRIME} if text else set()
+        return {
+            zlib.crc32(text[i:i + self.shingle_size].encode()) % self._PRIME
+            for i in range(len(text) - self.shingle_size + 1)
+        }
+    
+    def _band_keys(self, text: str) -> List[Tuple[int, bytes]]:
+        shingles = self._shingles(text)
+        if not shingles:
+            return []
+        values = np.fromiter(shingles, dtype=np.uint64)
+        signature = ((np.outer(self._a, values) + self._b[:, None]) % self._PRIME).min(axis=1)
+        bands = signature.reshape(self.num_bands, self.rows_per_band)
+        return [(band, bands[band].tobytes()) for band in range(self.num_bands)]
+    
+    def add(self, key: str, text: str):
+        self.remove(key)
+        band_keys = self._band_keys(text)
+        self._keys[key] = band_keys
+        for band_key in band_keys:
+            self._buckets[band_key].add(key)
+    
+    def remove(self, key: str):
+        for band_key in self._keys.pop(key, []):
+            bucket = self._buckets.get(band_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band_key]
+    
+    def query(self, text: str) -> Set[str]:
+        candidates: Set[str] = set()
+        for band_key in self._band_keys(text):
+            candidates.update(self._buckets.get(band_key, ()))
+        return candidates
+
+class ApplicationStore(ABC):
+    """Persistence backend for JobApplication records
+    
+    ``get`` returns a fresh copy: changing a returned application does not
+    persist until it is passed back to ``put``.
+    """
+    
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[JobApplication]:
+        pass
+    
+    @abstractmethod
+    def put(self, app: JobApplication):
+        pass
+    
+    @abstractmethod
+    def delete(self, job_id: str):
+        pass
+    
+    @abstractmethod
+    def iter_ids(self) -> Iterator[str]:
+        pass
+    
+    @abstractmethod
+    def iter_applications(self) -> Iterator[JobApplication]:
+        pass
+    
+    @abstractmethod
+    def count(self) -> int:
+        pass
+    
+    def find_by_url(self, job_url: str) -> List[JobApplication]:
+        return [app for app in self.iter_applications() if app.job_url == job_url]
+    
+    def put_many(self, apps: List[JobApplication]):
+        for app in apps:
+            self.put(app)
+    
+    def flush(self):
+        """Make every accepted write durable (no-op by default)"""
+    
+    def compact(self):
+        """Reclaim space from superseded records (no-op by default)"""
+    
+    def close(self):
+        pass
+
+class JSONApplicationStore(ApplicationStore):
+    """Legacy single-document JSON file, rewritten in full on every change"""
+    
+    def __init__(self, path: Path):
+        self.path = path
+        self._apps: Dict[str, JobApplication] = {}
+        try:
+            if self.path.exists():
+                with open(self.path, 'r') as f:
+                    for job_id, app_data in json.load(f).items():
+                        self._apps[job_id] = JobApplication(**app_data)
+        except Exception as e:
+            logger.error(f"Error loading applications database: {e}")
+    
+    def _save(self):
+        try:
+            data = {job_id: asdict(app) for job_id, app in self._apps.items()}
+            with open(self.path, 'w') as f:
+                json.dump(data, f, indent=2)
+        except Exception as e:
+            logger.error(f"Error saving applications database: {e}")
+    
+    def get(self, job_id: str) -> Optional[JobApplication]:
+        app = self._apps.get(job_id)
+        return replace(app) if app is not None else None
+    
+    def put(self, app: JobApplication):
+        self._apps[app.job_id] = app
+        self._save()
+    
+    def put_many(self, apps: List[JobApplication]):
+        for app in apps:
+            self._apps[app.job_id] = app
+        self._save()
+    
+    def delete(self, job_id: str):
+        if self._apps.pop(job_id, None) is not None:
+            self._save()
+    
+    def iter_ids(self) -> Iterator[str]:
+        return iter(list(self._apps))
+    
+    def iter_applications(self) -> Iterator[JobApplication]:
+        return iter([replace(app) for app in self._apps.values()])
+    
+    def find_by_url(self, job_url: str) -> List[JobApplication]:
+        return [replace(app) for app in self._apps.values() if app.job_url == job_url]
+    
+    def count(self) -> int:
+        return len(self._apps)
+
+class JSONLApplicationStore(JSONApplicationStore):
+    """Append-only JSONL log of put/delete records with periodic compaction
+    
+    Each change appends one line, so writes are O(1); the log is rewritten
+    once superseded records outnumber live ones by ``compaction_ratio``.
+    """
+    
+    def __init__(self, path: Path, compaction_ratio: float = 2.0):
+        self.path = path
+        self.compaction_ratio = compaction_ratio
+        self._apps: Dict[str, JobApplication] = {}
+        self._log_records = 0
+        if self.path.exists():
+            with open(self.path, 'r') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning("Skipping corrupt application log record")
+                        continue
+                    self._log_records += 1
+                    if record.get("op") == "delete":
+                        self._apps.pop(record["job_id"], None)
+                    else:
+                        app = JobApplication(**record["app"])
+                        self._apps[app.job_id] = app
+        self._log = open(self.path, 'a')
+    
+    def _append(self, record: Dict):
+        self._log.write(json.dumps(record) + "\n")
+        self._log.flush()
+        self._log_records += 1
+        if self._log_records > max(64, len(self._apps) * self.compaction_ratio):
+            self.compact()
+    
+    def put(self, app: JobApplication):
+        self._apps[app.job_id] = app
+        self._append({"op": "put", "app": asdict(app)})
+    
+    def put_many(self, apps: List[JobApplication]):
+        for app in apps:
+            self.put(app)
+    
+    def delete(self, job_id: str):
+        if self._apps.pop(job_id, None) is not None:
+            self._append({"op": "delete", "job_id": job_id})
+    
+    def flush(self):
+        self._log.flush()
+        os.fsync(self._log.fileno())
+    
+    def compact(self):
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, 'w') as f:
+            for app in self._apps.values():
+                f.write(json.dumps({"op": "put", "app": asdict(app)}) + "\n")
+        self._log.close()
+        os.replace(tmp_path, self.path)
+        self._log = open(self.path, 'a')
+        self._log_records = len(self._apps)
+    
+    def close(self):
+        if not self._log.closed:
+            self._log.close()
+
+class SQLiteApplicationStore(ApplicationStore):
+    """SQLite (WAL mode) store with indexed lookups by job_id and URL
+    
+    Nothing is loaded at startup; records are read on demand.
+    """
+    
+    def __init__(self, path: Path):
+        self.path = path
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS applications ("
+            " job_id TEXT PRIMARY KEY,"
+            " job_url TEXT,"
+            " data TEXT NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_applications_url ON applications (job_url)")
+        self._conn.commit()
+    
+    def get(self, job_id: str) -> Optional[JobApplication]:
+        row = self._conn.execute("SELECT data FROM applications WHERE job_id = ?", (job_id,)).fetchone()
+        return JobApplication(**json.loads(row[0])) if row else None
+    
+    def put(self, app: JobApplication):
+        self.put_many([app])
+    
+    def put_many(self, apps: List[JobApplication]):
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO applications (job_id, job_url, data) VALUES (?, ?, ?)",
+                [(app.job_id, app.job_url, json.dumps(asdict(app))) for app in apps]
+            )
+    
+    def delete(self, job_id: str):
+        with self._conn:
+            self._conn.execute("DELETE FROM applications WHERE job_id = ?", (job_id,))
+    
+    def iter_ids(self) -> Iterator[str]:
+        for (job_id,) in self._conn.execute("SELECT job_id FROM applications").fetchall():
+            yield job_id
+    
+    def iter_applications(self) -> Iterator[JobApplication]:
+        for (data,) in self._conn.execute("SELECT data FROM applications"):
+            yield JobApplication(**json.loads(data))
+    
+    def count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM applications").fetchone()[0]
+    
+    def find_by_url(self, job_url: str) -> List[JobApplication]:
+        rows = self._conn.execute("SELECT data FROM applications WHERE job_url = ?", (job_url,)).fetchall()
+        return [JobApplication(**json.loads(data)) for (data,) in rows]
+    
+    def flush(self):
+        self._conn.commit()
+    
+    def compact(self):
+        self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    
+    def close(self):
+        self._conn.close()
+
+class ApplicationEmbeddings:
+    """Contiguous matrices of normalized field embeddings for stored applications
+    
+    One row per application with its title, company and description-prefix
+    vectors, so a new job is scored against every stored one with a single
+    matrix-vector product per field.  Rows of removed applications are zeroed
+    and dropped when the matrices are rebuilt from the persistent embedding
+    cache on the next startup.
+    """
+    
+    FIELDS = ("title", "company", "description")
+    
+    def __init__(self):
+        self._rows: Dict[str, int] = {}
+        self._matrices: Optional[Dict[str, np.ndarray]] = None
+        self._size = 0
+    
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self._rows
+    
+    def add(self, job_id: str, vectors: Dict[str, np.ndarray]):
+        if self._matrices is None:
+            dim = len(vectors["title"])
+            self._matrices = {field: np.zeros((64, dim), dtype=np.float32) for field in self.FIELDS}
+        row = self._rows.get(job_id)
+        if row is None:
+            row = self._size
+            self._size += 1
+            self._rows[job_id] = row
+            capacity = len(self._matrices["title"])
+            if self._size > capacity:
+                for field in self.FIELDS:
+                    grown = np.zeros((capacity * 2, self._matrices[field].shape[1]), dtype=np.float32)
+                    grown[:capacity] = self._matrices[field]
+                    self._matrices[field] = grown
+        for field in self.FIELDS:
+            self._matrices[field][row] = vectors[field]
+    
+    def remove(self, job_id: str):
+        row = self._rows.pop(job_id, None)
+        if row is not None and self._matrices is not None:
+            for field in self.FIELDS:
+                self._matrices[field][row] = 0.0
+    
+    def similarities(self, vectors: Dict[str, np.ndarray], job_ids) -> Dict[str, Dict[str, float]]:
+        """Cosine similarity of ``vectors`` to stored applications, per field
+        
+        Scores are computed for every stored row at once and returned for the
+        requested ``job_ids`` that have embeddings.
+        """
+        result = {field: {} for field in self.FIELDS}
+        if self._matrices is None or not self._rows:
+            return result
+        rows = [(job_id, self._rows[job_id]) for job_id in job_ids if job_id in self._rows]
+        for field in self.FIELDS:
+            scores = self._matrices[field][:self._size] @ vectors[field]
+            result[field] = {job_id: float(scores[row]) for job_id, row in rows}
+        return result
+
+class StoredApplications(MutableMapping):
+    """Dict-like ``job_id -> JobApplication`` view that writes through to a store
+    
+    Values are copies read from the store, so an application changed in place
+    must be assigned back (``applications[job_id] = app``) to be saved.
+    """
+    
+    def __init__(self, store: ApplicationStore):
+        self.store = store
+    
+    def __getitem__(self, job_id: str) -> JobApplication:
+        app = self.store.get(job_id)
+        if app is None:
+            raise KeyError(job_id)
+        return app
+    
+    def __setitem__(self, job_id: str, app: JobApplication):
+        self.store.put(app)
+    
+    def __delitem__(self, job_id: str):
+        if self.store.get(job_id) is None:
+            raise KeyError(job_id)
+        self.store.delete(job_id)
+    
+    def __iter__(self) -> Iterator[str]:
+        return self.store.iter_ids()
+    
+    def __len__(self) -> int:
+        return self.store.count()
+    
+    def __contains__(self, job_id) -> bool:
+        return self.store.get(job_id) is not None
+    
+    def values(self):
+        return self.store.iter_applications()
+    
+    def items(self):
+        return ((app.job_id, app) for app in self.store.iter_applications())
+
+STORAGE_BACKENDS = {
+    "json": (JSONApplicationStore, ".json"),
+    "jsonl": (JSONLApplicationStore, ".jsonl"),
+    "sqlite": (SQLiteApplicationStore, ".sqlite"),
+}
+
 class SmartDuplicateDetector:
-    def __init__(self, applications_db_path: str = "data/job_applications.json"):
+    """Detects duplicate job applications against a persistent store
+    
+    Applications are kept in SQLite by default; a legacy
+    ``job_applications.json`` next to ``applications_db_path`` is imported
+    into the new store once, the first time it is opened empty.  Pass
+    ``storage_backend="json"`` to keep using the single JSON document.
+    Call :meth:`close` (or use the detector as a context manager) to release
+    the store.
+    """
+    
+    def __init__(self, applications_db_path: str = "data/job_applications.json", storage_backend: str = "sqlite"):
         self.db_path = Path(applications_db_path)
         self.db_path.parent.mkdir(exist_ok=True)
         
-        # Load existing applications
-        self.applications = self._load_applications()
+        # Open the application store (migrating a legacy JSON file if needed)
+        self._store = self._open_store(storage_backend)
+        self.applications = StoredApplications(self._store)
         
-        # Initialize semantic similarity model
-        try:
-            self.similarity_model = SentenceTransformer('all-MiniLM-L6-v2')
-            logger.info("Similarity model loaded successfully")
-        except Exception as e:
-            logger.warning(f"Could not load similarity model: {e}")
-            self.similarity_model = None
+        # Semantic similarity model is loaded on first use; field embeddings
+        # are cached on disk by content hash and kept as contiguous matrices
+        self._similarity_model_failed = False
+        self._embedding_cache: Optional[EmbeddingCache] = None
+        self._embeddings = ApplicationEmbeddings()
         
         # Similarity thresholds
         self.thresholds = {
@@ -85,33 +497,65 @@ class SmartDuplicateDetector:
         
         # Company name variations and aliases
         self.company_aliases = self._load_company_aliases()
+        
+        # Blocking indexes: only applications sharing a URL, canonical job id,
+        # company + title band or LSH bucket are fully compared.  Built on the
+        # first duplicate check so startup does not scale with history size.
+        self._url_index: Dict[str, Set[str]] = defaultdict(set)
+        self._canonical_index: Dict[str, Set[str]] = defaultdict(set)
+        self._company_title_index: Dict[str, Set[str]] = defaultdict(set)
+        self._lsh = MinHashLSH()
+        self._blocking_ready = False
     
-    def _load_applications(self) -> Dict[str, JobApplication]:
-        """Load job applications from database"""
+    @property
+    def similarity_model(self):
+        """Sentence transformer for semantic similarity, or None if unavailable"""
+        if self._similarity_model_failed:
+            return None
         try:
-            if self.db_path.exists():
-                with open(self.db_path, 'r') as f:
-                    data = json.load(f)
-                    applications = {}
-                    for job_id, app_data in data.items():
-                        applications[job_id] = JobApplication(**app_data)
-                    return applications
-            return {}
+            return get_model(SIMILARITY_MODEL_NAME)
         except Exception as e:
-            logger.error(f"Error loading applications database: {e}")
-            return {}
+            logger.warning(f"Could not load similarity model: {e}")
+            self._similarity_model_failed = True
+            return None
+    
+    def _open_store(self, storage_backend: str) -> ApplicationStore:
+        """Open the configured backend, importing the legacy JSON file once"""
+        if storage_backend not in STORAGE_BACKENDS:
+            raise ValueError(f"Unknown storage backend: {storage_backend}")
+        store_class, suffix = STORAGE_BACKENDS[storage_backend]
+        if storage_backend == "json":
+            return store_class(self.db_path)
+        
+        store = store_class(self.db_path.with_suffix(suffix))
+        if store.count() == 0 and self.db_path.suffix == ".json" and self.db_path.exists():
+            legacy = JSONApplicationStore(self.db_path)
+            if legacy.count():
+                store.put_many(list(legacy.iter_applications()))
+                logger.info(f"Migrated {legacy.count()} applications from {self.db_path}")
+        return store
     
     def _save_applications(self):
-        """Save applications to database"""
-        try:
-            data = {}
-            for job_id, app in self.applications.items():
-                data[job_id] = asdict(app)
-            
-            with open(self.db_path, 'w') as f:
-                json.dump(data, f, indent=2)
-        except Exception as e:
-            logger.error(f"Error saving applications database: {e}")
+        """Flush pending writes to the application store"""
+        self._store.flush()
+    
+    def compact_storage(self):
+        """Reclaim space from superseded records in the application store"""
+        self._store.compact()
+    
+    def close(self):
+        """Flush and close the application store and embedding cache"""
+        self._store.flush()
+        self._store.close()
+        if self._embedding_cache is not None:
+            self._embedding_cache.close()
+            self._embedding_cache = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
     
     def _load_company_aliases(self) -> Dict[str, List[str]]:
         """Load company name aliases and variations"""
@@ -209,8 +653,13 @@ class SmartDuplicateDetector:
         
         return company
     
-    def calculate_text_similarity(self, text1: str, text2: str) -> float:
-        """Calculate similarity between two text strings"""
+    def calculate_text_similarity(self, text1: str, text2: str, semantic_similarity: Optional[float] = None) -> float:
+        """Calculate similarity between two text strings
+        
+        ``semantic_similarity`` may be passed in when it was already computed
+        from cached embeddings; otherwise both texts are embedded (through the
+        embedding cache) if the model is available.
+        """
         if not text1 or not text2:
             return 0.0
         
@@ -218,49 +667,178 @@ class SmartDuplicateDetector:
         basic_similarity = SequenceMatcher(None, text1.lower(), text2.lower()).ratio()
         
         # Use semantic similarity if model available
-        if self.similarity_model:
+        if semantic_similarity is None and self.similarity_model:
             try:
-                embeddings = self.similarity_model.encode([text1, text2])
-                semantic_similarity = cosine_similarity([embeddings[0]], [embeddings[1]])[0][0]
-                # Combine both similarities
-                return (basic_similarity + semantic_similarity) / 2
+                embeddings = self._encode_texts([text1, text2])
+                semantic_similarity = float(embeddings[0] @ embeddings[1])
             except Exception as e:
                 logger.warning(f"Semantic similarity calculation failed: {e}")
         
+        if semantic_similarity is not None:
+            # Combine both similarities
+            return (basic_similarity + semantic_similarity) / 2
+        
         return basic_similarity
     
-    def find_duplicates(self, job_application: JobApplication) -> List[DuplicateMatch]:
-        """Find potential duplicates for a given job application"""
+    def _encode_texts(self, texts: List[str]) -> np.ndarray:
+        """Normalized embeddings for ``texts``, reusing the persistent cache"""
+        if self._embedding_cache is None:
+            cache_path = self.db_path.with_name(f"{self.db_path.stem}_embeddings.sqlite")
+            self._embedding_cache = EmbeddingCache(SIMILARITY_MODEL_NAME, str(cache_path))
+        model = self.similarity_model
+        return encode_cached(lambda batch: model.encode(batch), texts, cache=self._embedding_cache)
+    
+    def _field_texts(self, app: JobApplication) -> Dict[str, str]:
+        """Normalized fields that are compared semantically"""
+        return {
+            "title": self.normalize_job_title(app.job_title),
+            "company": self.normalize_company_name(app.company),
+            "description": app.job_description[:500]
+        }
+    
+    def _field_embeddings(self, apps: List[JobApplication]) -> List[Dict[str, np.ndarray]]:
+        """Embed the normalized fields of ``apps`` in one batched call"""
+        texts = []
+        for app in apps:
+            texts.extend(self._field_texts(app).values())
+        matrix = self._encode_texts(texts)
+        fields = ApplicationEmbeddings.FIELDS
+        return [
+            dict(zip(fields, matrix[i * len(fields):(i + 1) * len(fields)]))
+            for i in range(len(apps))
+        ]
+    
+    def _embed_applications(self, apps: List[JobApplication]):
+        """Add stored applications to the embedding matrices"""
+        if not apps or not self.similarity_model:
+            return
+        try:
+            for app, vectors in zip(apps, self._field_embeddings(apps)):
+                self._embeddings.add(app.job_id, vectors)
+        except Exception as e:
+            logger.warning(f"Could not embed applications: {e}")
+    
+    def _normalize_url(self, url: str) -> str:
+        """Normalize a URL for exact matching (scheme, www, query order ignored)"""
+        parsed = urlparse(url.strip())
+        netloc = parsed.netloc.lower().replace('www.', '')
+        return f"{netloc}{parsed.path.rstrip('/')}?{'&'.join(sorted(parsed.query.split('&')))}"
+    
+    def _title_band(self, normalized_title: str) -> str:
+        """Coarse role of a normalized title: its last word (engineer, manager, ...)"""
+        words = re.findall(r'[a-z]+', normalized_title)
+        return words[-1] if words else ""
+    
+    def _blocking_keys(self, app: JobApplication) -> Tuple[str, str, str, str]:
+        """Return (url, canonical id, company + title band, title+company text) blocking keys
+        
+        Blocking on the company alone would make every application to the
+        same employer a candidate, so the company key is narrowed by the
+        title's role word.
+        """
+        url_key = self._normalize_url(app.job_url) if app.job_url else ""
+        canonical_key = self._extract_job_id_from_url(app.job_url) or ""
+        company = self.normalize_company_name(app.company)
+        title = self.normalize_job_title(app.job_title)
+        company_title_key = f"{company}|{self._title_band(title)}" if company else ""
+        lsh_text = f"{title} {company}"
+        return url_key, canonical_key, company_title_key, lsh_text
+    
+    def _index_application(self, app: JobApplication):
+        """Add an application to the blocking indexes"""
+        url_key, canonical_key, company_title_key, lsh_text = self._blocking_keys(app)
+        if url_key:
+            self._url_index[url_key].add(app.job_id)
+        if canonical_key:
+            self._canonical_index[canonical_key].add(app.job_id)
+        if company_title_key:
+            self._company_title_index[company_title_key].add(app.job_id)
+        self._lsh.add(app.job_id, lsh_text)
+    
+    def _unindex_application(self, app: JobApplication):
+        """Remove an application from the blocking indexes"""
+        url_key, canonical_key, company_title_key, _ = self._blocking_keys(app)
+        for index, key in ((self._url_index, url_key),
+                           (self._canonical_index, canonical_key),
+                           (self._company_title_index, company_title_key)):
+            if key and key in index:
+                index[key].discard(app.job_id)
+                if not index[key]:
+                    del index[key]
+        self._lsh.remove(app.job_id)
+    
+    def _ensure_blocking_index(self):
+        """Build the blocking indexes and embedding matrices on first use"""
+        if self._blocking_ready:
+            return
+        apps = list(self.applications.values())
+        for app in apps:
+            self._index_application(app)
+        self._embed_applications(apps)
+        self._blocking_ready = True
+    
+    def _candidate_ids(self, job_application: JobApplication) -> Set[str]:
+        """Stored application ids that could possibly be duplicates"""
+        self._ensure_blocking_index()
+        url_key, canonical_key, company_title_key, lsh_text = self._blocking_keys(job_application)
+        candidates = set(self._lsh.query(lsh_text))
+        if url_key:
+            candidates |= self._url_index.get(url_key, set())
+        if canonical_key:
+            candidates |= self._canonical_index.get(canonical_key, set())
+        if company_title_key:
+            candidates |= self._company_title_index.get(company_title_key, set())
+        return candidates
+    
+    def find_duplicates(self, job_application: JobApplication, exhaustive: bool = False) -> List[DuplicateMatch]:
+        """Find potential duplicates for a given job application
+        
+        Only applications that share a blocking key (URL, canonical job id,
+        company + title band or title+company LSH bucket) are scored; pass
+        ``exhaustive=True`` to compare against every stored application.
+        """
         duplicates = []
         
-        for existing_id, existing_app in self.applications.items():
-            if existing_id == job_application.job_id:
+        candidate_ids = self._candidate_ids(job_application)
+        if exhaustive:
+            candidate_ids = list(self.applications.keys())
+        
+        # Semantic similarities against all stored applications, from one
+        # matrix-vector product per field
+        semantic = {field: {} for field in ApplicationEmbeddings.FIELDS}
+        if self.similarity_model:
+            try:
+                semantic = self._embeddings.similarities(
+                    self._field_embeddings([job_application])[0], candidate_ids
+                )
+            except Exception as e:
+                logger.warning(f"Semantic similarity calculation failed: {e}")
+        
+        query_fields = self._field_texts(job_application)
+        
+        for existing_id in candidate_ids:
+            existing_app = self.applications.get(existing_id)
+            if existing_app is None or existing_id == job_application.job_id:
                 continue
+            existing_fields = self._field_texts(existing_app)
             
             # Calculate various similarity metrics
             title_similarity = self.calculate_text_similarity(
-                self.normalize_job_title(job_application.job_title),
-                self.normalize_job_title(existing_app.job_title)
+                query_fields["title"], existing_fields["title"],
+                semantic["title"].get(existing_id)
             )
             
             company_similarity = self.calculate_text_similarity(
-                self.normalize_company_name(job_application.company),
-                self.normalize_company_name(existing_app.company)
+                query_fields["company"], existing_fields["company"],
+                semantic["company"].get(existing_id)
             )
             
-            # URL similarity (if both have URLs)
-            url_similarity = 0.0
-            if job_application.job_url and existing_app.job_url:
-                url_similarity = self.calculate_text_similarity(
-                    job_application.job_url, existing_app.job_url
-                )
-            
             # Job description similarity (if available)
             desc_similarity = 0.0
             if job_application.job_description and existing_app.job_description:
                 desc_similarity = self.calculate_text_similarity(
-                    job_application.job_description[:500],
-                    existing_app.job_description[:500]
+                    query_fields["description"], existing_fields["description"],
+                    semantic["description"].get(existing_id)
                 )
             
             # Determine match type and overall confidence
@@ -333,6 +911,20 @@ class SmartDuplicateDetector:
             application_date=datetime.now().isoformat()
         )
         
+        # An application to the same URL is an exact duplicate; the store's
+        # URL lookup answers that without building the blocking indexes
+        if job_url:
+            for existing_app in self._store.find_by_url(job_url):
+                if existing_app.job_id != temp_job.job_id:
+                    return True, DuplicateMatch(
+                        job1_id=temp_job.job_id,
+                        job2_id=existing_app.job_id,
+                        similarity_score=1.0,
+                        match_type="exact",
+                        matching_factors=["identical_url"],
+                        confidence=1.0
+                    )
+        
         # Find duplicates
         duplicates = self.find_duplicates(temp_job)
         
@@ -401,17 +993,23 @@ class SmartDuplicateDetector:
             new_application.similarity_score = duplicate_match.similarity_score
         
         # Add to database
+        existing = self._store.get(job_id)
+        if existing is not None and self._blocking_ready:
+            self._unindex_application(existing)
         self.applications[job_id] = new_application
-        self._save_applications()
+        if self._blocking_ready:
+            self._index_application(new_application)
+            self._embed_applications([new_application])
         
         logger.info(f"Added new application: {job_title} at {company} (ID: {job_id})")
         return True, new_application
     
     def update_application_status(self, job_id: str, status: str):
         """Update application status"""
-        if job_id in self.applications:
-            self.applications[job_id].application_status = status
-            self._save_applications()
+        app = self._store.get(job_id)
+        if app is not None:
+            app.application_status = status
+            self.applications[job_id] = app
             logger.info(f"Updated application {job_id} status to: {status}")
     
     def get_application_stats(self) -> Dict:
@@ -490,7 +1088,10 @@ class SmartDuplicateDetector:
                 continue
         
         for job_id in to_remove:
-            del self.applications[job_id]
+            removed = self.applications.pop(job_id)
+            if self._blocking_ready:
+                self._unindex_application(removed)
+                self._embeddings.remove(job_id)
             logger.info(f"Removed old application: {job_id}")
         
         if to_remove:
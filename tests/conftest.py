@@ -0,0 +1,59 @@
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+
+class FakeEncoder:
+    """Deterministic bag-of-words encoder that records every call."""
+
+    def __init__(self, dim=32):
+        self.dim = dim
+        self.calls = []
+
+    def __call__(self, texts, **kwargs):
+        texts = list(texts)
+        self.calls.append(texts)
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for word in (text or "").lower().split():
+                matrix[row, sum(map(ord, word)) % self.dim] += 1.0
+            matrix[row, -1] += 0.01
+        return matrix
+
+    encode = __call__
+
+
+@pytest.fixture
+def fake_encoder():
+    return FakeEncoder()
+
+
+AGENTS_DIR = Path(__file__).resolve().parent.parent / "src" / "orchestration" / "agents"
+
+
+def load_agent_module(name):
+    """Import ``src/orchestration/agents/<name>.py`` without the package ``__init__``.
+
+    The package imports every agent and their optional SDKs; tests only need
+    the one module (and ``base_agent``).
+    """
+    package = sys.modules.get("_agents")
+    if package is None:
+        package = types.ModuleType("_agents")
+        package.__path__ = [str(AGENTS_DIR)]
+        sys.modules["_agents"] = package
+    full_name = f"_agents.{name}"
+    if full_name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(full_name, AGENTS_DIR / f"{name}.py")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[full_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[full_name]
+            raise
+    return sys.modules[full_name]
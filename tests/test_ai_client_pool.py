@@ -0,0 +1,156 @@
+import asyncio
+import time
+
+import pytest
+
+from src.ml.ai_client_pool import AsyncClientPool
+
+
+class FakeClient:
+    def __init__(self, api_key):
+        self.api_key = api_key
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+def test_same_key_keeps_clients_and_rotated_key_replaces_them():
+    pool = AsyncClientPool()
+
+    async def main():
+        pool.register("openai", lambda: FakeClient("old"), api_key="old")
+        old = pool.get("openai")
+        pool.register("openai", lambda: FakeClient("old-again"), api_key="old")
+        assert pool.get("openai") is old
+
+        pool.register("openai", lambda: FakeClient("new"), api_key="new")
+        new = pool.get("openai")
+        assert new.api_key == "new"
+
+        await pool.aclose()
+        return old, new
+
+    old, new = asyncio.run(main())
+    assert old.closed and new.closed
+
+
+def test_clients_are_per_loop_and_closed_with_their_loop():
+    pool = AsyncClientPool()
+    pool.register("anthropic", lambda: FakeClient("key"), api_key="key")
+
+    async def use():
+        client = pool.get("anthropic")
+        assert pool.get("anthropic") is client
+        await pool.aclose()
+        return client
+
+    first, second = asyncio.run(use()), asyncio.run(use())
+    assert first is not second
+    assert first.closed and second.closed
+
+
+class TestMultiAIService:
+    @pytest.fixture
+    def multi_ai(self):
+        pytest.importorskip("dotenv")
+        from src.ml import multi_ai_service
+        return multi_ai_service
+
+    @pytest.fixture
+    def make_service(self, multi_ai, monkeypatch):
+        providers = list(multi_ai.AIProvider)
+
+        def make_service(behaviour, **kwargs):
+            """``behaviour`` maps provider -> (delay, error or None)."""
+            service = multi_ai.MultiAIService(**kwargs)
+            service.calls, service.cancelled = [], []
+            service.get_available_services = lambda: [p for p in providers if p in behaviour]
+
+            async def call_specific_service(provider, prompt, system_message):
+                delay, error = behaviour[provider]
+                service.calls.append(provider)
+                try:
+                    await asyncio.sleep(delay)
+                except asyncio.CancelledError:
+                    service.cancelled.append(provider)
+                    raise
+                if error:
+                    raise RuntimeError(error)
+                return multi_ai.AIResponse(content=f"{provider.value}: {prompt}", provider=provider, model="fake")
+
+            service._call_specific_service = call_specific_service
+            return service
+        return make_service
+
+    def test_slow_provider_is_hedged_and_the_loser_cancelled(self, multi_ai, make_service):
+        openai, anthropic = multi_ai.AIProvider.OPENAI, multi_ai.AIProvider.ANTHROPIC
+        service = make_service({openai: (5, None), anthropic: (0.01, None)}, hedge_after=0.05)
+
+        started = time.monotonic()
+        response = asyncio.run(service._call_ai_service("q", "sys"))
+
+        assert time.monotonic() - started < 2
+        assert response.provider is anthropic
+        assert service.calls == [openai, anthropic]
+        assert service.cancelled == [openai]
+
+    def test_without_hedging_the_next_provider_waits(self, multi_ai, make_service):
+        openai, anthropic = multi_ai.AIProvider.OPENAI, multi_ai.AIProvider.ANTHROPIC
+        service = make_service({openai: (0.1, None), anthropic: (0, None)})
+
+        response = asyncio.run(service._call_ai_service("q", "sys"))
+
+        assert response.provider is openai
+        assert service.calls == [openai]
+
+    def test_failure_falls_back_to_the_next_provider(self, multi_ai, make_service):
+        openai, anthropic, gemini = multi_ai.AIProvider
+        service = make_service({openai: (0, "rate limited"), anthropic: (0, "down"), gemini: (0, None)})
+
+        response = asyncio.run(service._call_ai_service("q", "sys"))
+
+        assert response.success and response.provider is gemini
+        assert service.calls == [openai, anthropic, gemini]
+
+    def test_all_providers_failing_gives_an_error_response(self, multi_ai, make_service):
+        openai = multi_ai.AIProvider.OPENAI
+        service = make_service({openai: (0, "down")})
+
+        response = asyncio.run(service._call_ai_service("q", "sys"))
+
+        assert not response.success and response.error
+
+    def test_concurrent_identical_calls_share_one_provider_call(self, multi_ai, make_service):
+        openai = multi_ai.AIProvider.OPENAI
+        service = make_service({openai: (0.05, None)})
+
+        async def main():
+            return await asyncio.gather(*(service._call_ai_service("q", "sys") for _ in range(3)),
+                                        service._call_ai_service("other", "sys"))
+
+        *same, other = asyncio.run(main())
+
+        assert service.calls == [openai, openai]
+        assert {response.content for response in same} == {"openai: q"}
+        assert len({id(response) for response in same}) == 3
+        assert other.content == "openai: other"
+
+    def test_cancelling_one_waiter_keeps_the_shared_call(self, multi_ai, make_service):
+        openai = multi_ai.AIProvider.OPENAI
+        service = make_service({openai: (0.05, None)})
+
+        async def main():
+            first = asyncio.create_task(service._call_ai_service("q", "sys"))
+            second = asyncio.create_task(service._call_ai_service("q", "sys"))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            return await second
+
+        response = asyncio.run(main())
+
+        assert response.success
+        assert service.calls == [openai]
+        assert service.cancelled == []
@@ -0,0 +1,122 @@
+import json
+import sqlite3
+
+import pytest
+
+from ml_models.embedding_cache import normalize_rows
+from src.ml.answer_store import AnswerStore, normalize_question
+from src.ml.semantic_answer_index import SemanticAnswerIndex, question_entities
+
+
+def record(question, answer="yes", title="", company=""):
+    return {"question": question, "answer": answer, "job_title": title, "company": company}
+
+
+def stored_rows(store):
+    with sqlite3.connect(str(store.path)) as conn:
+        return conn.execute("SELECT COUNT(*) FROM answers").fetchone()[0]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = AnswerStore(str(tmp_path / "answers.sqlite"))
+    yield store
+    store.close()
+
+
+def test_normalized_lookup_ignores_case_punctuation_and_spacing(store):
+    store.put("h1", normalize_question("Are you  willing to relocate?"), record("Are you willing to relocate?"))
+
+    assert store.find(normalize_question("are you willing to RELOCATE")) is not None
+    assert store.find(normalize_question("are you willing to relocate", {"title": "SRE"})) is None
+
+
+def test_batch_commits_once_at_the_end(store):
+    with store.batch():
+        for i in range(3):
+            store.put(f"h{i}", f"q{i}", record(f"q{i}"))
+        assert stored_rows(store) == 0
+        assert store.get("h1")["question"] == "q1"
+    assert stored_rows(store) == 3
+    assert len(store) == 3
+
+
+def test_legacy_json_is_imported_once(tmp_path):
+    legacy = tmp_path / "legacy.json"
+    legacy.write_text(json.dumps({"h1": record("Why us?", title="SRE", company="Acme")}))
+
+    store = AnswerStore(str(tmp_path / "answers.sqlite"), legacy_json_path=str(legacy))
+    assert store.find(normalize_question("why us", {"title": "SRE", "company": "Acme"}))["answer"] == "yes"
+    store.close()
+
+    legacy.write_text(json.dumps({"h2": record("Other?")}))
+    store = AnswerStore(str(tmp_path / "answers.sqlite"), legacy_json_path=str(legacy))
+    assert sorted(store) == ["h1"]
+    store.close()
+
+
+@pytest.mark.parametrize("question, entities", [
+    ("How many years of Python experience do you have?", {"python"}),
+    ("Are you willing to relocate to Berlin? Please explain.", {"berlin"}),
+    ("Expected salary in EUR?", {"eur"}),
+    ("Expected salary ($)?", {"$"}),
+    ("Experience with C++ or Node.js?", {"c++", "node.js"}),
+    ("how many years of python?", {"python"}),
+    ("Why do you want to work here?", set()),
+])
+def test_question_entities(question, entities):
+    assert question_entities(question, known_terms=["Python"]) == entities
+
+
+def test_semantic_index_respects_threshold_buckets_and_accept(fake_encoder):
+    index = SemanticAnswerIndex(lambda questions: normalize_rows(fake_encoder(questions)), threshold=0.9)
+    index.add_many([("experience", "py", "years of python experience"),
+                    ("experience", "java", "years of java experience"),
+                    ("salary", "pay", "years of python experience")])
+
+    assert index.search("experience", "years of python experience") == ("py", pytest.approx(1.0))
+    assert index.search("experience", "why do you want this job") is None
+    assert index.search("motivation", "years of python experience") is None
+    assert index.search("experience", "years of python experience", accept=lambda h: False) is None
+
+
+class TestAIQuestionAnswerer:
+    @pytest.fixture
+    def make_answerer(self, tmp_path, monkeypatch, fake_encoder):
+        for module in ("openai", "anthropic", "google.generativeai"):
+            pytest.importorskip(module)
+        from src.ml import ai_question_answerer
+
+        class Model:
+            encode = staticmethod(fake_encoder)
+
+        monkeypatch.setattr(ai_question_answerer, "get_model", lambda name: Model())
+        monkeypatch.setattr(ai_question_answerer, "EmbeddingCache", lambda name: None)
+        monkeypatch.chdir(tmp_path)
+        for name in ("OPENAI_API_KEY", "ANTHROPIC_API_KEY", "GOOGLE_API_KEY"):
+            monkeypatch.delenv(name, raising=False)
+
+        def make_answerer(**kwargs):
+            answerer = ai_question_answerer.AIQuestionAnswerer(str(tmp_path / "profile.yaml"), **kwargs)
+            answerer.user_profile["skills"] = ["Python", "Java"]
+            answerer._get_fallback_answer = lambda question, category: f"fresh answer to {question}"
+            return answerer
+        return make_answerer
+
+    def test_semantic_reuse_is_opt_in(self, make_answerer):
+        answerer = make_answerer()
+        answerer.answer_question("How many years of Python experience do you have?")
+
+        qa = answerer.answer_question("How many years of Python experience do you have, roughly?")
+
+        assert qa.answer.startswith("fresh answer")
+
+    def test_reuse_requires_matching_entities(self, make_answerer):
+        answerer = make_answerer(semantic_threshold=0.5)
+        python = answerer.answer_question("How many years of Python experience do you have?")
+        answerer.answer_question("Are you willing to relocate to Berlin?")
+
+        assert answerer.answer_question("How many years of Java experience do you have?").answer != python.answer
+        assert answerer.answer_question("Are you willing to relocate to Munich?").answer.endswith("Munich?")
+        assert answerer.answer_question("How many years of Python experience do you have, roughly?").answer == \
+            python.answer
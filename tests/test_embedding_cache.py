@@ -0,0 +1,46 @@
+import numpy as np
+
+from ml_models.embedding_cache import EmbeddingCache, content_hash, encode_cached
+
+
+def test_encode_cached_encodes_each_distinct_text_once(tmp_path, fake_encoder):
+    cache = EmbeddingCache("test-model", str(tmp_path / "cache.sqlite"))
+    texts = ["python developer", "java developer", "python developer"]
+
+    matrix = encode_cached(fake_encoder, texts, cache=cache, batch_size=8)
+
+    assert matrix.shape == (3, fake_encoder.dim)
+    assert fake_encoder.calls == [["python developer", "java developer"]]
+    np.testing.assert_allclose(np.linalg.norm(matrix, axis=1), 1.0, rtol=1e-5)
+    np.testing.assert_allclose(matrix[0], matrix[2])
+
+
+def test_cached_vectors_are_reused_across_instances(tmp_path, fake_encoder):
+    path = str(tmp_path / "cache.sqlite")
+    first = encode_cached(fake_encoder, ["security engineer"], cache=EmbeddingCache("m", path))
+
+    reopened = EmbeddingCache("m", path)
+    second = encode_cached(fake_encoder, ["security engineer", "new posting"], cache=reopened)
+
+    assert fake_encoder.calls[-1] == ["new posting"]
+    np.testing.assert_allclose(first[0], second[0], rtol=1e-6)
+    assert len(reopened) == 2
+
+
+def test_cache_entries_are_scoped_to_the_model(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    EmbeddingCache("a", path).put_many({content_hash("x"): np.ones(4, dtype=np.float32)})
+
+    assert EmbeddingCache("b", path).get_many([content_hash("x")]) == {}
+    assert set(EmbeddingCache("a", path).get_many([content_hash("x")])) == {content_hash("x")}
+
+
+def test_batches_respect_batch_size(fake_encoder):
+    encode_cached(fake_encoder, [f"text {i}" for i in range(5)], batch_size=2)
+
+    assert [len(call) for call in fake_encoder.calls] == [2, 2, 1]
+
+
+def test_empty_input_returns_empty_matrix(fake_encoder):
+    assert encode_cached(fake_encoder, []).shape == (0, 0)
+    assert fake_encoder.calls == []
@@ -0,0 +1,79 @@
+import asyncio
+import time
+
+import pytest
+
+PLATFORMS = ("scrape_indeed_jobs", "scrape_glassdoor_jobs", "scrape_linkedin_jobs_api",
+             "scrape_remoteok_jobs", "scrape_weworkremotely_jobs")
+
+
+@pytest.fixture
+def scraper_module():
+    pytest.importorskip("aiohttp")
+    pytest.importorskip("requests")
+    from src.scrapers import global_job_scraper
+    return global_job_scraper
+
+
+@pytest.fixture
+def make_scraper(scraper_module, monkeypatch):
+    def make_scraper(behaviour):
+        """``behaviour`` maps platform method name -> (delay, match score)."""
+        scraper = scraper_module.GlobalJobScraper()
+        scraper.active = scraper.peak = 0
+        scraper.started, scraper.cancelled = [], []
+
+        def platform(name, delay, score):
+            async def search(keyword, country, limit):
+                scraper.started.append(name)
+                scraper.active += 1
+                scraper.peak = max(scraper.peak, scraper.active)
+                try:
+                    await asyncio.sleep(delay)
+                except asyncio.CancelledError:
+                    scraper.cancelled.append(name)
+                    raise
+                finally:
+                    scraper.active -= 1
+                return [scraper_module.JobListing(
+                    title=f"{name} {keyword}", company="Acme", location=country, country=country,
+                    salary="", description="", url="", platform=name, posted_date="", job_type="",
+                    experience_level="", match_score=score)]
+            return search
+
+        for name in PLATFORMS:
+            delay, score = behaviour.get(name, (0.01, 0.5))
+            monkeypatch.setattr(scraper, name, platform(name, delay, score))
+        return scraper
+    return make_scraper
+
+
+def collect(scraper, **kwargs):
+    async def main():
+        return [job async for job in scraper.iter_jobs_worldwide(**kwargs)]
+    return asyncio.run(main())
+
+
+def test_searches_stay_under_the_global_concurrency_cap(make_scraper):
+    scraper = make_scraper({})
+
+    jobs = collect(scraper, keywords=["pentest", "soc"], countries=["Germany", "India", "Canada"],
+                   max_results=1000, max_concurrency=4, requests_per_second=10000)
+
+    assert len(scraper.started) == len(PLATFORMS) * 2 * 3
+    assert len(jobs) == len(scraper.started)
+    assert scraper.peak == 4
+
+
+def test_outstanding_searches_are_cancelled_after_max_results_high_scorers(make_scraper):
+    slow = {name: (10, 0.9) for name in PLATFORMS[1:]}
+    scraper = make_scraper({PLATFORMS[0]: (0, 0.9), **slow})
+
+    started = time.monotonic()
+    jobs = collect(scraper, keywords=["pentest", "soc"], countries=["Germany"], max_results=2,
+                   max_concurrency=20, requests_per_second=10000)
+
+    assert time.monotonic() - started < 2
+    assert [job.platform for job in jobs] == [PLATFORMS[0]] * 2
+    assert sorted(scraper.cancelled) == sorted(name for name in PLATFORMS[1:] for _ in range(2))
+    assert scraper.active == 0
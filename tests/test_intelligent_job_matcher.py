@@ -0,0 +1,151 @@
+import random
+import types
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+ML_DIR = Path(__file__).resolve().parent.parent / "src" / "ml"
+
+
+@pytest.fixture
+def matcher_module(monkeypatch):
+    # The matcher imports advanced_resume_parser as a top-level module
+    monkeypatch.syspath_prepend(str(ML_DIR))
+    return pytest.importorskip("src.ml.intelligent_job_matcher", reason="matcher dependencies not installed")
+
+
+def make_job(module, job_id, required=(), preferred=()):
+    return module.JobRequirement(
+        id=job_id, title="Engineer", company="Acme", location="Remote", description="",
+        required_skills=list(required), preferred_skills=list(preferred), experience_level="mid",
+        education_required="", salary_range=None, job_type="full-time", remote_friendly=True,
+        industry="Technology", company_size="Medium", benefits=[], application_url="",
+        source_platform="test", posted_date="",
+    )
+
+
+@pytest.fixture
+def make_matcher(matcher_module, monkeypatch, fake_encoder):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+
+    def make_matcher(encoder=fake_encoder):
+        monkeypatch.setattr(matcher_module.AIJobMatcher, "sentence_model", property(lambda self: encoder))
+        return matcher_module.AIJobMatcher()
+    return make_matcher
+
+
+def resume_with(skills):
+    return types.SimpleNamespace(skills=skills)
+
+
+def per_job_skill_score(encoder, candidate_skills, job):
+    """Skill score as computed one job at a time before batching."""
+    job_skills = job.required_skills + job.preferred_skills
+    if not candidate_skills or not job_skills:
+        return 0.0
+
+    def normalized(texts):
+        matrix = np.asarray(encoder.encode(texts), dtype=np.float64)
+        return matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+
+    similarity = normalized(candidate_skills) @ normalized(job_skills).T
+    required = [similarity[:, i].max() for i in range(len(job.required_skills))]
+    preferred = [similarity[:, len(job.required_skills) + i].max() for i in range(len(job.preferred_skills))]
+    score = (np.mean(required) if required else 0.0) * 0.8 + (np.mean(preferred) if preferred else 0.0) * 0.2
+    return min(score, 1.0)
+
+
+SKILLS = {"languages": ["python", "go"], "security": ["penetration testing", "incident response"]}
+
+
+class TestBatchedSkillScores:
+    @pytest.fixture
+    def jobs(self, matcher_module):
+        return [
+            make_job(matcher_module, "both", ["python", "cloud security"], ["go", "kubernetes"]),
+            make_job(matcher_module, "required-only", ["incident response", "python"]),
+            make_job(matcher_module, "preferred-only", preferred=["penetration testing"]),
+            make_job(matcher_module, "no-skills"),
+            make_job(matcher_module, "shared-phrases", ["python", "python", "siem"], ["go"]),
+        ]
+
+    def test_batch_scores_equal_per_job_scores(self, make_matcher, fake_encoder, jobs):
+        matcher = make_matcher()
+        candidate = SKILLS["languages"] + SKILLS["security"]
+
+        scores = matcher._calculate_skill_matches(resume_with(SKILLS), jobs)
+
+        expected = [per_job_skill_score(fake_encoder, candidate, job) for job in jobs]
+        np.testing.assert_allclose(scores, expected, rtol=1e-5, atol=1e-6)
+        assert scores[3] == 0.0
+        for job, score in zip(jobs, scores):
+            assert matcher._calculate_skill_match(resume_with(SKILLS), job) == pytest.approx(score, abs=1e-6)
+
+    def test_cached_embeddings_give_the_same_scores(self, matcher_module, make_matcher, fake_encoder, jobs):
+        matcher = make_matcher()
+        first = matcher._calculate_skill_matches(resume_with(SKILLS), jobs)
+        fake_encoder.calls.clear()
+
+        again = matcher._calculate_skill_matches(resume_with(SKILLS), jobs)
+        extra = make_job(matcher_module, "new", ["python", "threat hunting"])
+        with_new = matcher._calculate_skill_matches(resume_with(SKILLS), jobs + [extra])
+
+        np.testing.assert_allclose(again, first)
+        np.testing.assert_allclose(with_new[:-1], first)
+        assert fake_encoder.calls == [["threat hunting"]]
+
+    def test_no_candidate_skills_scores_zero(self, make_matcher, jobs):
+        scores = make_matcher()._calculate_skill_matches(resume_with({}), jobs)
+
+        assert not scores.any()
+
+
+class TestTwoStageMatching:
+    TOP_N = 5
+
+    @pytest.fixture
+    def setup(self, matcher_module, make_matcher, monkeypatch):
+        rng = random.Random(7)
+        phrases = ["python", "go", "java", "aws", "siem", "incident response", "penetration testing", "kubernetes"]
+        jobs, cheap = [], {}
+        for i in range(40):
+            job = make_job(matcher_module, f"job-{i}", rng.sample(phrases, rng.randint(0, 3)),
+                           rng.sample(phrases, rng.randint(0, 2)))
+            jobs.append(job)
+            # Spread the cheap sub-scores widely so stage 1 has something to prune
+            level = rng.choice([0.0, 0.2, 0.9, 1.0])
+            cheap[job.id] = {name: min(1.0, max(0.0, level + rng.uniform(-0.1, 0.1)))
+                             for name in ("experience_score", "education_score", "location_score",
+                                          "culture_score", "salary_score")}
+
+        def cheap_scores(self, resume, job, user_preferences):
+            return dict(cheap[job.id])
+
+        def build_match_result(self, resume, job, scores):
+            return types.SimpleNamespace(job_id=job.id, overall_score=self._weighted_score(scores),
+                                         recommendation="", skill_match_score=scores["skill_score"])
+
+        monkeypatch.setattr(matcher_module.AIJobMatcher, "_calculate_cheap_scores", cheap_scores)
+        monkeypatch.setattr(matcher_module.AIJobMatcher, "_build_match_result", build_match_result)
+        return jobs
+
+    @pytest.mark.parametrize("semantic", [True, False], ids=["semantic", "keyword"])
+    def test_two_stage_returns_the_single_stage_top_k(self, make_matcher, setup, semantic):
+        matcher = make_matcher() if semantic else make_matcher(encoder=None)
+        resume = resume_with(SKILLS)
+
+        single = matcher.batch_match_jobs(resume, setup, top_n=self.TOP_N)
+        scored = []
+        batch = matcher._calculate_skill_matches
+        matcher._calculate_skill_matches = lambda resume, jobs: scored.extend(jobs) or batch(resume, jobs)
+        two_stage = matcher.batch_match_jobs(resume, setup, top_n=self.TOP_N, two_stage=True)
+
+        assert [m.job_id for m in two_stage] == [m.job_id for m in single]
+        np.testing.assert_allclose([m.overall_score for m in two_stage], [m.overall_score for m in single],
+                                   rtol=1e-6)
+        # Stage 1 never prunes a finalist
+        survivors = {job.id for job in scored}
+        assert {m.job_id for m in single} <= survivors
+        if not semantic:
+            assert len(survivors) < len(setup)
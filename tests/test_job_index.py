@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+from ml_models.job_index import JobVectorIndex
+
+
+def _clustered(n_clusters=8, per_cluster=40, dim=16, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(n_clusters, dim))
+    vectors = np.concatenate([c + 0.05 * rng.normal(size=(per_cluster, dim)) for c in centers])
+    ids = [f"job-{i}" for i in range(len(vectors))]
+    return ids, vectors.astype(np.float32), centers
+
+
+def _exact(ids, vectors, query, k, allowed=None):
+    vectors = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    scores = vectors @ (query / np.linalg.norm(query))
+    ranked = [ids[i] for i in np.argsort(-scores) if allowed is None or ids[i] in allowed]
+    return ranked[:k]
+
+
+def test_small_index_searches_exactly():
+    ids, vectors, _ = _clustered(per_cluster=5)
+    index = JobVectorIndex()
+    index.add(ids, vectors)
+
+    assert not index.is_trained
+    assert [job_id for job_id, _ in index.search(vectors[3], 5)] == _exact(ids, vectors, vectors[3], 5)
+
+
+def test_trained_index_finds_nearest_cluster_members():
+    ids, vectors, centers = _clustered()
+    index = JobVectorIndex(n_lists=8, n_probe=2, min_train_size=64)
+    index.add(ids, vectors)
+
+    assert index.is_trained
+    result = [job_id for job_id, _ in index.search(centers[2], 10)]
+    assert set(result) == set(_exact(ids, vectors, centers[2], 10))
+
+
+def test_filtered_search_widens_probe_to_return_k():
+    ids, vectors, centers = _clustered()
+    index = JobVectorIndex(n_lists=8, n_probe=1, min_train_size=64)
+    index.add(ids, vectors)
+    # Allowed jobs live in clusters far from the query's nearest cluster
+    allowed = {ids[i] for i in range(40, 320, 20)}
+
+    result = index.search(centers[0], 10, allowed=allowed)
+
+    assert len(result) == 10
+    assert [job_id for job_id, _ in result] == _exact(ids, vectors, centers[0], 10, allowed)
+
+
+def test_filtered_search_is_short_only_when_too_few_jobs_qualify():
+    ids, vectors, centers = _clustered()
+    index = JobVectorIndex(n_lists=8, n_probe=1, min_train_size=64)
+    index.add(ids, vectors)
+
+    assert len(index.search(centers[0], 10, allowed={ids[5], ids[300]})) == 2
+
+
+def test_save_load_round_trip(tmp_path):
+    ids, vectors, centers = _clustered()
+    index = JobVectorIndex(n_lists=8, n_probe=3, min_train_size=64)
+    index.add(ids, vectors)
+    index.remove(ids[:10])
+    path = str(tmp_path / "index")
+
+    index.save(path)
+    loaded = JobVectorIndex.load(path)
+
+    assert len(loaded) == len(index) == len(ids) - 10
+    assert loaded.is_trained and loaded.n_probe == 3
+    assert ids[0] not in loaded and ids[10] in loaded
+    assert loaded.search(centers[4], 7) == pytest.approx(index.search(centers[4], 7))
+
+
+def test_add_replaces_vector_and_remove_drops_job():
+    index = JobVectorIndex()
+    index.add(["a", "b"], np.eye(2, dtype=np.float32))
+    index.add(["a"], np.array([[0.0, 1.0]], dtype=np.float32))
+
+    assert len(index) == 2
+    assert index.search([0.0, 1.0], 2)[0][1] == pytest.approx(1.0)
+    assert index.remove(["a", "missing"]) == 1
+    assert [job_id for job_id, _ in index.search([0.0, 1.0], 2)] == ["b"]
+
+
+def test_load_missing_path_returns_empty_index(tmp_path):
+    assert len(JobVectorIndex.load(str(tmp_path / "nothing"))) == 0
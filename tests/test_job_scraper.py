@@ -0,0 +1,45 @@
+import threading
+import time
+
+import pytest
+
+from smart_scraper import job_scraper
+from smart_scraper.scrape_metrics import ERROR, OK, TIMEOUT, ScrapeMetrics
+
+
+@pytest.fixture
+def release():
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+def test_slow_source_times_out_without_blocking(tmp_path, monkeypatch, release):
+    def scrape_jobs_fast(keywords, locations):
+        return [{"platform": "fast", "title": "a"}]
+
+    def scrape_jobs_slow(keywords, locations):
+        yield {"platform": "slow", "title": "early"}
+        release.wait()
+        yield {"platform": "slow", "title": "late"}
+
+    def scrape_jobs_broken(keywords, locations):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(job_scraper, "SCRAPERS", [scrape_jobs_fast, scrape_jobs_slow, scrape_jobs_broken])
+    metrics = ScrapeMetrics()
+
+    started = time.monotonic()
+    jobs = list(job_scraper.scrape_jobs_stream(timeouts={"slow": 0.2}, metrics=metrics,
+                                               output_path=str(tmp_path / "jobs.jsonl")))
+
+    assert time.monotonic() - started < 5
+    assert sorted(job["title"] for job in jobs) == ["a", "early"]
+    assert metrics.sources["fast"].status == OK
+    assert metrics.sources["broken"].status == ERROR
+    assert metrics.timed_out == ["slow"]
+    assert metrics.sources["slow"].status == TIMEOUT
+
+    # The abandoned scraper must not keep the interpreter alive at exit
+    stuck = [thread for thread in threading.enumerate() if thread.name == "scraper-slow"]
+    assert stuck and all(thread.daemon for thread in stuck)
@@ -0,0 +1,102 @@
+import json
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import pytest
+
+from src.utils.job_store import JobStore
+
+
+@dataclass
+class Opportunity:
+    job_id: str
+    title: str
+    company: str
+    application_url: str
+    source_platform: str
+    salary_range: Optional[Tuple[int, int]]
+    score: float
+    skills: List[str]
+
+
+RECORDS = [
+    {"title": "Security Engineer", "company": "Acme", "location": "Berlin", "platform": "linkedin",
+     "link": "https://jobs.example/1", "description": "Pentesting", "score": 87.5},
+    {"id": "2", "title": "Analyst", "company": "Acme", "location": "", "url": "https://jobs.example/2",
+     "salary": None, "posted_date": "", "remote_friendly": True, "match_score": 0, "tags": []},
+    {"title": "Architect", "company": "Globex", "source_platform": "indeed", "salary_range": (1, 2),
+     "application_url": "https://jobs.example/3", "link": "https://other.example/3", "score": "high"},
+]
+
+
+@pytest.fixture(params=["memory", "disk"])
+def roundtrip(request, tmp_path):
+    def roundtrip(records):
+        store = JobStore.from_records(records)
+        if request.param == "disk":
+            store.save(str(tmp_path / "store"))
+            store = JobStore.load(str(tmp_path / "store"))
+        return store
+    return roundtrip
+
+
+def test_records_round_trip_unchanged(roundtrip):
+    store = roundtrip(RECORDS)
+
+    assert list(store) == RECORDS
+    assert [list(record) for record in store] == [list(record) for record in RECORDS]
+    assert store[2]["salary_range"] == (1, 2)
+    assert store[1]["match_score"] == 0 and isinstance(store[1]["match_score"], int)
+
+
+def test_dataclass_records_round_trip(roundtrip):
+    opportunity = Opportunity("7", "Engineer", "Acme", "https://jobs.example/7", "glassdoor",
+                              (90000, 120000), 0.73, ["python"])
+
+    (record,) = roundtrip([opportunity])
+
+    assert Opportunity(**record) == opportunity
+
+
+def test_aliased_fields_share_columns(roundtrip):
+    store = roundtrip(RECORDS)
+
+    assert list(store.where(platform=["linkedin", "indeed"])) == [0, 2]
+    assert list(store.texts("url")) == ["https://jobs.example/1", "https://jobs.example/2",
+                                        "https://jobs.example/3"]
+    assert store.values("match_score")[0] == 87.5
+
+
+def test_from_jsonl(tmp_path):
+    path = tmp_path / "jobs.jsonl"
+    records = [record for record in RECORDS if "salary_range" not in record]
+    path.write_text("".join(json.dumps(record) + "\n\n" for record in records))
+
+    assert list(JobStore.from_jsonl(str(path))) == records
+
+
+def test_resave_leaves_mapped_store_readable(tmp_path):
+    path = str(tmp_path / "store")
+    JobStore.from_records(RECORDS).save(path)
+    mapped = JobStore.load(path)
+
+    JobStore.from_records(RECORDS[:1]).save(path)
+
+    assert list(mapped) == RECORDS
+    assert list(JobStore.load(path)) == RECORDS[:1]
+    assert [entry.name for entry in tmp_path.iterdir()] == ["store"]
+
+
+def test_failed_save_keeps_the_previous_store(tmp_path, monkeypatch):
+    path = str(tmp_path / "store")
+    JobStore.from_records(RECORDS).save(path)
+
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("src.utils.job_store.np.save", fail)
+    with pytest.raises(OSError):
+        JobStore.from_records(RECORDS[:1]).save(path)
+
+    assert list(JobStore.load(path)) == RECORDS
+    assert [entry.name for entry in tmp_path.iterdir()] == ["store"]
@@ -0,0 +1,92 @@
+import types
+
+import numpy as np
+import pytest
+
+from smart_scraper import jobbert_onnx_runner as runner
+
+
+class FakeTokenizer:
+    """Word-level tokenizer: ``[CLS]`` then one id per word."""
+
+    pad_token_id = 0
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts, truncation=False, max_length=None, **kwargs):
+        self.calls.append((list(texts), kwargs))
+        input_ids = [([101] + [len(word) for word in text.split()])[:max_length] for text in texts]
+        return {"input_ids": input_ids,
+                "token_type_ids": [[0] * len(ids) for ids in input_ids],
+                "attention_mask": [[1] * len(ids) for ids in input_ids]}
+
+
+class FakeSession:
+    """Returns ``(batch, seq, 2)`` hidden states of ``[token id, 1]``; padding is garbage."""
+
+    def __init__(self, pooled=False):
+        self.pooled = pooled
+        self.batches = []
+
+    def get_inputs(self):
+        return [types.SimpleNamespace(name="input_ids"), types.SimpleNamespace(name="attention_mask")]
+
+    def run(self, output_names, inputs):
+        self.batches.append(inputs)
+        ids, mask = inputs["input_ids"], inputs["attention_mask"]
+        hidden = np.stack([ids, np.ones_like(ids)], axis=-1).astype(np.float32)
+        hidden[mask == 0] = 1000.0
+        if self.pooled:
+            return [hidden[:, 0, :]]
+        return [hidden]
+
+
+@pytest.fixture
+def fakes(monkeypatch):
+    tokenizer, session = FakeTokenizer(), FakeSession()
+    monkeypatch.setattr(runner, "get_tokenizer", lambda: tokenizer)
+    monkeypatch.setattr(runner, "get_session", lambda: session)
+    return tokenizer, session
+
+
+TEXTS = ["a much longer posting about cloud security work", "short", "", "medium length text here", None]
+
+
+def expected_mean(text):
+    ids = [101] + [len(word) for word in (text or "").split()]
+    return [np.mean(ids), 1.0]
+
+
+def test_rows_come_back_in_input_order_and_mean_pooled_over_real_tokens(fakes):
+    matrix = runner.embed_batch(TEXTS, batch_size=2)
+
+    assert matrix.dtype == np.float32 and matrix.shape == (len(TEXTS), 2)
+    np.testing.assert_allclose(matrix, [expected_mean(text) for text in TEXTS], rtol=1e-6)
+
+
+def test_texts_are_tokenized_once_and_batches_padded_to_their_longest_row(fakes):
+    tokenizer, session = fakes
+
+    runner.embed_batch(TEXTS, batch_size=2)
+
+    assert len(tokenizer.calls) == 1
+    widths = [batch["input_ids"].shape[1] for batch in session.batches]
+    assert widths == sorted(widths) and widths[0] < widths[-1]
+    for batch in session.batches:
+        assert set(batch) == {"input_ids", "attention_mask"}
+        assert batch["input_ids"].dtype == np.int64
+        assert batch["attention_mask"].sum(axis=1).max() == batch["input_ids"].shape[1]
+
+
+def test_pooled_outputs_are_used_as_is(fakes, monkeypatch):
+    session = FakeSession(pooled=True)
+    monkeypatch.setattr(runner, "get_session", lambda: session)
+
+    matrix = runner.embed_batch(["one two", "three"], batch_size=1)
+
+    np.testing.assert_allclose(matrix, [[101, 1], [101, 1]])
+
+
+def test_empty_input_gives_an_empty_matrix(fakes):
+    assert runner.embed_batch([]).shape == (0, 0)
@@ -0,0 +1,87 @@
+import heapq
+
+import pytest
+
+from ml_models import jobbert_runner
+from smart_scraper.job_stream import iter_matches
+
+
+@pytest.fixture
+def runner(tmp_path, monkeypatch, fake_encoder):
+    monkeypatch.setattr(jobbert_runner, "_encode_batch", fake_encoder)
+    monkeypatch.setattr(jobbert_runner, "EMBEDDING_CACHE_PATH", str(tmp_path / "embeddings.sqlite"))
+    monkeypatch.setattr(jobbert_runner, "JOB_INDEX_PATH", str(tmp_path / "job_index"))
+    monkeypatch.setattr(jobbert_runner, "_embedding_cache", None)
+    monkeypatch.setattr(jobbert_runner, "_job_index", None)
+    loads = []
+    monkeypatch.setattr(jobbert_runner, "load_user_preferences", lambda: loads.append(1) or {})
+    jobbert_runner.preference_loads = loads
+    return jobbert_runner
+
+
+def _jobs(n):
+    return [{"id": f"job-{i}", "title": f"Engineer {i}", "company": "Acme",
+             "location": "Berlin", "description": f"security engineer posting {i}"} for i in range(n)]
+
+
+def _resume_encodes(encoder):
+    return sum(1 for call in encoder.calls for text in call if "Ankit Thakur" in text)
+
+
+def test_match_scores_every_job_in_one_encode_batch(runner, fake_encoder):
+    matches = runner.match_resume_to_jobs("penetration tester", _jobs(5))
+
+    assert len(matches) == 5
+    assert [m["score"] for m in matches] == sorted((m["score"] for m in matches), reverse=True)
+    job_calls = [call for call in fake_encoder.calls if not any("Ankit Thakur" in t for t in call)]
+    assert len(job_calls) == 1 and len(job_calls[0]) == 5
+
+
+def test_iter_matches_embeds_resume_once_with_precomputed_vector(runner, fake_encoder):
+    resume_vec = runner.embed_resume("penetration tester")
+    config = runner.load_user_preferences()
+
+    matches = list(iter_matches(runner.match_resume_to_jobs, "penetration tester", _jobs(10),
+                                chunk_size=3, resume_vec=resume_vec, config=config))
+
+    assert len(matches) == 10
+    assert _resume_encodes(fake_encoder) == 1
+    assert len(runner.preference_loads) == 1
+
+
+def test_chunked_scores_match_single_call(runner):
+    jobs = _jobs(7)
+    whole = runner.match_resume_to_jobs("penetration tester", jobs)
+    streamed = heapq.nlargest(7, iter_matches(runner.match_resume_to_jobs, "penetration tester", jobs,
+                                              chunk_size=2, resume_vec=runner.embed_resume("penetration tester")),
+                              key=lambda job: job["score"])
+
+    assert sorted(m["score"] for m in whole) == sorted(m["score"] for m in streamed)
+
+
+def test_candidate_matching_reads_the_index_without_writing(runner, tmp_path):
+    jobs = _jobs(6)
+    runner.index_jobs(jobs[:4])
+    saved = sorted(p.name for p in tmp_path.iterdir())
+
+    matches = runner.match_resume_to_jobs("security engineer", jobs, candidate_k=2)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == saved
+    assert len(runner.get_job_index()) == 4
+    # two nearest indexed jobs plus both jobs the index has not seen
+    assert {m["id"] for m in matches} >= {"job-4", "job-5"}
+    assert len(matches) == 4
+
+
+def test_jobs_sharing_a_link_keep_distinct_keys(runner):
+    first = {"link": "https://board.example/apply", "title": "Pentester", "description": "a"}
+    second = {"link": "https://board.example/apply", "title": "SOC Analyst", "description": "b"}
+
+    assert runner.job_key(first) != runner.job_key(second)
+    assert runner.job_key({"id": 7, "link": "x"}) == "7"
+
+
+def test_index_jobs_honours_use_cache(runner, tmp_path):
+    runner.index_jobs(_jobs(2), use_cache=False)
+
+    assert not (tmp_path / "embeddings.sqlite").exists()
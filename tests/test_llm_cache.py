@@ -0,0 +1,123 @@
+import sqlite3
+
+import pytest
+
+from src.ml import llm_cache as llm_cache_module
+from src.ml.llm_cache import LLMResponseCache, cached_completion
+
+
+@pytest.fixture(autouse=True)
+def clock(monkeypatch):
+    """Deterministic time: every call advances by one second."""
+    state = {"now": 1000.0}
+
+    def time():
+        state["now"] += 1
+        return state["now"]
+
+    monkeypatch.setattr(llm_cache_module.time, "time", time)
+    return state
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = LLMResponseCache(str(tmp_path / "llm.sqlite"), touch_batch=3)
+    yield cache
+    cache.close()
+
+
+def accessed(cache, key):
+    with sqlite3.connect(str(cache.path)) as conn:
+        return conn.execute("SELECT accessed FROM responses WHERE key = ?", (key,)).fetchone()[0]
+
+
+def test_key_covers_model_parameters_and_system_prompt():
+    key = LLMResponseCache.make_key("openai", "gpt", "Hello  world", {"max_tokens": 150, "temperature": 0.3}, "sys")
+
+    assert key == LLMResponseCache.make_key("openai", "gpt", " Hello\nworld ", {"temperature": 0.3, "max_tokens": 150},
+                                            "sys")
+    assert key != LLMResponseCache.make_key("openai", "gpt", "Hello world", {"max_tokens": 300, "temperature": 0.3},
+                                            "sys")
+    assert key != LLMResponseCache.make_key("openai", "gpt", "Hello world", {"max_tokens": 150, "temperature": 0.7},
+                                            "sys")
+    assert key != LLMResponseCache.make_key("openai", "gpt", "Hello world", {"max_tokens": 150, "temperature": 0.3},
+                                            "other")
+
+
+def test_get_or_call_caches_only_non_empty_results(cache):
+    calls = []
+
+    def call():
+        calls.append(1)
+        return "answer" if len(calls) > 1 else ""
+
+    assert cache.get_or_call("openai", "gpt", "q", call) == ""
+    assert cache.get_or_call("openai", "gpt", "q", call) == "answer"
+    assert cache.get_or_call("openai", "gpt", "q", call) == "answer"
+    assert len(calls) == 2
+    assert cache.stats()["hits"] == 1
+
+
+def test_cached_completion_without_cache_always_calls():
+    calls = []
+    for _ in range(2):
+        cached_completion(None, "openai", "gpt", "q", lambda: calls.append(1) or "a")
+    assert len(calls) == 2
+
+
+def test_entries_expire_after_ttl(cache, clock):
+    cache.ttl = 10
+    cache.put("k", "v")
+    assert cache.get("k") == "v"
+
+    clock["now"] += 10
+    assert cache.get("k") is None
+    assert cache.stats()["expired"] == 1
+
+
+def test_hits_buffer_access_times_until_a_batch_is_full(cache):
+    for key in "abc":
+        cache.put(key, key)
+    written = accessed(cache, "a")
+
+    for key in "aab":
+        cache.get(key)
+    assert accessed(cache, "a") == written
+
+    cache.get("c")
+    assert accessed(cache, "a") > written
+
+
+def test_eviction_sees_buffered_reads(tmp_path):
+    cache = LLMResponseCache(str(tmp_path / "llm.sqlite"), max_entries=3, touch_batch=100)
+    for key in "abc":
+        cache.put(key, key)
+    cache.get("a")
+
+    cache.put("d", "d")
+
+    assert cache.get("a") == "a"
+    assert cache.get("b") is None
+    cache.close()
+
+
+def test_close_persists_buffered_reads(tmp_path):
+    cache = LLMResponseCache(str(tmp_path / "llm.sqlite"), touch_batch=100)
+    cache.put("a", "a")
+    written = accessed(cache, "a")
+    cache.get("a")
+    cache.close()
+
+    assert accessed(cache, "a") > written
+
+
+def test_multi_ai_cache_key_includes_generation_parameters(tmp_path, monkeypatch):
+    pytest.importorskip("dotenv")
+    from src.ml import multi_ai_service
+    from src.ml.multi_ai_service import AIProvider, MultiAIService
+
+    service = MultiAIService(llm_cache=LLMResponseCache(str(tmp_path / "llm.sqlite")))
+    key = service._cache_key(AIProvider.OPENAI, "prompt", "system")
+    monkeypatch.setitem(multi_ai_service.PROVIDER_PARAMS, AIProvider.OPENAI, {"max_tokens": 50, "temperature": 0.7})
+
+    assert service._cache_key(AIProvider.OPENAI, "prompt", "system") != key
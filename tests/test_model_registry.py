@@ -0,0 +1,91 @@
+import threading
+import time
+
+import pytest
+
+from ml_models import model_registry
+from ml_models.model_registry import ModelRegistry
+
+
+def test_concurrent_first_use_runs_the_loader_once():
+    registry = ModelRegistry()
+    calls = []
+
+    def loader():
+        calls.append(threading.get_ident())
+        time.sleep(0.05)
+        return object()
+
+    registry.register("slow", loader)
+    barrier = threading.Barrier(8)
+    results = []
+
+    def use():
+        barrier.wait()
+        results.append(registry.get("slow"))
+
+    threads = [threading.Thread(target=use) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len(results) == 8 and all(model is results[0] for model in results)
+    assert registry.is_loaded("slow")
+    assert registry.load_timings()["slow"].error is None
+
+
+def test_failed_load_is_remembered_and_reraised():
+    registry = ModelRegistry()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        raise OSError("download failed")
+
+    registry.register("broken", loader)
+    for _ in range(3):
+        with pytest.raises(OSError, match="download failed"):
+            registry.get("broken")
+
+    assert len(calls) == 1
+    assert not registry.is_loaded("broken")
+    assert registry.load_timings()["broken"].error == "download failed"
+
+    registry.unload("broken")
+    with pytest.raises(OSError):
+        registry.get("broken")
+    assert len(calls) == 2
+
+
+def test_register_does_not_load_and_keeps_the_first_loader():
+    registry = ModelRegistry()
+    registry.register("model", lambda: "first")
+    registry.register("model", lambda: "second")
+
+    assert not registry.is_loaded("model")
+    assert registry.get("model") == "first"
+
+    registry.register("model", lambda: "third", replace=True)
+    assert registry.get("model") == "third"
+    with pytest.raises(KeyError):
+        registry.get("missing")
+
+
+def test_jobbert_runner_still_exposes_model(monkeypatch):
+    from ml_models import jobbert_runner
+
+    registry = ModelRegistry()
+    sentinel = object()
+    loads = []
+    registry.register(jobbert_runner.MODEL_NAME, lambda: loads.append(1) or sentinel)
+    monkeypatch.setattr(model_registry, "registry", registry)
+
+    from ml_models.jobbert_runner import model
+
+    assert model is sentinel
+    assert jobbert_runner.model is sentinel
+    assert loads == [1]
+    with pytest.raises(AttributeError):
+        jobbert_runner.not_a_model
@@ -0,0 +1,350 @@
+import asyncio
+import concurrent.futures
+import threading
+import time
+import types
+
+import numpy as np
+import pytest
+
+from tests.conftest import load_agent_module
+
+
+@pytest.fixture
+def loaded():
+    """Engines whose model/client was created, in order."""
+    return []
+
+
+@pytest.fixture
+def ocr(monkeypatch, loaded):
+    for module in ("PIL", "pdf2image"):
+        pytest.importorskip(module)
+    ocr = load_agent_module("enhanced_ocr_agent")
+
+    monkeypatch.setattr(ocr, "GOOGLE_VISION_AVAILABLE", True)
+    monkeypatch.setattr(ocr, "PADDLEOCR_AVAILABLE", True)
+    monkeypatch.setattr(ocr, "EASYOCR_AVAILABLE", False)
+    monkeypatch.setattr(ocr, "TESSERACT_AVAILABLE", True)
+    monkeypatch.setattr(ocr, "vision", types.SimpleNamespace(
+        ImageAnnotatorClient=lambda: loaded.append("google_vision")), raising=False)
+    monkeypatch.setattr(ocr, "paddleocr", types.SimpleNamespace(
+        PaddleOCR=lambda **kwargs: loaded.append("paddleocr")), raising=False)
+    monkeypatch.setattr(ocr, "pytesseract", types.SimpleNamespace(
+        get_tesseract_version=lambda: loaded.append("tesseract")), raising=False)
+    monkeypatch.setenv("GOOGLE_APPLICATION_CREDENTIALS", "credentials.json")
+    monkeypatch.setattr(ocr, "_worker_agent", None)
+    return ocr
+
+
+def make_agent(ocr, **settings):
+    return ocr.OCRAgent("OCRAgent", "Extract text", {"custom_settings": settings})
+
+
+def test_parent_leaves_pooled_engines_to_the_workers(ocr, loaded):
+    agent = make_agent(ocr, process_pool_workers=2)
+
+    assert agent.available_engines == ["google_vision", "paddleocr", "tesseract"]
+    # Only the cheap tesseract binary check runs here, no models are loaded
+    assert loaded == ["google_vision", "tesseract"]
+
+
+def test_missing_tesseract_binary_is_caught_in_the_parent(ocr, monkeypatch):
+    def missing():
+        raise OSError("tesseract is not installed")
+
+    monkeypatch.setattr(ocr.pytesseract, "get_tesseract_version", missing)
+    monkeypatch.setattr(ocr, "GOOGLE_VISION_AVAILABLE", False)
+    monkeypatch.setattr(ocr, "PADDLEOCR_AVAILABLE", False)
+
+    with pytest.raises(RuntimeError, match="No OCR engines available"):
+        make_agent(ocr, process_pool_workers=2)
+
+
+def test_engine_that_fails_in_the_workers_is_dropped(ocr, monkeypatch):
+    agent = make_agent(ocr, process_pool_workers=2)
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+    agent._get_process_pool = lambda: pool
+
+    def run_engine(engine, image):
+        raise ocr.EngineUnavailableError(f"OCR engine {engine} is not available in worker process")
+
+    monkeypatch.setattr(ocr, "_run_engine_in_worker", run_engine)
+    try:
+        result = asyncio.run(agent._run_engine_safely("paddleocr", "image"))
+    finally:
+        pool.shutdown()
+
+    assert "not available" in result["error"]
+    assert agent.available_engines == ["google_vision", "tesseract"]
+
+
+def test_without_pool_parent_loads_every_engine(ocr, loaded):
+    agent = make_agent(ocr, use_process_pool=False)
+
+    assert agent.available_engines == ["google_vision", "paddleocr", "tesseract"]
+    assert loaded == ["google_vision", "paddleocr", "tesseract"]
+
+
+def test_workers_load_only_pooled_engines(ocr, loaded):
+    ocr._init_ocr_worker(frozenset({"paddleocr", "easyocr", "tesseract"}))
+
+    assert ocr._worker_agent.available_engines == ["paddleocr", "tesseract"]
+    assert loaded == ["paddleocr", "tesseract"]
+
+
+def test_pool_size_is_capped_by_default(ocr, monkeypatch):
+    monkeypatch.setattr(ocr.os, "cpu_count", lambda: 32)
+    assert make_agent(ocr).process_pool_workers == 4
+
+    monkeypatch.setattr(ocr.os, "cpu_count", lambda: 2)
+    assert make_agent(ocr).process_pool_workers == 2
+
+
+def test_timed_out_run_keeps_its_worker_slot_until_it_finishes(ocr, monkeypatch):
+    agent = make_agent(ocr, process_pool_workers=2)
+    agent.process_pool_workers = 1
+    agent.engine_timeout = 0.1
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    agent._get_process_pool = lambda: pool
+    release = threading.Event()
+
+    def run_engine(engine, image):
+        if image == "stuck":
+            release.wait(5)
+        return {"text": image}
+
+    monkeypatch.setattr(ocr, "_run_engine_in_worker", run_engine)
+
+    async def main():
+        with pytest.raises(asyncio.TimeoutError):
+            await agent._run_engine_async("tesseract", "stuck")
+
+        queued = asyncio.create_task(agent._run_engine_async("tesseract", "next"))
+        await asyncio.sleep(0.3)
+        assert not queued.done()
+
+        release.set()
+        return await queued
+
+    try:
+        assert asyncio.run(main()) == {"text": "next"}
+    finally:
+        release.set()
+        pool.shutdown()
+
+
+class FakePage:
+    """Rendered page: ``ink`` is the fraction of dark pixels."""
+
+    def __init__(self, width, height, ink=0.0, mode="RGB"):
+        self.width, self.height, self.ink, self.mode = width, height, ink, mode
+
+    def convert(self, mode):
+        return FakePage(self.width, self.height, self.ink, mode)
+
+    def __array__(self, dtype=None, copy=None):
+        pixels = np.full((self.height, self.width), 255, dtype=np.uint8)
+        pixels.flat[:int(pixels.size * self.ink)] = 0
+        return pixels
+
+
+@pytest.fixture
+def events():
+    return []
+
+
+@pytest.fixture
+def pdf(tmp_path, ocr, monkeypatch, events):
+    """A five-page letter-size PDF whose later pages carry more ink."""
+
+    def convert_from_path(path, dpi, first_page, last_page, grayscale=False, **kwargs):
+        assert first_page == last_page
+        if dpi != 36:
+            events.append(("render", first_page, dpi))
+        return [FakePage(int(8.5 * dpi), int(11 * dpi), ink=0.02 * (first_page - 1))]
+
+    monkeypatch.setattr(ocr, "pdf2image", types.SimpleNamespace(
+        pdfinfo_from_path=lambda path: {"Pages": 5}, convert_from_path=convert_from_path))
+    path = tmp_path / "resume.pdf"
+    path.write_bytes(b"%PDF-1.4")
+    return {"file_path": str(path), "file_format": "pdf"}
+
+
+@pytest.fixture
+def agent(ocr):
+    agent = make_agent(ocr, use_process_pool=False)
+
+    async def preprocess(image):
+        return image
+
+    agent._preprocess_image = preprocess
+    return agent
+
+
+@pytest.mark.parametrize("inches, ink, dpi", [
+    ((8.5, 11), 0.0, 200),
+    ((8.5, 11), 0.045, 250),
+    ((8.5, 11), 0.5, 300),
+    ((24, 36), 0.5, 90),
+])
+def test_pdf_dpi_follows_ink_density_and_page_size(agent, inches, ink, dpi):
+    width, height = (int(side * agent.pdf_probe_dpi) for side in inches)
+
+    assert agent._choose_pdf_dpi(FakePage(width, height, ink)) == dpi
+
+
+def test_pdf_pages_are_rendered_one_at_a_time(agent, pdf, events):
+    async def first_two():
+        pages = agent._iter_document_pages(pdf)
+        first = [await pages.__anext__(), await pages.__anext__()]
+        await pages.aclose()
+        return first
+
+    pages = asyncio.run(first_two())
+
+    assert [index for index, _ in pages] == [0, 1]
+    assert events == [("render", 1, 200), ("render", 2, 220)]
+
+
+def test_ocr_starts_before_the_whole_pdf_is_rendered(agent, pdf, events):
+    agent.max_pages_in_flight = 2
+    running = []
+
+    async def process_page(image, page_index, cascade=False):
+        running.append(page_index)
+        events.append(("start", page_index + 1, len(running)))
+        await asyncio.sleep(0.01)
+        running.remove(page_index)
+        return {"page_number": page_index + 1, "engine_results": {}, "consensus_text": f"page {page_index + 1}",
+                "confidence": 0.9, "text_blocks": [], "layout_info": {}}
+
+    agent._process_image_ensemble = process_page
+
+    result = asyncio.run(agent._process_internal({"documents": [pdf]}))
+
+    assert [page["page_number"] for page in result.result["documents"][0]["pages"]] == [1, 2, 3, 4, 5]
+    assert max(in_flight for kind, _, in_flight in events if kind == "start") <= 2
+    last_render = max(i for i, event in enumerate(events) if event[0] == "render")
+    assert events.index(("start", 1, 1)) < last_render
+
+
+def engine_result(text, confidence):
+    return {"text": text, "confidence": confidence, "blocks": [], "processing_time": 1.0}
+
+
+def run_cascade(agent, outputs):
+    ran = []
+
+    async def run_engine(engine, image):
+        ran.append(engine)
+        return engine_result(*outputs[engine])
+
+    agent._run_engine_async = run_engine
+    page = asyncio.run(agent._process_image_ensemble("image", 0, cascade=True))
+    assert page["cascade"]["engines_run"] == ran
+    return page["cascade"]
+
+
+def test_cascade_is_opt_in(ocr):
+    assert make_agent(ocr, use_process_pool=False).engine_cascade is False
+    assert make_agent(ocr, use_process_pool=False, engine_cascade=True).engine_cascade is True
+
+
+def test_cascade_order_follows_engine_history(agent):
+    assert agent._get_cascade_order() == ["tesseract", "paddleocr", "google_vision"]
+
+    agent._update_engine_history({
+        "tesseract": {"total_pages": 10, "successful_pages": 2, "avg_confidence": 0.5, "avg_processing_time": 1.0},
+        "google_vision": {"total_pages": 10, "successful_pages": 10, "avg_confidence": 0.95,
+                          "avg_processing_time": 0.5},
+    })
+
+    assert agent._get_cascade_order() == ["google_vision", "paddleocr", "tesseract"]
+
+
+def test_cascade_tries_engines_that_never_succeeded_last(agent):
+    agent._update_engine_history({
+        "tesseract": {"total_pages": 3, "successful_pages": 0, "avg_confidence": 0.0, "avg_processing_time": 0.0},
+    })
+
+    assert agent._get_cascade_order() == ["paddleocr", "google_vision", "tesseract"]
+
+
+def test_one_confident_engine_is_not_enough_to_stop(agent):
+    cascade = run_cascade(agent, {"tesseract": ("Jane Doe, engineer", 0.99),
+                                  "paddleocr": ("Jane Doe, engineer", 0.9),
+                                  "google_vision": ("Jane Doe, engineer", 0.9)})
+
+    assert cascade == {"engines_run": ["tesseract", "paddleocr"], "engines_skipped": ["google_vision"]}
+
+
+def test_cascade_escalates_while_engines_disagree(agent):
+    cascade = run_cascade(agent, {"tesseract": ("Jane Doe, engineer", 0.99),
+                                  "paddleocr": ("Skills Inc 2019", 0.9),
+                                  "google_vision": ("", 0.0)})
+
+    assert cascade == {"engines_run": ["tesseract", "paddleocr", "google_vision"], "engines_skipped": []}
+
+
+def ok_page(page_index, text="text"):
+    return {"page_number": page_index + 1, "engine_results": {}, "consensus_text": text,
+            "confidence": 0.9, "text_blocks": [], "layout_info": {}}
+
+
+def test_a_page_that_fails_to_render_marks_the_document_partial(agent, pdf, ocr, monkeypatch):
+    convert_from_path = ocr.pdf2image.convert_from_path
+
+    def flaky(path, dpi, first_page, last_page, **kwargs):
+        if first_page == 3 and dpi != agent.pdf_probe_dpi:
+            raise RuntimeError("poppler crashed")
+        return convert_from_path(path, dpi, first_page, last_page, **kwargs)
+
+    monkeypatch.setattr(ocr.pdf2image, "convert_from_path", flaky)
+
+    async def process_page(image, page_index, cascade=False):
+        return ok_page(page_index, f"page {page_index + 1}")
+
+    agent._process_image_ensemble = process_page
+
+    result = asyncio.run(agent._process_internal({"documents": [pdf]}))
+
+    (document,) = result.result["documents"]
+    assert [page["page_number"] for page in document["pages"]] == [1, 2, 3, 4, 5]
+    assert document["pages"][2]["error"] == "poppler crashed"
+    assert document["partial"] is True
+    assert document["consolidated_text"].count("page") == 4
+    assert result.metadata["successful_extractions"] == 0
+    assert result.result["metadata"]["errors"] == ["Document 0: Page 3: poppler crashed"]
+
+
+def test_page_ocr_is_cancelled_when_the_document_fails(agent, pdf):
+    cancelled = []
+
+    async def preprocess(image):
+        if image.ink > 0.03:  # page 3
+            raise RuntimeError("out of memory")
+        return image
+
+    async def process_page(image, page_index, cascade=False):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(page_index)
+            raise
+        return ok_page(page_index)
+
+    agent._preprocess_image = preprocess
+    agent._process_image_ensemble = process_page
+    agent.max_pages_in_flight = 5
+
+    async def main():
+        result = await agent._process_internal({"documents": [pdf]})
+        return result, sorted(cancelled)
+
+    started = time.monotonic()
+    result, cancelled_on_return = asyncio.run(main())
+
+    assert time.monotonic() - started < 2
+    assert cancelled_on_return == [0, 1]
+    assert result.result["metadata"]["errors"] == ["Document 0: out of memory"]
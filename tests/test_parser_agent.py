@@ -0,0 +1,129 @@
+import asyncio
+
+import pytest
+
+from tests.conftest import load_agent_module
+
+RESUME = """Jane Doe
+jane@example.com
+
+WORK EXPERIENCE
+Senior Engineer, Acme 2019-2023
+
+EDUCATION
+BSc Computer Science
+
+SKILLS
+Python, Go
+"""
+
+
+@pytest.fixture
+def parser(monkeypatch):
+    for module in ("openai", "anthropic"):
+        pytest.importorskip(module)
+    parser = load_agent_module("parser_agent")
+    monkeypatch.setattr(parser.openai, "AsyncOpenAI", lambda api_key: None, raising=False)
+    monkeypatch.setattr(parser.anthropic, "AsyncAnthropic", lambda api_key: None, raising=False)
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-test")
+    monkeypatch.delenv("GOOGLE_API_KEY", raising=False)
+    return parser
+
+
+@pytest.fixture
+def agent(parser):
+    return parser.ParserAgent("ParserAgent", "Parse resumes")
+
+
+class TestSectionCache:
+    @pytest.fixture
+    def sent(self, agent):
+        sent = []
+
+        async def parse_with_model(model, text, options, schema=None):
+            sent.append((model, text.splitlines()[0]))
+            return {name: [] for name in schema["properties"]}
+
+        agent._parse_with_model = parse_with_model
+        return sent
+
+    def parse(self, parser, agent, model, text, **options):
+        return asyncio.run(agent._parse_sections(model, parser.split_resume_sections(text), options))
+
+    def test_reparsing_an_edited_resume_sends_only_changed_sections(self, parser, agent, sent):
+        self.parse(parser, agent, "gpt-4o", RESUME)
+        assert len(sent) == 4
+        sent.clear()
+
+        self.parse(parser, agent, "gpt-4o", RESUME.replace("Python, Go", "Python, Go, Rust"))
+
+        assert sent == [("gpt-4o", "SKILLS")]
+
+    def test_cache_is_keyed_on_the_running_models_override_only(self, parser, agent, sent):
+        self.parse(parser, agent, "claude-3.5-sonnet", RESUME, openai_model="gpt-4o", claude_model="claude-a")
+        sent.clear()
+
+        self.parse(parser, agent, "claude-3.5-sonnet", RESUME, openai_model="gpt-4o-mini", claude_model="claude-a")
+        assert sent == []
+
+        self.parse(parser, agent, "claude-3.5-sonnet", RESUME, openai_model="gpt-4o-mini", claude_model="claude-b")
+        assert len(sent) == 4
+
+
+def parsed_resume(name="Jane Doe"):
+    return {"personal_information": {"full_name": name}, "work_experience": [{"company": "Acme"}]}
+
+
+class TestModelEnsemble:
+    @pytest.fixture
+    def run(self, parser, agent):
+        cancelled = []
+
+        def run(outputs, quorum=True, **options):
+            """``outputs`` maps model -> (delay, parsed_data, confidence)."""
+
+            async def parse_with_single_model(model, text, options):
+                delay, parsed_data, confidence = outputs[model]
+                try:
+                    await asyncio.sleep(delay)
+                except asyncio.CancelledError:
+                    cancelled.append(model)
+                    raise
+                return parser.ModelResult(model, parsed_data, confidence, delay, [], [])
+
+            agent._parse_with_single_model = parse_with_single_model
+            return asyncio.run(agent._run_model_ensemble(list(outputs), RESUME, options, quorum))
+
+        run.cancelled = cancelled
+        return run
+
+    def test_quorum_cancels_the_straggler(self, run):
+        results, execution = run({"gpt-4o": (0.01, parsed_resume(), 0.9),
+                                  "claude-3.5-sonnet": (0.02, parsed_resume(), 0.8),
+                                  "gemini-pro": (5, parsed_resume(), 0.9)})
+
+        assert [r.model_name for r in results] == ["gpt-4o", "claude-3.5-sonnet"]
+        assert execution["quorum_reached"] is True
+        assert execution["cancelled_models"] == run.cancelled == ["gemini-pro"]
+
+    def test_deadline_gives_a_timed_out_result(self, run):
+        results, execution = run({"gpt-4o": (0.01, parsed_resume(), 0.9), "gemini-pro": (5, parsed_resume(), 0.9)},
+                                 quorum=False, model_timeouts={"gemini-pro": 0.05})
+
+        assert [r.model_name for r in results] == ["gpt-4o", "gemini-pro"]
+        assert results[1].confidence == 0.0 and results[1].errors[0].startswith("Timed out")
+        assert execution["timed_out_models"] == ["gemini-pro"]
+
+    @pytest.mark.parametrize("second", [
+        pytest.param(parsed_resume("John Smith"), id="different-names"),
+        pytest.param({"personal_information": {"full_name": "Jane Doe"}}, id="missing-work-experience"),
+    ])
+    def test_no_quorum_without_two_agreeing_complete_results(self, run, second):
+        results, execution = run({"gpt-4o": (0.01, parsed_resume(), 0.9),
+                                  "claude-3.5-sonnet": (0.02, second, 0.9),
+                                  "gemini-pro": (0.05, parsed_resume(), 0.9)})
+
+        assert len(results) == 3
+        assert execution["quorum_reached"] is False
+        assert run.cancelled == []
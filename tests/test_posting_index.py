@@ -0,0 +1,87 @@
+import pytest
+
+from smart_scraper import job_scraper
+from smart_scraper.job_stream import iter_jobs
+from smart_scraper.posting_index import PostingIndex, posting_key
+
+
+def job(title, description="", platform="demo"):
+    return {"platform": platform, "title": title, "company": "Acme", "location": "Remote",
+            "link": f"https://jobs.example/{title}", "description": description}
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = PostingIndex(str(tmp_path / "postings.sqlite"))
+    yield index
+    index.close()
+
+
+def changes_by_title(changes):
+    return {change.get("title", change["fingerprint"]): change["change"] for change in changes}
+
+
+def test_first_cycle_reports_everything_as_new(index):
+    changes = index.apply("demo", [job("a"), job("b")], now="t1")
+
+    assert changes_by_title(changes) == {"a": "new", "b": "new"}
+    assert all(change["first_seen"] == "t1" for change in changes)
+
+
+def test_unchanged_postings_are_not_reported(index):
+    index.apply("demo", [job("a"), job("b")], now="t1")
+
+    assert index.apply("demo", [job("a"), job("b")], now="t2") == []
+
+
+def test_edited_posting_is_reported_as_changed(index):
+    index.apply("demo", [job("a", "old")], now="t1")
+
+    (change,) = index.apply("demo", [job("a", "new")], now="t2")
+
+    assert change["change"] == "changed"
+    assert change["first_seen"] == "t1" and change["last_seen"] == "t2"
+    assert change["fingerprint"] == posting_key(job("a"))
+
+
+def test_missing_posting_is_tombstoned_once_and_can_return(index):
+    index.apply("demo", [job("a"), job("b")], now="t1")
+
+    (tombstone,) = index.apply("demo", [job("a")], now="t2")
+    assert tombstone == {"fingerprint": posting_key(job("b")), "platform": "demo",
+                         "change": "removed", "removed_at": "t2"}
+    assert index.apply("demo", [job("a")], now="t3") == []
+
+    assert changes_by_title(index.apply("demo", [job("a"), job("b")], now="t4")) == {"b": "new"}
+
+
+def test_platforms_are_diffed_independently(index):
+    index.apply("one", [job("a", platform="one")])
+    index.apply("two", [job("b", platform="two")])
+
+    assert index.apply("one", []) != []
+    assert [posting["title"] for posting in index.live_jobs()] == ["b"]
+    assert index.live_jobs("one") == []
+
+
+def test_incremental_stream_keeps_the_full_corpus(tmp_path, monkeypatch):
+    listings = {"first": [job("a"), job("b")], "second": [job("a"), job("c")]}
+    cycle = {}
+
+    def scrape_jobs_demo(keywords, locations):
+        return listings[cycle["name"]]
+
+    monkeypatch.setattr(job_scraper, "SCRAPERS", [scrape_jobs_demo])
+    paths = dict(index_path=str(tmp_path / "postings.sqlite"),
+                 output_path=str(tmp_path / "scraped_jobs.jsonl"),
+                 changes_path=str(tmp_path / "changes.jsonl"))
+
+    cycle["name"] = "first"
+    list(job_scraper.scrape_jobs_stream(incremental=True, **paths))
+    cycle["name"] = "second"
+    changes = list(job_scraper.scrape_jobs_stream(incremental=True, **paths))
+
+    assert changes_by_title(changes) == {"c": "new", posting_key(job("b")): "removed"}
+    assert [record["change"] for record in iter_jobs(paths["changes_path"], include_removed=True)] == \
+        [change["change"] for change in changes]
+    assert sorted(record["title"] for record in iter_jobs(paths["output_path"])) == ["a", "c"]
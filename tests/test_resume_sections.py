@@ -0,0 +1,62 @@
+import pytest
+
+from tests.conftest import load_agent_module
+
+
+@pytest.fixture(scope="module")
+def split_resume_sections():
+    for module in ("openai", "anthropic"):
+        pytest.importorskip(module)
+    return load_agent_module("parser_agent").split_resume_sections
+
+
+RESUME = """Jane Doe
+jane@example.com
+
+Professional Summary
+Security engineer with ten years of experience.
+
+WORK EXPERIENCE
+Training Manager
+Acme Corp, 2019-2023
+Senior Engineer, Skills Inc
+Built the certification platform.
+Projects
+Languages: English, German
+
+Education:
+BSc Computer Science
+Training
+CISSP course
+
+TECHNICAL SKILLS
+Python, Go
+"""
+
+
+def test_splits_on_known_headings(split_resume_sections):
+    sections = split_resume_sections(RESUME)
+
+    assert sections["contact"].splitlines()[0] == "Jane Doe"
+    assert "Professional Summary" in sections["contact"]
+    assert sections["education"].splitlines() == ["Education:", "BSc Computer Science", "Training", "CISSP course"]
+    assert sections["skills"].splitlines() == ["TECHNICAL SKILLS", "Python, Go"]
+
+
+def test_job_titles_with_section_keywords_stay_in_experience(split_resume_sections):
+    experience = split_resume_sections(RESUME)["experience"].splitlines()
+
+    assert experience[:5] == ["WORK EXPERIENCE", "Training Manager", "Acme Corp, 2019-2023",
+                              "Senior Engineer, Skills Inc", "Built the certification platform."]
+    assert "Languages: English, German" in experience
+
+
+def test_text_without_headings_is_contact(split_resume_sections):
+    assert split_resume_sections("Jane Doe\nSkilled engineer") == {"contact": "Jane Doe\nSkilled engineer"}
+
+
+def test_content_lines_with_section_keywords_stay_in_experience(split_resume_sections):
+    resume = ("WORK EXPERIENCE\nSenior Engineer, Acme\nTechnologies used:\nPython, AWS\nLed migration.\n"
+              "ACME TRAINING LTD\nTrainer 2015-2018")
+
+    assert split_resume_sections(resume) == {"experience": resume}
@@ -0,0 +1,209 @@
+import json
+from dataclasses import asdict
+
+import numpy as np
+import pytest
+
+from src.utils.smart_duplicate_detector import (
+    ApplicationEmbeddings,
+    ApplicationStore,
+    JobApplication,
+    JSONApplicationStore,
+    JSONLApplicationStore,
+    SmartDuplicateDetector,
+    SQLiteApplicationStore,
+)
+
+
+def make_app(job_id, url="", title="Engineer", company="Acme", description=""):
+    return JobApplication(job_id=job_id, job_title=title, company=company, job_url=url,
+                          job_description=description, application_date="2024-01-01T00:00:00")
+
+
+@pytest.fixture
+def detector(tmp_path):
+    detector = SmartDuplicateDetector(str(tmp_path / "job_applications.json"))
+    detector._similarity_model_failed = True
+    yield detector
+    detector.close()
+
+
+def test_company_blocking_is_narrowed_by_title_band(detector):
+    roles = ["Sales Manager", "Product Designer", "Data Analyst", "Account Executive",
+             "Recruiter", "Office Coordinator", "Security Consultant", "Backend Developer"]
+    for role in roles:
+        detector.add_application(role, "Acme Corp", job_url=f"https://acme.example/jobs/{role}")
+
+    detector._ensure_blocking_index()
+    _, _, company_title_key, _ = detector._blocking_keys(
+        detector.applications[detector.generate_job_id("Sales Manager", "Acme Corp",
+                                                       "https://acme.example/jobs/Sales Manager")]
+    )
+    assert company_title_key == "acme|manager"
+    assert all(len(ids) == 1 for ids in detector._company_title_index.values())
+
+
+def test_same_role_at_same_company_is_still_a_candidate(detector):
+    _, original = detector.add_application("Software Engineer", "Acme Corp",
+                                           job_url="https://acme.example/jobs/1")
+    _, match = detector.check_if_duplicate("Senior Software Engineer", "Acme Corp",
+                                           job_url="https://acme.example/jobs/2")
+
+    assert match is not None and match.job2_id == original.job_id
+
+
+def test_application_store_is_abstract():
+    with pytest.raises(TypeError):
+        ApplicationStore()
+
+
+@pytest.mark.parametrize("store_class, name", [
+    (JSONApplicationStore, "apps.json"),
+    (JSONLApplicationStore, "apps.jsonl"),
+    (SQLiteApplicationStore, "apps.sqlite"),
+])
+def test_store_backends_round_trip(tmp_path, store_class, name):
+    store = store_class(tmp_path / name)
+    store.put_many([make_app("a", url="https://x/1"), make_app("b", url="https://x/2")])
+    store.put(make_app("a", url="https://x/1", title="Staff Engineer"))
+    store.delete("b")
+    store.flush()
+    store.close()
+
+    reopened = store_class(tmp_path / name)
+    assert reopened.count() == 1
+    assert reopened.get("a").job_title == "Staff Engineer"
+    assert [app.job_id for app in reopened.find_by_url("https://x/1")] == ["a"]
+    assert reopened.find_by_url("https://x/2") == []
+    reopened.close()
+
+
+def test_jsonl_store_flush_keeps_the_log_and_compact_rewrites_it(tmp_path):
+    path = tmp_path / "apps.jsonl"
+    store = JSONLApplicationStore(path)
+    for title in ("One", "Two", "Three"):
+        store.put(make_app("a", title=title))
+    store.flush()
+    assert len(path.read_text().splitlines()) == 3
+
+    store.compact()
+    assert [json.loads(line)["app"]["job_title"] for line in path.read_text().splitlines()] == ["Three"]
+    store.close()
+    store.close()
+
+
+def test_default_backend_migrates_legacy_json_once(tmp_path):
+    legacy_path = tmp_path / "job_applications.json"
+    legacy_path.write_text(json.dumps({"a": asdict(make_app("a", url="https://x/1"))}))
+
+    with SmartDuplicateDetector(str(legacy_path)) as detector:
+        assert isinstance(detector._store, SQLiteApplicationStore)
+        assert list(detector.applications) == ["a"]
+        detector.applications["b"] = make_app("b")
+
+    with SmartDuplicateDetector(str(legacy_path)) as detector:
+        assert sorted(detector.applications) == ["a", "b"]
+
+    # The legacy file is read, never rewritten
+    assert json.loads(legacy_path.read_text()).keys() == {"a"}
+
+
+def test_in_place_changes_persist_only_when_assigned_back(tmp_path):
+    with SmartDuplicateDetector(str(tmp_path / "job_applications.json")) as detector:
+        detector.applications["a"] = make_app("a")
+
+        detector.applications["a"].application_status = "interviewed"
+        assert detector.applications["a"].application_status == "applied"
+
+        detector.update_application_status("a", "interviewed")
+        assert detector.applications["a"].application_status == "interviewed"
+
+
+def test_exact_url_duplicate_is_found_through_the_store(detector):
+    detector.applications["legacy-1"] = make_app("legacy-1", url="https://x/jobs/1")
+
+    is_duplicate, match = detector.check_if_duplicate("Different Title", "Other Co",
+                                                      job_url="https://x/jobs/1")
+
+    assert is_duplicate and match.match_type == "exact" and match.job2_id == "legacy-1"
+    assert not detector._blocking_ready
+
+
+@pytest.fixture
+def semantic_detector(tmp_path, monkeypatch, fake_encoder):
+    monkeypatch.setattr(SmartDuplicateDetector, "similarity_model", property(lambda self: fake_encoder))
+    detector = SmartDuplicateDetector(str(tmp_path / "job_applications.json"))
+    embedded = []
+    field_embeddings = detector._field_embeddings
+    detector._field_embeddings = lambda apps: embedded.extend(app.job_id for app in apps) or field_embeddings(apps)
+    detector.embedded = embedded
+    yield detector
+    detector.close()
+
+
+STORED = [
+    make_app("a", title="Security Engineer", company="Acme", description="cloud security and incident response"),
+    make_app("b", title="Data Analyst", company="Globex", description="sql dashboards"),
+    make_app("c", title="Security Consultant", company="Acme", description="penetration testing"),
+]
+
+
+def test_stored_applications_are_embedded_once(semantic_detector):
+    for app in STORED:
+        semantic_detector.applications[app.job_id] = app
+
+    semantic_detector.check_if_duplicate("Cloud Security Engineer", "Acme")
+    semantic_detector.check_if_duplicate("Security Architect", "Acme", job_description="threat modeling")
+
+    stored = [job_id for job_id in semantic_detector.embedded if job_id in {"a", "b", "c"}]
+    assert sorted(stored) == ["a", "b", "c"]
+
+
+def test_added_and_removed_applications_update_the_matrices(semantic_detector):
+    semantic_detector.applications["a"] = STORED[0]
+    semantic_detector.check_if_duplicate("Data Analyst", "Globex")
+
+    _, added = semantic_detector.add_application("Backend Developer", "Initech", job_url="https://initech.example/1")
+
+    assert added.job_id in semantic_detector._embeddings
+    vectors = semantic_detector._field_embeddings([added])[0]
+    similarities = semantic_detector._embeddings.similarities(vectors, [added.job_id])
+    assert all(similarities[field][added.job_id] == pytest.approx(1.0, abs=1e-5) for field in ("title", "company"))
+
+    semantic_detector.update_application_status("a", "rejected")
+    semantic_detector.cleanup_old_applications(days_old=1)
+    assert "a" not in semantic_detector._embeddings
+
+
+def test_matrix_similarities_equal_direct_encoding(semantic_detector):
+    for app in STORED:
+        semantic_detector.applications[app.job_id] = app
+    query = make_app("q", title="Senior Security Engineer", company="Acme Corp", description="incident response")
+    semantic_detector._ensure_blocking_index()
+
+    similarities = semantic_detector._embeddings.similarities(
+        semantic_detector._field_embeddings([query])[0], ["a", "b", "c", "unknown"])
+
+    query_fields = semantic_detector._field_texts(query)
+    for app in STORED:
+        stored_fields = semantic_detector._field_texts(app)
+        for field in ApplicationEmbeddings.FIELDS:
+            direct = semantic_detector._encode_texts([query_fields[field], stored_fields[field]])
+            assert similarities[field][app.job_id] == pytest.approx(float(direct[0] @ direct[1]), abs=1e-5)
+    assert "unknown" not in similarities["title"]
+
+
+def test_replacing_an_application_overwrites_its_row():
+    def vectors(value):
+        return {field: np.full(4, value, dtype=np.float32) for field in ApplicationEmbeddings.FIELDS}
+
+    embeddings = ApplicationEmbeddings()
+    for i in range(70):
+        embeddings.add(f"job-{i}", vectors(0.5))
+
+    embeddings.add("job-3", vectors(0.25))
+    embeddings.remove("job-5")
+    similarities = embeddings.similarities(vectors(1.0), ["job-3", "job-5", "job-69"])
+
+    assert similarities["title"] == {"job-3": pytest.approx(1.0), "job-69": pytest.approx(2.0)}
+    assert embeddings._size == 70 and "job-5" not in embeddings